@@ -0,0 +1,61 @@
+"""Measure the cumulative import time of grimoire's lightweight entry points.
+
+Run with `uv run python benchmarks/bench_import_time.py [--repeat N] [--budget MS] [module ...]`.
+
+Each measurement imports the module in a fresh interpreter under
+`-X importtime` and reads its cumulative time from the report. The median
+of the runs is compared with the budget, and the script exits with status 1
+if any module exceeds it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ("grimoire", "grimoire.text", "grimoire.data", "grimoire.base")
+IMPORT_BUDGET_MS = 50.0
+
+
+def import_time(module: str) -> float:
+    """Import module in a fresh interpreter and return its cumulative import time in ms."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        _, _, fields = line.partition("import time:")
+        parts = [part.strip() for part in fields.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative_us = int(parts[1])
+    return cumulative_us / 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS, help="ms per module")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        import_time(module)  # warm the bytecode cache
+        median_ms = statistics.median(import_time(module) for _ in range(args.repeat))
+        status = "ok" if median_ms < args.budget else "OVER BUDGET"
+        over_budget |= median_ms >= args.budget
+        print(f"{module:<16} {median_ms:8.1f} ms (median of {args.repeat})  {status}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare resident memory of dict-backed and slot-backed schematic instances.
+
+Run with `uv run python benchmarks/bench_schematic_memory.py [--records N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class DictRecord:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="")
+    score: float = fieldnode(default=0.0)
+    active: bool = fieldnode(default=True)
+
+
+@schematic(slots=True)
+class SlotRecord:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="")
+    score: float = fieldnode(default=0.0)
+    active: bool = fieldnode(default=True)
+
+
+def measure(factory: Callable[..., Any], records: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(id=i, name="record", score=1.5) for i in range(records)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    gc.collect()
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    dict_bytes = measure(DictRecord, args.records)
+    slot_bytes = measure(SlotRecord, args.records)
+
+    print(f"records:      {args.records:,}")
+    print(f"dict-backed:  {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / args.records:.0f} B/record)")
+    print(f"slot-backed:  {slot_bytes / 2**20:8.1f} MiB ({slot_bytes / args.records:.0f} B/record)")
+    print(f"reduction:    {1 - slot_bytes / dict_bytes:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
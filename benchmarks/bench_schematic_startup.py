@@ -0,0 +1,89 @@
+"""Measure the import time of a module defining many schematics, with and without the metadata cache.
+
+Run with `uv run python benchmarks/bench_schematic_startup.py [--classes N] [--fields N] [--repeat N]`.
+
+Each measurement imports the generated module in a fresh interpreter. The
+"cached" runs point GRIMOIRE_METADATA_CACHE at a directory populated by one
+priming import.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+FIELD_TYPES = ("int", "str", "float | None", "ReadOnly[str]", "NotRequired[int]", "list[str]")
+
+PROBE = """
+import time
+start = time.perf_counter()
+import startup_models
+print(time.perf_counter() - start)
+"""
+
+
+def generate(path: Path, classes: int, fields: int) -> None:
+    lines = [
+        "from typing import NotRequired, ReadOnly",
+        "",
+        "from grimoire.schematic.schematic import fieldnode, schematic",
+        "",
+    ]
+    for index in range(classes):
+        lines += ["", "@schematic", f"class Model{index}:"]
+        lines.append("    id: int = fieldnode(primary_key=True)")
+        for field in range(fields):
+            annotation = FIELD_TYPES[field % len(FIELD_TYPES)]
+            lines.append(f"    f{field}: {annotation} = fieldnode(default=None)")
+        lines.append("")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def measure(workdir: Path, cache: Path | None, repeat: int) -> list[float]:
+    env = {key: value for key, value in os.environ.items() if key != "GRIMOIRE_METADATA_CACHE"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(workdir), env.get("PYTHONPATH"))))
+    env["PYTHONDONTWRITEBYTECODE"] = "0"
+    if cache is not None:
+        env["GRIMOIRE_METADATA_CACHE"] = str(cache)
+    timings: list[float] = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--classes", type=int, default=600)
+    parser.add_argument("--fields", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        generate(workdir / "startup_models.py", args.classes, args.fields)
+        cache = workdir / "metadata-cache"
+
+        measure(workdir, None, 1)  # compile bytecode once so every run starts equal
+        uncached = measure(workdir, None, args.repeat)
+        priming = measure(workdir, cache, 1)
+        cached = measure(workdir, cache, args.repeat)
+
+    uncached_ms = statistics.median(uncached) * 1000
+    cached_ms = statistics.median(cached) * 1000
+    print(f"classes:       {args.classes:,} x {args.fields + 1} fields")
+    print(f"no cache:      {uncached_ms:8.1f} ms (median of {args.repeat})")
+    print(f"priming run:   {priming[0] * 1000:8.1f} ms")
+    print(f"warm cache:    {cached_ms:8.1f} ms (median of {args.repeat})")
+    print(f"speedup:       {uncached_ms / cached_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""Benchmark suite for grimoire's hot paths, with stored baselines and a regression gate.
+
+Run with `uv run python benchmarks/hotpaths.py [--filter TEXT] [--threshold RATIO]`, or
+through pytest with `uv run pytest benchmarks/test_hotpaths.py --no-cov`.
+
+Every benchmark reports the best per-call time over several timing rounds,
+and that time divided by a fixed pure-Python calibration loop timed the same
+way. Baselines store the relative figure, so they carry over between machines
+of different speed, but not between Python versions: baselines recorded on
+another major.minor release are ignored. Results are written to --output as
+JSON. The run fails when any benchmark's relative time exceeds its baseline
+by more than --threshold, and when any benchmark has no baseline for the
+running release. Record or refresh the stored baselines with
+--update-baseline, on the release named in baselines.json, after an intended
+performance change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, NotRequired, ReadOnly, TypedDict
+
+from grimoire.base import SQL
+from grimoire.concurrency import ensure_async
+from grimoire.data import iter_attributes, iter_fields, typeddict_from, validate_typeddict
+from grimoire.schematic.schematic import fieldnode, schematic
+from grimoire.text import orthogonize
+
+HERE = Path(__file__).resolve().parent
+BASELINE_PATH = HERE / "baselines.json"
+RESULTS_PATH = HERE / "results.json"
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_REPEAT = 7
+TARGET_ROUND_SECONDS = 0.05
+SEED = 1729
+
+
+type Setup = Callable[[], Callable[[], Any]]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Setup
+
+
+class Result(NamedTuple):
+    name: str
+    seconds: float
+    relative: float
+    number: int
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a setup function returning the zero-argument callable to time."""
+
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"duplicate benchmark {name!r}")
+        BENCHMARKS[name] = Benchmark(name, setup)
+        return setup
+
+    return register
+
+
+# -- fixtures ---------------------------------------------------------------
+
+
+def deep_hierarchy(depth: int = 24) -> type:
+    """A single-inheritance chain of depth classes, each adding annotations, a property and a method."""
+    base: type = object
+    for level in range(depth):
+        namespace: dict[str, Any] = {
+            "__annotations__": {f"field{level}": int, f"label{level}": str},
+            f"field{level}": level,
+            f"label{level}": property(lambda self, level=level: f"label-{level}"),
+            f"method{level}": lambda self: None,
+        }
+        base = type(f"Level{level}", (base,), namespace)
+    return base
+
+
+class Customer:
+    id: int
+    name: str
+    email: ReadOnly[str]
+    score: float | None
+    tags: NotRequired[list[str]]
+
+
+class Profile(TypedDict):
+    id: int
+    name: str
+    email: ReadOnly[str]
+    score: float | None
+    tags: NotRequired[list[str]]
+
+
+def register_user(
+    id: int, name: str, email: str, score: float | None = None, tags: list[str] | None = None
+) -> None:
+    pass
+
+
+@schematic
+class Account:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="")
+    email: str = fieldnode(default="")
+    balance: float = fieldnode(default=0.0)
+    active: bool = fieldnode(default=True)
+    tags: list[str] = fieldnode(default_factory=list)
+
+
+@schematic(slots=True)
+class SlotAccount:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="")
+    email: str = fieldnode(default="")
+    balance: float = fieldnode(default=0.0)
+    active: bool = fieldnode(default=True)
+    tags: list[str] = fieldnode(default_factory=list)
+
+
+def schematic_source(lines: int) -> str:
+    rng = random.Random(SEED)
+    types = ("int", "str", "float | None", "list[str]", "dict[str, int]", "ReadOnly[str]")
+    body: list[str] = []
+    for index in range(lines):
+        if index % 25 == 0:
+            body.append(f"    # section {index // 25}")
+        name = f"field_{index}_{'x' * rng.randrange(8)}"
+        value = f" = fieldnode(default={rng.randrange(1000)})" if rng.random() < 0.5 else ""
+        body.append(f"    {name}: {rng.choice(types)}{value}")
+    return "\n".join(body)
+
+
+# -- benchmarks -------------------------------------------------------------
+
+
+@benchmark("iter_fields.deep_mro.class")
+def bench_iter_fields_class() -> Callable[[], Any]:
+    cls = deep_hierarchy()
+    return lambda: list(iter_fields(cls))
+
+
+@benchmark("iter_fields.deep_mro.instance")
+def bench_iter_fields_instance() -> Callable[[], Any]:
+    instance = deep_hierarchy()()
+    instance.__dict__.update(extra=1, other=2)
+    return lambda: list(iter_fields(instance))
+
+
+@benchmark("iter_attributes.deep_mro")
+def bench_iter_attributes() -> Callable[[], Any]:
+    instance = deep_hierarchy()()
+    return lambda: list(iter_attributes(instance))
+
+
+@benchmark("iter_attributes.deep_mro.static")
+def bench_iter_attributes_static() -> Callable[[], Any]:
+    instance = deep_hierarchy()()
+    return lambda: list(iter_attributes(instance, static=True))
+
+
+@benchmark("typeddict_from.class")
+def bench_typeddict_from_class() -> Callable[[], Any]:
+    return lambda: typeddict_from(Customer, type_name="CustomerSpec", module_name=__name__)
+
+
+@benchmark("typeddict_from.function")
+def bench_typeddict_from_function() -> Callable[[], Any]:
+    return lambda: typeddict_from(register_user, type_name="RegisterSpec", module_name=__name__)
+
+
+@benchmark("validate_typeddict")
+def bench_validate_typeddict() -> Callable[[], Any]:
+    data = {"id": 1, "name": "ada", "email": "ada@example.com", "score": 9.5, "tags": []}
+    return lambda: validate_typeddict(Profile, data)  # type: ignore[arg-type]
+
+
+@benchmark("schematic.instantiate.dict")
+def bench_instantiate_dict() -> Callable[[], Any]:
+    return lambda: Account(id=1, name="ada", email="ada@example.com", balance=12.5)
+
+
+@benchmark("schematic.instantiate.slots")
+def bench_instantiate_slots() -> Callable[[], Any]:
+    return lambda: SlotAccount(id=1, name="ada", email="ada@example.com", balance=12.5)
+
+
+def _compose_call(verb: SQL) -> Callable[[], Any]:
+    table = "accounts"
+    if verb.is_set:
+        ids = list(range(64))
+        columns = ("id", "name") if verb is SQL.SELECT_COLUMNS_FROM_WHERE_IN else ()
+        return lambda: list(verb.compose_in(table, ("id",), ids, columns=columns))
+    if verb is SQL.UPDATE_SET_WHERE:
+        changes = {"name": "ada", "balance": 12.5}
+        return lambda: verb.compose_update(table, changes, {"id": 1})
+    if verb.is_insert:
+        row = {"id": 1, "name": "ada", "email": "ada@example.com", "balance": 12.5}
+        return lambda: verb.compose(table, row)
+    return lambda: verb.compose(table, {"id": 1})
+
+
+for _verb in SQL:
+    benchmark(f"sql.compose.{_verb.name.lower()}")(lambda verb=_verb: _compose_call(verb))
+
+
+@benchmark("orthogonize.large")
+def bench_orthogonize() -> Callable[[], Any]:
+    source = schematic_source(5_000)
+    return lambda: orthogonize(source)
+
+
+def _dispatch(job: Any, *args: Any) -> None:
+    awaitable = ensure_async(job, *args)
+    # Only the dispatch is measured: close the coroutine instead of running it.
+    awaitable.close()  # type: ignore[attr-defined]
+
+
+@benchmark("ensure_async.coroutine_function")
+def bench_ensure_async_coroutine_function() -> Callable[[], Any]:
+    async def job(value: int) -> int:
+        return value
+
+    return lambda: _dispatch(job, 1)
+
+
+@benchmark("ensure_async.awaitable")
+def bench_ensure_async_awaitable() -> Callable[[], Any]:
+    async def job() -> int:
+        return 1
+
+    return lambda: _dispatch(job())
+
+
+@benchmark("ensure_async.sync_callable")
+def bench_ensure_async_sync_callable() -> Callable[[], Any]:
+    def job(value: int) -> int:
+        return value
+
+    return lambda: _dispatch(job, 1)
+
+
+# -- runner -----------------------------------------------------------------
+
+
+def calibration_loop() -> int:
+    total = 0
+    for value in range(1_000):
+        total += value * value % 7
+    return total
+
+
+def time_call(func: Callable[[], Any], repeat: int = DEFAULT_REPEAT) -> tuple[float, int]:
+    """Return the best per-call time over repeat rounds, and the calls per round."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < TARGET_ROUND_SECONDS:
+        number = max(number, int(number * TARGET_ROUND_SECONDS / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat, number)) / number, number
+
+
+def calibrate(repeat: int = DEFAULT_REPEAT) -> float:
+    return time_call(calibration_loop, repeat)[0]
+
+
+def select(pattern: str | None = None) -> list[Benchmark]:
+    return [bench for name, bench in BENCHMARKS.items() if pattern is None or pattern in name]
+
+
+def run_benchmark(bench: Benchmark, calibration: float, repeat: int = DEFAULT_REPEAT) -> Result:
+    random.seed(SEED)
+    seconds, number = time_call(bench.setup(), repeat)
+    return Result(bench.name, seconds, seconds / calibration, number)
+
+
+def run(
+    benchmarks: list[Benchmark], repeat: int = DEFAULT_REPEAT
+) -> tuple[float, Iterator[Result]]:
+    calibration = calibrate(repeat)
+    return calibration, (run_benchmark(bench, calibration, repeat) for bench in benchmarks)
+
+
+def load_baselines(path: Path = BASELINE_PATH) -> dict[str, float]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    if data.get("python", "").split(".")[:2] != list(platform.python_version_tuple()[:2]):
+        return {}
+    baselines: dict[str, float] = data["benchmarks"]
+    return baselines
+
+
+def save_baselines(results: list[Result], path: Path = BASELINE_PATH) -> None:
+    baselines = load_baselines(path)
+    baselines.update((result.name, round(result.relative, 4)) for result in results)
+    payload = {
+        "python": platform.python_version(),
+        "benchmarks": dict(sorted(baselines.items())),
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def missing_baseline(names: list[str], path: Path = BASELINE_PATH) -> str:
+    release = ".".join(platform.python_version_tuple()[:2])
+    return (
+        f"no baseline for {', '.join(names)} on Python {release} in {path}; "
+        "record one with `python benchmarks/hotpaths.py --update-baseline`"
+    )
+
+
+def ratio(result: Result, baselines: dict[str, float]) -> float | None:
+    baseline = baselines.get(result.name)
+    return None if baseline is None else result.relative / baseline
+
+
+def write_results(
+    results: list[Result],
+    calibration: float,
+    baselines: dict[str, float],
+    threshold: float,
+    path: Path = RESULTS_PATH,
+) -> None:
+    entries: dict[str, dict[str, Any]] = {}
+    for result in results:
+        result_ratio = ratio(result, baselines)
+        entries[result.name] = {
+            "seconds": result.seconds,
+            "relative": result.relative,
+            "number": result.number,
+            "baseline": baselines.get(result.name),
+            "ratio": result_ratio,
+            "regressed": result_ratio is not None and result_ratio > threshold,
+        }
+    payload = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "calibration_seconds": calibration,
+        "threshold": threshold,
+        "benchmarks": entries,
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline)
+    calibration, results_iter = run(select(args.filter), args.repeat)
+    print(f"calibration: {calibration * 1e6:10.3f} us")
+    results: list[Result] = []
+    regressions: list[str] = []
+    missing: list[str] = []
+    for result in results_iter:
+        results.append(result)
+        result_ratio = ratio(result, baselines)
+        if result_ratio is None:
+            status = "NO BASELINE"
+            missing.append(result.name)
+        elif result_ratio > args.threshold:
+            status = f"REGRESSED x{result_ratio:.2f}"
+            regressions.append(result.name)
+        else:
+            status = f"x{result_ratio:.2f}"
+        print(f"{result.name:42} {result.seconds * 1e6:12.3f} us  {result.relative:10.3f}  {status}")
+
+    write_results(results, calibration, baselines, args.threshold, args.output)
+    if args.update_baseline:
+        save_baselines(results, args.baseline)
+        print(f"baselines updated: {args.baseline}")
+        return
+    if regressions:
+        print(f"FAIL: {len(regressions)} regressed past x{args.threshold}", file=sys.stderr)
+    if missing:
+        print(f"FAIL: {missing_baseline(missing, args.baseline)}", file=sys.stderr)
+    if regressions or missing:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
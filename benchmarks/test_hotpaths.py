@@ -0,0 +1,43 @@
+"""pytest entry point for the hot-path benchmarks in hotpaths.py.
+
+Run with `uv run pytest benchmarks/test_hotpaths.py --no-cov`. The threshold
+defaults to hotpaths.DEFAULT_THRESHOLD and can be overridden with the
+GRIMOIRE_BENCH_THRESHOLD environment variable; results are written to
+benchmarks/results.json when the module finishes. A benchmark without a
+stored baseline for the running Python release fails.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+import hotpaths
+
+THRESHOLD = float(os.environ.get("GRIMOIRE_BENCH_THRESHOLD", hotpaths.DEFAULT_THRESHOLD))
+
+
+class Session:
+    def __init__(self) -> None:
+        self.calibration: float = hotpaths.calibrate()
+        self.baselines: dict[str, float] = hotpaths.load_baselines()
+        self.results: list[hotpaths.Result] = []
+
+
+@pytest.fixture(scope="module")
+def session() -> Iterator[Session]:
+    state = Session()
+    yield state
+    hotpaths.write_results(state.results, state.calibration, state.baselines, THRESHOLD)
+
+
+@pytest.mark.parametrize("name", list(hotpaths.BENCHMARKS))
+def test_benchmark(session: Session, name: str) -> None:
+    result = hotpaths.run_benchmark(hotpaths.BENCHMARKS[name], session.calibration)
+    session.results.append(result)
+    ratio = hotpaths.ratio(result, session.baselines)
+    if ratio is None:
+        pytest.fail(hotpaths.missing_baseline([name]))
+    assert ratio <= THRESHOLD, f"{name} regressed x{ratio:.2f} against its baseline"
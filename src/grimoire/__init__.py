@@ -1,9 +1,39 @@
-from . import schema
-from .fieldnode import FieldNode
-from .typenode import TypeNode
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .schematic.schematic import FieldNode, TypeNode
 
 __all__ = [
     "FieldNode",
     "TypeNode",
-    "schema",
 ]
+
+# Exports and submodules are imported on first attribute access, so tools that
+# need a single helper do not pay for the whole package at import time.
+_LAZY_EXPORTS: dict[str, tuple[str, str | None]] = {
+    "FieldNode": (".schematic.schematic", "FieldNode"),
+    "TypeNode": (".schematic.schematic", "TypeNode"),
+}
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {"base", "concurrency", "data", "db", "identity", "repository", "schematic", "text", "writer"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        if name not in _LAZY_SUBMODULES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        module_name, attr = f".{name}", None
+    module = import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS, *_LAZY_SUBMODULES})
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from enum import StrEnum
+from functools import lru_cache
+from itertools import batched
+from operator import attrgetter, itemgetter
 from typing import Any, Final
 
 IDENT_ESCAPES: Final[dict[int, str]] = str.maketrans({'"': '""', "\x00": ""})
+STATEMENT_CACHE_SIZE: Final[int] = 1024
+SQLITE_MAX_VARIABLES: Final[int] = 32766
 
 
 class SQL(StrEnum):
@@ -13,19 +18,164 @@ class SQL(StrEnum):
     IGNORE_INTO = "INSERT OR IGNORE INTO {table} {keys} VALUES {placeholders}"
     DELETE_FROM_WHERE = "DELETE FROM {table} WHERE {keys} = {placeholders}"
     SELECT_FROM_WHERE = "SELECT * FROM {table} WHERE {keys} = {placeholders}"
+    DELETE_FROM_WHERE_IN = "DELETE FROM {table} WHERE {keys} IN ({placeholders})"
+    SELECT_FROM_WHERE_IN = "SELECT * FROM {table} WHERE {keys} IN ({placeholders})"
+    SELECT_COLUMNS_FROM_WHERE_IN = (
+        "SELECT {columns} FROM {table} WHERE {keys} IN ({placeholders})"
+    )
+    UPDATE_SET_WHERE = "UPDATE {table} SET {columns} WHERE {keys} = {placeholders}"
 
     @staticmethod
     def ident_escape(name: str) -> str:
         return '"' + name.translate(IDENT_ESCAPES) + '"'
 
+    @property
+    def is_insert(self) -> bool:
+        return self in (SQL.INSERT_INTO, SQL.REPLACE_INTO, SQL.IGNORE_INTO)
+
+    @property
+    def is_set(self) -> bool:
+        return self in (
+            SQL.DELETE_FROM_WHERE_IN,
+            SQL.SELECT_FROM_WHERE_IN,
+            SQL.SELECT_COLUMNS_FROM_WHERE_IN,
+        )
+
+    def prepare(
+        self, table: str, keys: Iterable[str], rows: int = 1, columns: Iterable[str] = ()
+    ) -> Statement:
+        """Return the cached `Statement` for this verb, table and ordered key set.
+
+        rows is the number of key tuples matched by the set verbs (`*_IN`) and
+        columns the selected columns of `SELECT_COLUMNS_FROM_WHERE_IN` or the
+        assigned columns of `UPDATE_SET_WHERE`.
+        """
+        return _prepare(self, table, tuple(keys), rows, tuple(columns))
+
     def compose(self, table: str, key_values: Mapping[str, Any]) -> tuple[str, tuple[Any, ...]]:
-        table: str = self.ident_escape(table)
-        args: tuple[tuple[str, Any], ...] = tuple(key_values.items())
-        keys: str = (
-            f"({', '.join(self.ident_escape(arg[0]) for arg in args)})"
-            if len(args) > 1
-            else self.ident_escape(args[0])
+        return (self.prepare(table, key_values.keys()).sql, tuple(key_values.values()))
+
+    def compose_update(
+        self, table: str, changes: Mapping[str, Any], key_values: Mapping[str, Any]
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Return (sql, params) assigning only the columns in changes on the rows matching key_values."""
+        if self is not SQL.UPDATE_SET_WHERE:
+            raise ValueError(f"{self.name} is not an update verb")
+        if not changes:
+            raise ValueError("UPDATE_SET_WHERE requires at least one changed column")
+        statement = self.prepare(table, key_values.keys(), columns=changes.keys())
+        return (statement.sql, (*changes.values(), *key_values.values()))
+
+    def compose_in(
+        self,
+        table: str,
+        keys: Iterable[str],
+        key_values: Iterable[Any],
+        *,
+        columns: Iterable[str] = (),
+        max_params: int = SQLITE_MAX_VARIABLES,
+    ) -> Iterator[tuple[str, tuple[Any, ...]]]:
+        """Yield (sql, params) pairs matching every row of key_values, chunked under max_params.
+
+        With a single key, key_values holds plain values and the statement uses
+        `key IN (?, ...)`; with several keys it holds tuples (or mappings) and
+        uses `(a, b) IN (VALUES (?, ?), ...)`. Pass the connection's own limit
+        (`grimoire.db.variable_limit`) as max_params when one is at hand.
+
+        A short last chunk is padded up to a power of two by repeating its last
+        row, which leaves the matched set unchanged and keeps the number of
+        distinct cached statements per key set logarithmic.
+        """
+        if not self.is_set:
+            raise ValueError(f"{self.name} is not a set verb")
+        keys, columns = tuple(keys), tuple(columns)
+        width = len(keys)
+        limit = max(1, max_params // max(width, 1))
+        for chunk in batched(key_values, limit):
+            params: list[Any] = []
+            for row in chunk:
+                if isinstance(row, Mapping):
+                    params.extend(row[key] for key in keys)
+                elif width == 1:
+                    params.append(row)
+                elif len(row) != width:
+                    raise ValueError(f"Expected {width} key values per row, got {len(row)}")
+                else:
+                    params.extend(row)
+            rows = len(chunk)
+            if rows < limit:
+                rows = min(1 << (rows - 1).bit_length(), limit)
+                params.extend(params[-width:] * (rows - len(chunk)))
+            yield (self.prepare(table, keys, rows, columns).sql, tuple(params))
+
+
+class Statement:
+    """A composed SQL statement with its key order, reusable for many value rows."""
+
+    __slots__ = ("_attrs", "_items", "keys", "rows", "sql", "verb")
+
+    def __init__(
+        self,
+        verb: SQL,
+        table: str,
+        keys: tuple[str, ...],
+        rows: int = 1,
+        selected: tuple[str, ...] = (),
+    ) -> None:
+        if not keys:
+            raise ValueError(f"{verb.name} requires at least one key")
+        if verb is SQL.UPDATE_SET_WHERE and not selected:
+            raise ValueError(f"{verb.name} requires at least one column")
+        if verb.is_set:
+            if len(keys) == 1:
+                columns, placeholders = SQL.ident_escape(keys[0]), ", ".join("?" * rows)
+            else:
+                columns = f"({', '.join(SQL.ident_escape(key) for key in keys)})"
+                row = f"({', '.join('?' for _ in keys)})"
+                placeholders = "VALUES " + ", ".join([row] * rows)
+        elif len(keys) > 1 or verb.is_insert:
+            columns = f"({', '.join(SQL.ident_escape(key) for key in keys)})"
+            placeholders = f"({', '.join('?' for _ in keys)})"
+        else:
+            columns, placeholders = SQL.ident_escape(keys[0]), "?"
+
+        if verb is SQL.UPDATE_SET_WHERE:
+            selection = ", ".join(f"{SQL.ident_escape(c)} = ?" for c in selected)
+        else:
+            selection = ", ".join(SQL.ident_escape(c) for c in selected) if selected else "*"
+
+        self.verb: SQL = verb
+        self.rows: int = rows
+        self.keys: tuple[str, ...] = keys
+        self.sql: str = verb.format(
+            table=SQL.ident_escape(table),
+            keys=columns,
+            placeholders=placeholders,
+            columns=selection,
         )
-        placeholders: str = f"({', '.join('?' for _ in args)})" if len(args) > 1 else "?"
-        values: tuple[Any, ...] = tuple(arg[1] for arg in args)
-        return (self.format(table=table, keys=keys, placeholders=placeholders), values)
+        self._items: itemgetter[Any] = itemgetter(*keys)
+        self._attrs: attrgetter[Any] = attrgetter(*keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.sql!r})"
+
+    def bind(self, key_values: Mapping[str, Any]) -> tuple[Any, ...]:
+        """Return the parameter tuple for key_values in this statement's key order."""
+        values = self._items(key_values)
+        return values if len(self.keys) > 1 else (values,)
+
+    def bind_object(self, obj: Any) -> tuple[Any, ...]:
+        """Return the parameter tuple read from obj's attributes in this statement's key order."""
+        values = self._attrs(obj)
+        return values if len(self.keys) > 1 else (values,)
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _prepare(
+    verb: SQL, table: str, keys: tuple[str, ...], rows: int, selected: tuple[str, ...]
+) -> Statement:
+    return Statement(verb, table, keys, rows, selected)
+
+
+statement_cache_info = _prepare.cache_info
+statement_cache_clear = _prepare.cache_clear
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
+import os
 from collections.abc import (
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
 )
 from dataclasses import (
     MISSING as MISSING,
 )
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Final,
 )
 
+if TYPE_CHECKING:
+    from .schematic.schematic import _SchematicMeta
+
 type Job[T] = (
     Callable[..., T]
     | Callable[[], Coroutine[Any, Any, T]]
@@ -31,3 +47,276 @@ def ensure_async[T](job: Job[T], *args: Any, **kwargs: Any) -> Awaitable[T]:
     if callable(job):
         return asyncio.to_thread(job, *args, **kwargs)  # type: ignore[arg-type]
     raise TypeError(f"Cannot coerce {type(job).__name__} into an awaitable")
+
+
+DEFAULT_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) + 4)
+
+
+class JobExecutor:
+    """Run `Job` values with bounded concurrency on dedicated worker pools.
+
+    Sync callables run on a private thread pool (or, with cpu_bound=True, a
+    process pool) instead of the loop's default executor, and at most
+    max_concurrency jobs are in flight at once; further jobs wait their turn.
+    Cancelling a caller, closing a streaming iterator, or shutting the
+    executor down cancels the jobs it still has queued.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_concurrency: int | None = None,
+        process_workers: int | None = None,
+        thread_name_prefix: str = "grimoire",
+    ) -> None:
+        self.max_workers: int = max_workers
+        self.max_concurrency: int = max_concurrency if max_concurrency is not None else max_workers
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {self.max_concurrency}")
+        self.process_workers: int | None = process_workers
+        self._threads: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._processes: ProcessPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._closed: bool = False
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.process_workers)
+        return self._processes
+
+    def _dispatch[T](
+        self, job: Job[T], args: tuple[Any, ...], kwargs: dict[str, Any], cpu_bound: bool
+    ) -> Awaitable[T]:
+        if inspect.iscoroutinefunction(job) or inspect.isawaitable(job):
+            return ensure_async(job, *args, **kwargs)
+        if callable(job):
+            pool: Executor = self.process_pool if cpu_bound else self._threads
+            return asyncio.get_running_loop().run_in_executor(
+                pool, functools.partial(job, *args, **kwargs)
+            )
+        raise TypeError(f"Cannot coerce {type(job).__name__} into an awaitable")
+
+    async def run[T](self, job: Job[T], *args: Any, cpu_bound: bool = False, **kwargs: Any) -> T:
+        """Run one job once a concurrency slot is free and return its result."""
+        if self._closed:
+            raise RuntimeError("executor is shut down")
+        async with self.semaphore:
+            return await self._dispatch(job, args, kwargs, cpu_bound)
+
+    def submit[T](
+        self, job: Job[T], *args: Any, cpu_bound: bool = False, **kwargs: Any
+    ) -> asyncio.Task[T]:
+        """Schedule a job as a task tracked by this executor."""
+        task = asyncio.ensure_future(self.run(job, *args, cpu_bound=cpu_bound, **kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _stream[T](
+        self, calls: Iterable[tuple[Job[T], tuple[Any, ...]]], cpu_bound: bool
+    ) -> AsyncIterator[T]:
+        calls = iter(calls)
+        window = self.max_concurrency * 2
+        pending: set[asyncio.Task[T]] = set()
+
+        def fill() -> None:
+            while len(pending) < window:
+                call = next(calls, MISSING)
+                if call is MISSING:
+                    return
+                job, args = call  # type: ignore[misc]
+                pending.add(self.submit(job, *args, cpu_bound=cpu_bound))
+
+        try:
+            fill()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def as_completed[T](
+        self, jobs: Iterable[Job[T]], *, cpu_bound: bool = False
+    ) -> AsyncIterator[T]:
+        """Yield job results in completion order, pulling jobs lazily from jobs."""
+        return self._stream(((job, ()) for job in jobs), cpu_bound)
+
+    def map[T](
+        self, func: Callable[..., T], *iterables: Iterable[Any], cpu_bound: bool = False
+    ) -> AsyncIterator[T]:
+        """Yield func(*args) for each argument tuple from iterables, in completion order."""
+        return self._stream(((func, args) for args in zip(*iterables)), cpu_bound)
+
+    async def gather[T](self, *jobs: Job[T], cpu_bound: bool = False) -> list[T]:
+        """Run jobs and return their results in argument order, cancelling the rest on failure."""
+        tasks = [self.submit(job, cpu_bound=cpu_bound) for job in jobs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def map_shared[T](
+        self,
+        job: Callable[..., T],
+        schematic: _SchematicMeta,
+        records: Iterable[Any],
+        *args: Any,
+        partitions: int | None = None,
+        allow_pickle: bool = False,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Run a CPU-bound job over records on the process pool without pickling the records.
+
+        records are published once into shared memory as a `SharedBatch` and
+        split into partitions slices (one per process worker by default). Each
+        worker receives only a `SharedBatchHandle` and calls
+        job(shared_records, *args, **kwargs) on its attached slice. Results
+        are returned in partition order; the segment is unlinked afterwards.
+        allow_pickle is passed on to `SharedBatch` for field values the binary
+        codec cannot pack.
+        """
+        from .schematic.shared import (
+            SharedBatch,
+            run_attached,
+        )
+
+        with SharedBatch(schematic, records, allow_pickle=allow_pickle) as batch:
+            if not len(batch):
+                return []
+            parts = partitions or self.process_workers or os.cpu_count() or 1
+            return await self.gather(
+                *(
+                    functools.partial(run_attached, job, handle, *args, **kwargs)
+                    for handle in batch.handle.partition(parts)
+                ),
+                cpu_bound=True,
+            )
+
+    async def shutdown(self, *, cancel_pending: bool = True) -> None:
+        self._closed = True
+        if cancel_pending:
+            for task in list(self._tasks):
+                task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._threads.shutdown(wait=False, cancel_futures=cancel_pending)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=cancel_pending)
+
+    async def __aenter__(self) -> JobExecutor:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.shutdown(cancel_pending=exc_info[0] is not None)
+
+
+class Coalescer[K, V]:
+    """Collect concurrent single-key loads into batched calls, dataloader style.
+
+    `load(key)` queues the key and waits. Queued keys are flushed as one call
+    to batch_job when max_batch_size distinct keys are waiting or window
+    seconds have passed since the first one, whichever comes first. batch_job
+    receives the list of keys and returns either a sequence of values in the
+    same order or a mapping from key to value; it may be any `Job`, normalised
+    through `ensure_async` (or run on executor when given). Duplicate keys in
+    one window share a single slot in the batch.
+    """
+
+    def __init__(
+        self,
+        batch_job: Job[Sequence[V] | Mapping[K, V]],
+        *,
+        max_batch_size: int = 100,
+        window: float = 0.002,
+        executor: JobExecutor | None = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        self.batch_job: Job[Sequence[V] | Mapping[K, V]] = batch_job
+        self.max_batch_size: int = max_batch_size
+        self.window: float = window
+        self.executor: JobExecutor | None = executor
+        self._pending: dict[K, list[asyncio.Future[V]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[V] = loop.create_future()
+        try:
+            self._pending[key].append(future)
+        except KeyError:
+            self._pending[key] = [future]
+            if len(self._pending) >= self.max_batch_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def flush(self) -> None:
+        """Dispatch every queued key now instead of waiting for the window to close."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = {
+            key: futures
+            for key, futures in self._pending.items()
+            if not all(future.done() for future in futures)
+        }
+        self._pending = {}
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: dict[K, list[asyncio.Future[V]]]) -> None:
+        keys = list(batch)
+        try:
+            if self.executor is not None:
+                results = await self.executor.run(self.batch_job, keys)
+            else:
+                results = await ensure_async(self.batch_job, keys)
+            if isinstance(results, Mapping):
+                values: dict[K, V] = dict(results)
+            else:
+                results = list(results)
+                if len(results) != len(keys):
+                    raise ValueError(
+                        f"batch_job returned {len(results)} values for {len(keys)} keys"
+                    )
+                values = dict(zip(keys, results, strict=True))
+        except BaseException as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for key, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if key in values:
+                    future.set_result(values[key])
+                else:
+                    future.set_exception(KeyError(key))
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from annotationlib import (
     Format,
+    get_annotations,
 )
 from collections.abc import (
     Callable,
     Iterable,
     Iterator,
+    Mapping,
 )
 from dataclasses import (
     MISSING as MISSING,
@@ -31,17 +33,21 @@ from sys import (
 from types import (
     FunctionType,
     LambdaType,
+    MappingProxyType,
     MethodType,
 )
 from typing import (  # type: ignore[attr-defined]
     Any,
+    NamedTuple,
     TypedDict,
     _TypedDictMeta,
     cast,
     get_type_hints,
 )
-
-from .typenode import TypeNode
+from weakref import (
+    WeakKeyDictionary,
+    ref,
+)
 
 
 class MissingTypeAnnotationError(BaseException):
@@ -83,50 +89,159 @@ def caller_module_name(*, depth: int = 1, default: str = "__main__") -> str:
     return default
 
 
+def _is_public(name: str) -> bool:
+    return not name.startswith("_")
+
+
+def _is_valid_descriptor(value: Any) -> bool:
+    if isinstance(value, property):
+        return not getattr(value, "__isabstractmethod__", False)
+    has_get = callable(getattr(value, "__get__", None))
+    has_set_del = callable(getattr(value, "__set__", None)) or callable(
+        getattr(value, "__delete__", None)
+    )
+    return has_get and has_set_del
+
+
+class IntrospectionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ClassIntrospection:
+    """Resolved field order, descriptor classification and type hints for one class.
+
+    Built once per class by `introspect` and reused until the class is
+    collected or explicitly invalidated.
+    """
+
+    __slots__ = ("_hints", "_hints_error", "_owner", "descriptors", "fields", "type_fields")
+
+    def __init__(self, cls: type) -> None:
+        seen: set[str] = set()
+        fields: list[str] = []
+        descriptors: set[str] = set()
+
+        def _add(*names: str) -> None:
+            for name in names:
+                if _is_public(name) and name not in seen:
+                    seen.add(name)
+                    fields.append(name)
+
+        for klass in cls.__mro__:
+            cls_vars = dict(vars(klass))
+            valid = [n for n, v in cls_vars.items() if _is_valid_descriptor(v)]
+            descriptors.update(n for n in valid if _is_public(n))
+            _add(*valid)
+            _add(*getattr(klass, "__annotations__", {}))
+            slots = getattr(klass, "__slots__", ())
+            _add(*((slots,) if isinstance(slots, str) else slots))
+            _add(*cls_vars)
+
+        own = [n for n in vars(cls) if _is_public(n)]
+        own_set = set(own)
+
+        self.fields: tuple[str, ...] = tuple(fields)
+        self.type_fields: tuple[str, ...] = tuple(own) + tuple(
+            f for f in fields if f not in own_set
+        )
+        self.descriptors: frozenset[str] = frozenset(descriptors)
+        self._owner: ref[type] = ref(cls)
+        self._hints: MappingProxyType[str, Any] | None = None
+        self._hints_error: TypeError | None = None
+
+    @property
+    def hints(self) -> MappingProxyType[str, Any]:
+        """Resolved `get_type_hints(cls, include_extras=True)`, computed on first access."""
+        if self._hints is None and self._hints_error is None:
+            owner = self._owner()
+            if owner is None:
+                return MappingProxyType({})
+            try:
+                self._hints = MappingProxyType(get_type_hints(owner, include_extras=True))
+            except TypeError as e:
+                self._hints_error = e
+        if self._hints_error is not None:
+            raise self._hints_error
+        assert self._hints is not None
+        return self._hints
+
+
+_introspection_cache: WeakKeyDictionary[type, ClassIntrospection] = WeakKeyDictionary()
+_introspection_hits: int = 0
+_introspection_misses: int = 0
+
+
+def introspect(cls: type) -> ClassIntrospection:
+    """Return the cached `ClassIntrospection` for cls, building it on first use."""
+    global _introspection_hits, _introspection_misses
+    try:
+        record = _introspection_cache[cls]
+    except KeyError:
+        _introspection_misses += 1
+        record = _introspection_cache[cls] = ClassIntrospection(cls)
+    except TypeError:
+        _introspection_misses += 1
+        return ClassIntrospection(cls)
+    else:
+        _introspection_hits += 1
+    return record
+
+
+def invalidate_introspection(*classes: type) -> None:
+    """Drop cached introspection for classes and their subclasses, or for all if none given.
+
+    Call after mutating a class (adding attributes, annotations, descriptors)
+    once it has already been introspected.
+    """
+    if not classes:
+        _introspection_cache.clear()
+        return
+    for cached in list(_introspection_cache.keys()):
+        if any(cls in cached.__mro__ for cls in classes):
+            _introspection_cache.pop(cached, None)
+
+
+def introspection_cache_info() -> IntrospectionCacheInfo:
+    return IntrospectionCacheInfo(
+        _introspection_hits, _introspection_misses, len(_introspection_cache)
+    )
+
+
+def reset_introspection_cache_info() -> None:
+    global _introspection_hits, _introspection_misses
+    _introspection_hits = _introspection_misses = 0
+
+
 def iter_fields[T](obj: T) -> Iterator[str]:
     """Yield unique public field names discoverable from an object and its MRO.
 
     Names are collected from the instance dict first, then each class in the
     MRO via descriptors, annotations, slots, and remaining class dict keys,
-    with duplicates removed.
+    with duplicates removed. The class-level part is cached per class by
+    `introspect`.
 
     Respects encapsulation and avoids private namespaces.
     """
-    seen: set[str] = set()
-    objtype: type[T] = obj if inspect_isclass(obj) else type(obj)
-
-    def _is_public(name: str) -> bool:
-        return not name.startswith("_")
-
-    def _yield_new_public(*names: str) -> Iterator[str]:
-        for name in names:
-            if _is_public(name) and name not in seen:
-                seen.add(name)
-                yield name
-
-    def _is_valid_descriptor(value: Any) -> bool:
-        if isinstance(value, property):
-            return not getattr(value, "__isabstractmethod__", False)
-        has_get = callable(getattr(value, "__get__", None))
-        has_set_del = callable(getattr(value, "__set__", None)) or callable(
-            getattr(value, "__delete__", None)
-        )
-        return has_get and has_set_del
-
-    def _from_dict(o: Any) -> Iterator[str]:
-        yield from _yield_new_public(*getattr(o, "__dict__", {}).keys())
+    if inspect_isclass(obj):
+        yield from introspect(obj).type_fields
+        return
 
-    def _from_class(cls: type) -> Iterator[str]:
-        cls_vars = dict(vars(cls))
-        yield from _yield_new_public(*(n for n, v in cls_vars.items() if _is_valid_descriptor(v)))
-        yield from _yield_new_public(*getattr(cls, "__annotations__", {}))
-        slots = getattr(cls, "__slots__", ())
-        yield from _yield_new_public(*((slots,) if isinstance(slots, str) else slots))
-        yield from _yield_new_public(*cls_vars)
+    fields = introspect(type(obj)).fields
+    instance_dict: dict[str, Any] = getattr(obj, "__dict__", {})
+    if not instance_dict:
+        yield from fields
+        return
 
-    yield from _from_dict(obj)
-    for cls in objtype.__mro__:
-        yield from _from_class(cls)
+    seen: set[str] = set()
+    for name in instance_dict:
+        if _is_public(name) and name not in seen:
+            seen.add(name)
+            yield name
+    for name in fields:
+        if name not in seen:
+            yield name
 
 
 def iter_attributes(
@@ -145,9 +260,9 @@ def iter_attributes(
 
 def iter_type_annotations[T](obj: T | type[T], *, strict: bool = True) -> Iterator[tuple[str, Any]]:
     target: type[T] = obj if inspect_isclass(obj) else type(obj)  # type: ignore[assignment]
-    hints: dict[str, Any] = {}
+    hints: Mapping[str, Any] = {}
     try:
-        hints = get_type_hints(target, include_extras=True)
+        hints = introspect(target).hints
     except TypeError as e:
         if "does not have annotations" in str(e) and strict is True:
             raise MissingTypeAnnotationError(get_type_name(obj), *iter_fields(obj)) from None
@@ -185,22 +300,22 @@ def construct_typeddict(
     optional_keys: Iterable[str] = (),
     readonly_keys: Iterable[str] = (),
 ) -> type[dict[str, Any]]:
-    return cast(
-        type[dict[str, Any]],
-        _TypedDictMeta(
-            name,
-            (),
-            {
-                "__annotations__": annotations,
-                "__module__": module,
-                "__orig_bases__": (TypedDict,),
-                "__total__": total,
-                "__required_keys__": frozenset(required_keys),
-                "__optional_keys__": frozenset(optional_keys),
-                "__readonly_keys__": frozenset(readonly_keys),
-            },
-        ),
+    # _TypedDictMeta derives the key sets from the annotations, so the
+    # explicitly requested ones are applied after construction.
+    spec = _TypedDictMeta(
+        name,
+        (),
+        {
+            "__annotations__": annotations,
+            "__module__": module,
+            "__orig_bases__": (TypedDict,),
+        },
+        total=total,
     )
+    spec.__required_keys__ = frozenset(required_keys)
+    spec.__optional_keys__ = frozenset(optional_keys)
+    spec.__readonly_keys__ = frozenset(readonly_keys)
+    return cast(type[dict[str, Any]], spec)
 
 
 def typeddict_from(
@@ -221,6 +336,9 @@ def typeddict_from(
     module = (
         module_name if module_name is not None else caller_module_name(default=get_module_name(obj))
     )
+    # Imported here so that `import grimoire.data` stays free of the schematic machinery.
+    from .schematic.schematic import TypeNode
+
     typenodes = {name: TypeNode(anno) for name, anno in annotations.items()}
 
     required: set[str] = set()
@@ -239,7 +357,7 @@ def typeddict_from(
 
 
 def validate_typeddict(td: type[dict[str, Any]], data: dict[str, Any]) -> None:
-    hints = get_type_hints(td, include_extras=True)
+    hints = introspect(td).hints
     required = td.__required_keys__
 
     extra = data.keys() - hints.keys()
@@ -249,3 +367,52 @@ def validate_typeddict(td: type[dict[str, Any]], data: dict[str, Any]) -> None:
     missing = required - data.keys()
     if missing:
         raise TypeError(f"Missing required keys: {missing}")
+
+
+class RowKeyError(NamedTuple):
+    index: int
+    missing: frozenset[str]
+    unexpected: frozenset[str]
+
+
+class BatchValidationReport(NamedTuple):
+    total: int
+    errors: tuple[RowKeyError, ...]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_indices(self) -> frozenset[int]:
+        return frozenset(error.index for error in self.errors)
+
+
+def validate_typeddict_batch(
+    td: type[dict[str, Any]], rows: Iterable[Mapping[str, Any]]
+) -> BatchValidationReport:
+    """Check the key sets of many rows against td and report every failing row.
+
+    Rows are grouped by key shape so each distinct shape is checked once.
+    Only key names are compared, so annotations are read in FORWARDREF
+    format and forward references need not be resolvable.
+    """
+    allowed = frozenset(get_annotations(td, format=Format.FORWARDREF))
+    required: frozenset[str] = td.__required_keys__
+    verdicts: dict[tuple[str, ...], tuple[frozenset[str], frozenset[str]] | None] = {}
+    errors: list[RowKeyError] = []
+    total = 0
+
+    for index, row in enumerate(rows):
+        total += 1
+        shape = tuple(row)
+        try:
+            verdict = verdicts[shape]
+        except KeyError:
+            keys = frozenset(shape)
+            missing, unexpected = required - keys, keys - allowed
+            verdict = verdicts[shape] = (missing, unexpected) if missing or unexpected else None
+        if verdict is not None:
+            errors.append(RowKeyError(index, *verdict))
+
+    return BatchValidationReport(total, tuple(errors))
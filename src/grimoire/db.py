@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from itertools import batched
+from os import PathLike
+from time import monotonic
+from typing import Any, Final
+
+from .base import SQL
+
+DEFAULT_CHUNK_SIZE: Final[int] = 1000
+DEFAULT_POOL_SIZE: Final[int] = 8
+DEFAULT_PRAGMAS: Final[dict[str, str | int]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+}
+
+
+class PoolClosedError(RuntimeError):
+    pass
+
+
+def connect(
+    database: str | PathLike[str],
+    *,
+    pragmas: Mapping[str, str | int] = DEFAULT_PRAGMAS,
+    **connect_kwargs: Any,
+) -> sqlite3.Connection:
+    """Open a sqlite3 connection and apply pragmas to it."""
+    conn = sqlite3.connect(database, **connect_kwargs)
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+class ConnectionPool:
+    """Bounded pool of reusable sqlite3 connections to one database.
+
+    Connections are opened lazily up to size, configured once with pragmas
+    (WAL journaling by default) and handed back to the thread that last used
+    them when possible. Nested `connection()` blocks in one thread share a
+    connection. Note that every connection to ":memory:" is a separate
+    database; use a file or a shared-cache URI instead.
+    """
+
+    def __init__(
+        self,
+        database: str | PathLike[str],
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        pragmas: Mapping[str, str | int] = DEFAULT_PRAGMAS,
+        timeout: float | None = None,
+        **connect_kwargs: Any,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be positive, got {size}")
+        self.database: str | PathLike[str] = database
+        self.size: int = size
+        self.pragmas: dict[str, str | int] = dict(pragmas)
+        self.timeout: float | None = timeout
+        self._connect_kwargs: dict[str, Any] = {"check_same_thread": False, **connect_kwargs}
+        self._idle: list[sqlite3.Connection] = []
+        self._opened: int = 0
+        self._closed: bool = False
+        self._available = threading.Condition()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect(self.database, pragmas=self.pragmas, **self._connect_kwargs)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, preferring the one this thread used last.
+
+        Blocks while all size connections are in use, raising TimeoutError
+        after timeout seconds if one is configured.
+        """
+        preferred: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        deadline = None if self.timeout is None else monotonic() + self.timeout
+        conn: sqlite3.Connection | None = None
+        with self._available:
+            while True:
+                if self._closed:
+                    raise PoolClosedError("connection pool is closed")
+                if self._idle:
+                    if preferred is not None and preferred in self._idle:
+                        self._idle.remove(preferred)
+                        return preferred
+                    conn = self._idle.pop()
+                    break
+                if self._opened < self.size:
+                    self._opened += 1
+                    break
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"no connection available within {self.timeout}s")
+                self._available.wait(remaining)
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except BaseException:
+                with self._available:
+                    self._opened -= 1
+                    self._available.notify()
+                raise
+        self._local.conn = conn
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._available:
+            if self._closed:
+                self._opened -= 1
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._available.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        held: sqlite3.Connection | None = getattr(self._local, "held", None)
+        if held is not None:
+            yield held
+            return
+        conn = self.acquire()
+        self._local.held = conn
+        try:
+            yield conn
+        finally:
+            self._local.held = None
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections now and checked-out ones as they are released."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._available.notify_all()
+        for conn in idle:
+            conn.execute("PRAGMA optimize")
+            conn.close()
+
+    def __enter__(self) -> ConnectionPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def variable_limit(conn: sqlite3.Connection) -> int:
+    """Return the most `?` parameters one statement may bind on conn."""
+    return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the block in its own BEGIN/COMMIT, rolling back on error.
+
+    If conn is already inside a transaction the block simply joins it.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        # A failed COMMIT (e.g. a deferred constraint) leaves the transaction open.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def record_items(record: Any) -> Mapping[str, Any]:
+    """Return the field/value mapping of a record: a mapping or a schematic instance.
+
+    For schematic instances only fields from `__field_nodes__` that are set are
+    included; other objects contribute their instance `__dict__`.
+    """
+    if isinstance(record, Mapping):
+        return record
+    field_nodes = getattr(type(record), "__field_nodes__", None)
+    if field_nodes is None:
+        return vars(record)
+    items: dict[str, Any] = {}
+    for name in field_nodes:
+        try:
+            value = object.__getattribute__(record, name)
+        except AttributeError:
+            continue
+        if value is not field_nodes[name]:
+            items[name] = value
+    return items
+
+
+def group_by_shape(
+    records: Iterable[Any],
+) -> dict[tuple[str, ...], list[tuple[Any, ...]]]:
+    """Group records by their ordered key set into lists of value tuples."""
+    groups: dict[tuple[str, ...], list[tuple[Any, ...]]] = {}
+    for record in records:
+        items = record_items(record)
+        shape = tuple(items)
+        try:
+            groups[shape].append(tuple(items.values()))
+        except KeyError:
+            groups[shape] = [tuple(items.values())]
+    return groups
+
+
+def iter_write_chunks(
+    conn: sqlite3.Connection,
+    verb: SQL,
+    table: str,
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[int]:
+    """Write records with executemany, one transaction per chunk, yielding rows written per chunk.
+
+    records may be any iterable, including a generator; it is consumed
+    chunk_size records at a time. Within a chunk, records are grouped by key
+    shape and each group is sent as one executemany call. A failing chunk is
+    rolled back and the error propagates; earlier chunks stay committed.
+    """
+    if not verb.is_insert:
+        raise ValueError(f"{verb.name} is not an insert verb")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    for chunk in batched(records, chunk_size):
+        written = 0
+        with transaction(conn):
+            for shape, rows in group_by_shape(chunk).items():
+                cursor = conn.executemany(verb.prepare(table, shape).sql, rows)
+                written += max(cursor.rowcount, 0)
+        yield written
+
+
+def write_many(
+    conn: sqlite3.Connection,
+    verb: SQL,
+    table: str,
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Bulk INSERT/REPLACE/IGNORE records into table and return the number of rows written."""
+    return sum(iter_write_chunks(conn, verb, table, records, chunk_size=chunk_size))
+
+
+def insert_many(
+    conn: sqlite3.Connection,
+    table: str,
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    return write_many(conn, SQL.INSERT_INTO, table, records, chunk_size=chunk_size)
+
+
+def replace_many(
+    conn: sqlite3.Connection,
+    table: str,
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    return write_many(conn, SQL.REPLACE_INTO, table, records, chunk_size=chunk_size)
+
+
+def ignore_many(
+    conn: sqlite3.Connection,
+    table: str,
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    return write_many(conn, SQL.IGNORE_INTO, table, records, chunk_size=chunk_size)
+
+
+def fetch_by_keys(
+    conn: sqlite3.Connection,
+    table: str,
+    keys: Iterable[str],
+    key_values: Iterable[Any],
+) -> Iterator[Any]:
+    """Yield the rows of table whose keys match any of key_values, a few statements at a time."""
+    for sql, params in SQL.SELECT_FROM_WHERE_IN.compose_in(
+        table, keys, key_values, max_params=variable_limit(conn)
+    ):
+        yield from conn.execute(sql, params)
+
+
+def delete_by_keys(
+    conn: sqlite3.Connection,
+    table: str,
+    keys: Iterable[str],
+    key_values: Iterable[Any],
+) -> int:
+    """Delete the rows of table whose keys match any of key_values in one transaction."""
+    deleted = 0
+    with transaction(conn):
+        for sql, params in SQL.DELETE_FROM_WHERE_IN.compose_in(
+            table, keys, key_values, max_params=variable_limit(conn)
+        ):
+            deleted += max(conn.execute(sql, params).rowcount, 0)
+    return deleted
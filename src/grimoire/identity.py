@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Final, NamedTuple
+from weakref import WeakValueDictionary
+
+DEFAULT_IDENTITY_MAP_SIZE: Final[int] = 1024
+
+type IdentityKey = tuple[type, Any]
+
+
+class IdentityMapInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+
+
+def identity_key(instance: Any) -> IdentityKey:
+    """Return (schematic class, primary key value) for a schematic instance."""
+    cls = type(instance)
+    name = cls.__primary_key__[0]
+    return (cls, getattr(instance, name))
+
+
+class IdentityMap:
+    """In-process map from (schematic class, primary key) to one live instance.
+
+    The maxsize most recently used instances are held strongly and evicted in
+    LRU order. With weak=True, evicted instances stay reachable through a weak
+    reference for as long as something else keeps them alive, so repeated
+    loads keep returning the same object. Instances of slotted schematics
+    cannot be weakly referenced and are simply dropped on eviction.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_IDENTITY_MAP_SIZE, *, weak: bool = False) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+        self.maxsize: int = maxsize
+        self.weak: bool = weak
+        self._recent: OrderedDict[IdentityKey, Any] = OrderedDict()
+        self._weak: WeakValueDictionary[IdentityKey, Any] = WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._recent.keys() | self._weak.keys())
+
+    def __contains__(self, key: IdentityKey) -> bool:
+        with self._lock:
+            return key in self._recent or key in self._weak
+
+    def _store(self, key: IdentityKey, instance: Any) -> None:
+        self._recent[key] = instance
+        self._recent.move_to_end(key)
+        if self.weak:
+            try:
+                self._weak[key] = instance
+            except TypeError:
+                pass
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+            self._evictions += 1
+
+    def _lookup(self, key: IdentityKey) -> Any | None:
+        try:
+            instance = self._recent[key]
+        except KeyError:
+            instance = self._weak.get(key) if self.weak else None
+            if instance is None:
+                return None
+            self._store(key, instance)
+        else:
+            self._recent.move_to_end(key)
+        return instance
+
+    def get(self, cls: type, key: Any) -> Any | None:
+        """Return the live instance for (cls, key), counting a hit or a miss."""
+        with self._lock:
+            instance = self._lookup((cls, key))
+            if instance is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return instance
+
+    def add(self, instance: Any) -> None:
+        """Make instance the live object for its primary key, replacing any other."""
+        with self._lock:
+            self._store(identity_key(instance), instance)
+
+    def setdefault(self, instance: Any) -> Any:
+        """Return the live object for instance's primary key, registering instance if none."""
+        key = identity_key(instance)
+        with self._lock:
+            existing = self._lookup(key)
+            if existing is not None:
+                return existing
+            self._store(key, instance)
+            return instance
+
+    def discard(self, cls: type, key: Any) -> None:
+        with self._lock:
+            self._recent.pop((cls, key), None)
+            self._weak.pop((cls, key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._weak.clear()
+
+    def cache_info(self) -> IdentityMapInfo:
+        with self._lock:
+            return IdentityMapInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._recent.keys() | self._weak.keys()),
+                self.maxsize,
+            )
+
+    def reset_cache_info(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
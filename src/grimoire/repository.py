@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+from weakref import WeakSet
+
+from .base import SQL
+from .concurrency import (
+    Coalescer,
+    JobExecutor,
+)
+from .db import (
+    DEFAULT_CHUNK_SIZE,
+    ConnectionPool,
+    delete_by_keys,
+    record_items,
+    replace_many,
+    transaction,
+    variable_limit,
+)
+from .identity import IdentityMap
+from .schematic.hydrate import (
+    DEFAULT_FETCH_SIZE,
+    compile_hydrator,
+    cursor_columns,
+)
+from .schematic.schematic import (
+    CLEAN,
+    DIRTY_ATTR,
+    LAZY_ATTR,
+    dirty_fields,
+    is_tracked,
+    mark_clean,
+)
+
+
+class LazyGroup:
+    """Proxies created together whose missing fields are fetched together.
+
+    The first access to an unloaded field on any member loads that column for
+    every member still missing it with one set-based SELECT.
+    """
+
+    __slots__ = ("members", "repository")
+
+    def __init__(self, repository: Repository[Any]) -> None:
+        self.repository: Repository[Any] = repository
+        self.members: WeakSet[Any] = WeakSet()
+
+    def load(self, name: str) -> None:
+        pk = self.repository.primary_key
+        pending = {vars(m)[pk]: m for m in self.members if name not in vars(m)}
+        if not pending:
+            return
+        values = self.repository.load_column(pending, name)
+        for key, member in pending.items():
+            if key in values:
+                vars(member)[name] = values[key]
+            else:
+                vars(member).pop(LAZY_ATTR, None)
+                self.members.discard(member)
+
+
+class Repository[S]:
+    """Table-backed storage for one schematic class, keyed on its primary key.
+
+    The table name defaults to the schematic's class name and its columns are
+    expected to match the names in `__field_nodes__`. With an identity_map,
+    loads return the live instance already held for a primary key and only
+    go to the database on a miss; writes through the repository keep the map
+    current.
+    """
+
+    def __init__(
+        self,
+        schematic: type[S],
+        pool: ConnectionPool,
+        *,
+        table: str | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        self.schematic: type[S] = schematic
+        self.pool: ConnectionPool = pool
+        self.table: str = table if table is not None else schematic.__name__
+        self.primary_key: str = schematic.__primary_key__[0]  # type: ignore[attr-defined]
+        self.fields: frozenset[str] = frozenset(schematic.__field_nodes__)  # type: ignore[attr-defined]
+        self.identity_map: IdentityMap | None = identity_map
+
+    def _hydrate(self, cursor: sqlite3.Cursor, rows: Iterable[tuple[Any, ...]]) -> Iterator[S]:
+        hydrator = compile_hydrator(self.schematic, cursor_columns(cursor))  # type: ignore[arg-type]
+        if self.identity_map is None:
+            return map(hydrator, rows)
+        return map(self.identity_map.setdefault, map(hydrator, rows))
+
+    def _written(self, instance: S) -> None:
+        mark_clean(instance)
+        if self.identity_map is not None:
+            self.identity_map.add(instance)
+
+    def iter_all(self, *, size: int = DEFAULT_FETCH_SIZE) -> Iterator[S]:
+        """Stream every row of the table as instances in primary-key order.
+
+        Rows are read size at a time by primary-key range and the pooled
+        connection is released between pages, so a suspended iterator holds
+        no connection. Rows written meanwhile are seen only if their key lies
+        past the page already read.
+        """
+        table, pk = SQL.ident_escape(self.table), SQL.ident_escape(self.primary_key)
+        first = f"SELECT * FROM {table} ORDER BY {pk} LIMIT ?"
+        after = f"SELECT * FROM {table} WHERE {pk} > ? ORDER BY {pk} LIMIT ?"
+        sql, params = first, (size,)
+        while True:
+            with self.pool.connection() as conn:
+                cursor = conn.execute(sql, params)
+                rows = cursor.fetchall()
+                if not rows:
+                    return
+                page = self._hydrate(cursor, rows)
+                last = rows[-1][cursor_columns(cursor).index(self.primary_key)]
+            yield from page
+            if len(rows) < size:
+                return
+            sql, params = after, (last, size)
+
+    def get(self, key: Any) -> S | None:
+        if self.identity_map is not None:
+            cached: S | None = self.identity_map.get(self.schematic, key)
+            if cached is not None:
+                return cached
+        with self.pool.connection() as conn:
+            cursor = conn.execute(*SQL.SELECT_FROM_WHERE.compose(self.table, {self.primary_key: key}))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return next(self._hydrate(cursor, (row,)))
+
+    def get_many(self, keys: Iterable[Any]) -> list[S]:
+        """Return the instances stored under keys, skipping keys with no row.
+
+        With an identity_map the result follows the order of keys; otherwise
+        rows come back in whatever order the database returns them.
+        """
+        if self.identity_map is None:
+            return self._fetch_many(keys)
+        keys = list(keys)
+        found: dict[Any, S] = {}
+        missing: list[Any] = []
+        for key in keys:
+            cached: S | None = self.identity_map.get(self.schematic, key)
+            if cached is None:
+                missing.append(key)
+            else:
+                found[key] = cached
+        if missing:
+            pk = self.primary_key
+            for instance in self._fetch_many(missing):
+                found[getattr(instance, pk)] = instance
+        return [found[key] for key in keys if key in found]
+
+    def _fetch_many(self, keys: Iterable[Any]) -> list[S]:
+        instances: list[S] = []
+        with self.pool.connection() as conn:
+            for sql, params in SQL.SELECT_FROM_WHERE_IN.compose_in(
+                self.table, (self.primary_key,), keys, max_params=variable_limit(conn)
+            ):
+                cursor = conn.execute(sql, params)
+                instances.extend(self._hydrate(cursor, cursor))
+            return instances
+
+    def load_column(self, keys: Iterable[Any], name: str) -> dict[Any, Any]:
+        """Return {primary key: value} of one column for the rows matching keys."""
+        with self.pool.connection() as conn:
+            values: dict[Any, Any] = {}
+            for sql, params in SQL.SELECT_COLUMNS_FROM_WHERE_IN.compose_in(
+                self.table,
+                (self.primary_key,),
+                keys,
+                columns=(self.primary_key, name),
+                max_params=variable_limit(conn),
+            ):
+                values.update(conn.execute(sql, params))
+            return values
+
+    def proxies(self, keys: Iterable[Any]) -> list[S]:
+        """Return lazy instances holding only their primary key.
+
+        Other fields are fetched on first access through the `FieldNode`
+        descriptors, one column at a time for the whole group. Requires a
+        dict-backed (not slots=True) schematic.
+        """
+        if "__slots__" in vars(self.schematic):
+            raise TypeError(f"{self.schematic.__name__} uses slots and cannot be lazily loaded")
+        group = LazyGroup(self)
+        tracked = getattr(self.schematic, "__tracked__", False)
+        instances: list[S] = []
+        for key in keys:
+            instance = object.__new__(self.schematic)
+            state = vars(instance)
+            state[self.primary_key] = key
+            state[LAZY_ATTR] = group
+            if tracked:
+                state[DIRTY_ATTR] = CLEAN
+            group.members.add(instance)
+            instances.append(instance)
+        return instances
+
+    def proxy(self, key: Any) -> S:
+        return self.proxies((key,))[0]
+
+    def put(self, instance: S) -> None:
+        with self.pool.connection() as conn, transaction(conn):
+            conn.execute(*SQL.REPLACE_INTO.compose(self.table, record_items(instance)))
+        self._written(instance)
+
+    def put_many(self, instances: Iterable[S], *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        if self.identity_map is None and not getattr(self.schematic, "__tracked__", False):
+            with self.pool.connection() as conn:
+                return replace_many(conn, self.table, instances, chunk_size=chunk_size)
+        instances = list(instances)
+        with self.pool.connection() as conn:
+            count = replace_many(conn, self.table, instances, chunk_size=chunk_size)
+        for instance in instances:
+            self._written(instance)
+        return count
+
+    def save(self, instance: S) -> bool:
+        """Write only what changed on instance and return whether a statement ran.
+
+        Instances of a tracked schematic that were loaded from this repository
+        issue an UPDATE of their dirty fields, or nothing at all when no field
+        was assigned since the last load or save. New or untracked instances
+        are written in full like `put`. Reassigning the primary key of a loaded
+        instance raises ValueError, since the row it was loaded from is no
+        longer known; delete that key and put a new instance instead.
+        """
+        dirty = dirty_fields(instance) if is_tracked(instance) else None
+        if dirty is None:
+            self.put(instance)
+            return True
+        if self.primary_key in dirty:
+            raise ValueError(
+                f"cannot save {self.schematic.__name__} with a reassigned primary key "
+                f"{self.primary_key!r}; delete the old key and put a new instance"
+            )
+        if not dirty:
+            return False
+        # Read the stored state directly: going through the field descriptors
+        # would load every still-missing column of a lazy proxy.
+        try:
+            state: Mapping[str, Any] = vars(instance)
+        except TypeError:
+            state = record_items(instance)  # slots=True instances are never lazy
+        field_nodes = self.schematic.__field_nodes__  # type: ignore[attr-defined]
+        changes = {name: state.get(name) for name in field_nodes if name in dirty}
+        key = {self.primary_key: state[self.primary_key]}
+        with self.pool.connection() as conn, transaction(conn):
+            conn.execute(*SQL.UPDATE_SET_WHERE.compose_update(self.table, changes, key))
+        self._written(instance)
+        return True
+
+    def delete(self, key: Any) -> bool:
+        with self.pool.connection() as conn, transaction(conn):
+            cursor = conn.execute(
+                *SQL.DELETE_FROM_WHERE.compose(self.table, {self.primary_key: key})
+            )
+        if self.identity_map is not None:
+            self.identity_map.discard(self.schematic, key)
+        return cursor.rowcount > 0
+
+    def delete_many(self, keys: Iterable[Any]) -> int:
+        if self.identity_map is not None:
+            keys = list(keys)
+            for key in keys:
+                self.identity_map.discard(self.schematic, key)
+        with self.pool.connection() as conn:
+            return delete_by_keys(conn, self.table, (self.primary_key,), keys)
+
+    def _load_batch(self, keys: list[Any]) -> dict[Any, S | None]:
+        found = {getattr(instance, self.primary_key): instance for instance in self.get_many(keys)}
+        return {key: found.get(key) for key in keys}
+
+    def coalescer(
+        self,
+        *,
+        max_batch_size: int = 100,
+        window: float = 0.002,
+        executor: JobExecutor | None = None,
+    ) -> Coalescer[Any, S | None]:
+        """Return a `Coalescer` whose concurrent `load(key)` calls share one `get_many` query."""
+        return Coalescer(
+            self._load_batch, max_batch_size=max_batch_size, window=window, executor=executor
+        )
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+)
+from typing import (
+    Any,
+    Final,
+)
+
+from .schematic import (
+    MISSING,
+    TypeNode,
+    _SchematicMeta,
+    _spec_mismatch,
+)
+
+TYPECODES: Final[dict[type, str]] = {bool: "b", int: "q", float: "d"}
+
+
+def unwrap_nullable(node: TypeNode) -> tuple[TypeNode, bool]:
+    """Return a field's value TypeNode and whether it is nullable.
+
+    Qualifiers (ReadOnly, Required, NotRequired) are unwrapped and `X | None`
+    is treated as a nullable X. Optional unions of several types are returned
+    as they are.
+    """
+    while node.is_readonly or node.is_required or node.is_not_required:
+        node = node.args[0]
+    nullable = node.is_optional
+    if nullable and len(node.option_values) == 1:
+        node = TypeNode(node.option_values[0])
+    return (node, nullable)
+
+
+def column_typecode(node: TypeNode) -> tuple[str | None, bool]:
+    """Return the `array` typecode for a field's TypeNode and whether it is nullable.
+
+    Fields without a fixed-width numeric type get a typecode of None and are
+    stored in a list.
+    """
+    node, nullable = unwrap_nullable(node)
+    if node.is_optional:
+        return (None, True)
+    return (TYPECODES.get(node.inner_type), nullable)
+
+
+class Column:
+    """One field of a `SchematicBatch`.
+
+    Numeric fields are backed by an `array.array`; nullable numeric fields also
+    carry a validity bitmap with one bit per row. Everything else is a list.
+    Fields that may be left unset get an `unset` bitmap, so an omitted value
+    stays distinct from an explicit None.
+    """
+
+    __slots__ = ("name", "nullable", "typecode", "unset", "validity", "values")
+
+    def __init__(
+        self, name: str, typecode: str | None, nullable: bool, unsettable: bool = False
+    ) -> None:
+        self.name: str = name
+        self.typecode: str | None = typecode
+        self.nullable: bool = nullable
+        self.values: MutableSequence[Any] = array(typecode) if typecode is not None else []
+        self.validity: bytearray | None = (
+            bytearray() if typecode is not None and nullable else None
+        )
+        self.unset: bytearray | None = bytearray() if unsettable else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Any) -> None:
+        index = len(self.values)
+        unset = value is MISSING
+        if unset and self.unset is None:
+            raise ValueError(f"{self.name} must be set")
+        null = unset or value is None
+        # The buffer append is the only step that can fail, so it goes first.
+        if null and self.typecode is not None and (unset or self.validity is not None):
+            self.values.append(0)
+        else:
+            self.values.append(None if unset else value)
+        bit = 1 << (index & 7)
+        if self.validity is not None:
+            if index & 7 == 0:
+                self.validity.append(0)
+            if not null:
+                self.validity[index >> 3] |= bit
+        if self.unset is not None:
+            if index & 7 == 0:
+                self.unset.append(0)
+            if unset:
+                self.unset[index >> 3] |= bit
+
+    def pop(self) -> None:
+        self.values.pop()
+        index = len(self.values)
+        for bitmap in (self.validity, self.unset):
+            if bitmap is not None:
+                bitmap[index >> 3] &= ~(1 << (index & 7))
+                if index & 7 == 0:
+                    bitmap.pop()
+
+    def is_set(self, index: int) -> bool:
+        return self.unset is None or not self.unset[index >> 3] >> (index & 7) & 1
+
+    def is_valid(self, index: int) -> bool:
+        if not self.is_set(index):
+            return False
+        if self.validity is None:
+            return self.values[index] is not None
+        return bool(self.validity[index >> 3] >> (index & 7) & 1)
+
+    def get(self, index: int) -> Any:
+        """Return the value at index: None for nulls, MISSING for unset fields."""
+        if not self.is_set(index):
+            return MISSING
+        if self.validity is not None and not self.validity[index >> 3] >> (index & 7) & 1:
+            return None
+        value = self.values[index]
+        return bool(value) if self.typecode == "b" else value
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.values
+        if self.typecode == "b":
+            values = map(bool, values)  # type: ignore[assignment]
+        if self.validity is None and self.unset is None:
+            yield from values
+            return
+        validity, unset = self.validity, self.unset
+        for index, value in enumerate(values):
+            if unset is not None and unset[index >> 3] >> (index & 7) & 1:
+                yield MISSING
+            elif validity is None or validity[index >> 3] >> (index & 7) & 1:
+                yield value
+            else:
+                yield None
+
+
+class BatchRow:
+    """Lazy view of one row in a `SchematicBatch`; fields are read from the columns on access."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: SchematicBatch, index: int) -> None:
+        self._batch: SchematicBatch = batch
+        self._index: int = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._batch.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        value = column.get(self._index)
+        if value is MISSING:
+            raise AttributeError(f"{self._batch.schematic.__name__}.{name} is not set")
+        return value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._batch.schematic.__name__}, {self._index})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the row's set fields; unset fields are left out."""
+        values = {name: column.get(self._index) for name, column in self._batch.columns.items()}
+        return {name: value for name, value in values.items() if value is not MISSING}
+
+    def materialize(self) -> Any:
+        return self._batch.schematic(**self.as_dict())
+
+
+class SchematicBatch:
+    """Column-oriented storage for many records of one schematic class.
+
+    Records are decomposed into one `Column` per field in `__field_nodes__`
+    order; rows are only turned back into objects when indexed or iterated.
+    """
+
+    def __init__(self, schematic: _SchematicMeta, records: Iterable[Any] = ()) -> None:
+        self.schematic: _SchematicMeta = schematic
+        self._required: frozenset[str] = schematic.__spec__.__required_keys__  # type: ignore[attr-defined]
+        self._defaults: dict[str, Any] = schematic.__defaults__  # type: ignore[attr-defined]
+        self._default_factories: dict[str, Callable[[], Any]] = (
+            schematic.__default_factories__  # type: ignore[attr-defined]
+        )
+        always_set = self._required | self._defaults.keys() | self._default_factories.keys()
+        self.columns: dict[str, Column] = {
+            name: Column(name, *column_typecode(fnode.typenode), name not in always_set)
+            for name, fnode in schematic.__field_nodes__.items()  # type: ignore[attr-defined]
+        }
+        self._length: int = 0
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> BatchRow:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("batch index out of range")
+        return BatchRow(self, index)
+
+    def __iter__(self) -> Iterator[BatchRow]:
+        for index in range(self._length):
+            yield BatchRow(self, index)
+
+    def _row_values(self, record: Any) -> dict[str, Any]:
+        if isinstance(record, Mapping):
+            if record.keys() - self.columns.keys():
+                raise _spec_mismatch(self.schematic.__name__)
+            values = {name: record.get(name, MISSING) for name in self.columns}
+            for name, default in self._defaults.items():
+                if values[name] is MISSING:
+                    values[name] = default
+            for name, factory in self._default_factories.items():
+                if values[name] is MISSING:
+                    values[name] = factory()
+        else:
+            values = {name: getattr(record, name, MISSING) for name in self.columns}
+        if any(values[name] is MISSING for name in self._required):
+            raise _spec_mismatch(self.schematic.__name__)
+        return values
+
+    def append(self, record: Any) -> None:
+        """Append a schematic instance or a mapping of field values as a new row."""
+        values = self._row_values(record)
+        appended: list[Column] = []
+        try:
+            for name, column in self.columns.items():
+                column.append(values[name])
+                appended.append(column)
+        except BaseException:
+            for column in appended:
+                column.pop()
+            raise
+        self._length += 1
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str) -> MutableSequence[Any]:
+        """Return the raw buffer for a field; null and unset slots of numeric columns hold 0."""
+        return self.columns[name].values
+
+    def iter_column(self, name: str, default: Any = None) -> Iterator[Any]:
+        """Yield a field's values row by row without building rows.
+
+        Nulls are yielded as None and unset fields as default.
+        """
+        for value in self.columns[name]:
+            yield default if value is MISSING else value
+
+    def materialize(self) -> Iterator[Any]:
+        for row in self:
+            yield row.materialize()
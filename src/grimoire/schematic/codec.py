@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import pickle
+import struct
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+from typing import (
+    Any,
+    Final,
+)
+from weakref import (
+    WeakKeyDictionary,
+)
+
+from .batch import (
+    unwrap_nullable,
+)
+from .hydrate import (
+    compile_hydrator,
+)
+from .schematic import (
+    DIRTY_ATTR,
+    MISSING,
+    FieldNode,
+    _SchematicMeta,
+)
+
+FIXED_CODES: Final[dict[type, str]] = {bool: "?", int: "q", float: "d"}
+
+TAG_UNSET: Final[int] = 0
+TAG_NONE: Final[int] = 1
+TAG_FALSE: Final[int] = 2
+TAG_TRUE: Final[int] = 3
+TAG_INT: Final[int] = 4
+TAG_FLOAT: Final[int] = 5
+TAG_STR: Final[int] = 6
+TAG_BYTES: Final[int] = 7
+TAG_RECORD: Final[int] = 8
+TAG_PICKLE: Final[int] = 9
+
+_U32: Final[struct.Struct] = struct.Struct("<I")
+_TAGGED_INT: Final[struct.Struct] = struct.Struct("<Bq")
+_TAGGED_FLOAT: Final[struct.Struct] = struct.Struct("<Bd")
+_TAGGED_SIZE: Final[struct.Struct] = struct.Struct("<BI")
+
+_layouts: WeakKeyDictionary[_SchematicMeta, RecordLayout] = WeakKeyDictionary()
+
+
+class RecordLayout:
+    """Binary layout of one schematic class, derived once from `__field_nodes__`.
+
+    A record is a fixed part packed with one `struct.Struct` — every
+    non-nullable bool, int and float field followed by a bitmap of those left
+    unset — and then a variable part holding one tagged, length-prefixed
+    value per remaining field (strings, bytes, optional and nested fields).
+    The encoder and decoder are generated for the layout, like `__init__`.
+
+    Values of any other type are only written (as pickles) and read back
+    when both sides pass allow_pickle=True; never decode untrusted input
+    that way, since unpickling can run arbitrary code.
+    """
+
+    __slots__ = (
+        "bitmap_size",
+        "decode_from",
+        "encode_into",
+        "fixed",
+        "fixed_names",
+        "nested",
+        "schematic",
+        "var_names",
+        "var_types",
+    )
+
+    def __init__(self, schematic: _SchematicMeta) -> None:
+        field_nodes: dict[str, FieldNode] = schematic.__field_nodes__  # type: ignore[attr-defined]
+        fixed_names: list[str] = []
+        codes: list[str] = []
+        var_names: list[str] = []
+        var_types: list[Any] = []
+        nested: dict[str, _SchematicMeta] = {}
+        for name, fnode in field_nodes.items():
+            node, nullable = unwrap_nullable(fnode.typenode)
+            target = node.inner_type
+            code = None if nullable else FIXED_CODES.get(target)
+            if code is not None:
+                fixed_names.append(name)
+                codes.append(code)
+                continue
+            var_names.append(name)
+            var_types.append(target)
+            if hasattr(target, "__field_nodes__"):
+                nested[name] = target
+
+        self.schematic: _SchematicMeta = schematic
+        self.fixed_names: tuple[str, ...] = tuple(fixed_names)
+        self.var_names: tuple[str, ...] = tuple(var_names)
+        self.var_types: tuple[Any, ...] = tuple(var_types)
+        self.nested: dict[str, _SchematicMeta] = nested
+        self.bitmap_size: int = (len(fixed_names) + 7) // 8
+        self.fixed: struct.Struct = struct.Struct(f"<{''.join(codes)}{self.bitmap_size}s")
+        self.encode_into: Callable[[bytearray, Any, bool], None] = _compile_encoder(self)
+        self.decode_from: Callable[[memoryview, int, bool], tuple[Any, int]] = (
+            _compile_decoder(self)
+        )
+
+
+def record_layout(schematic: _SchematicMeta) -> RecordLayout:
+    try:
+        return _layouts[schematic]
+    except KeyError:
+        layout = _layouts[schematic] = RecordLayout(schematic)
+        return layout
+
+
+def _encode_value(
+    out: bytearray, value: Any, nested: _SchematicMeta | None, allow_pickle: bool
+) -> None:
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True:
+        out.append(TAG_TRUE)
+    elif value is False:
+        out.append(TAG_FALSE)
+    elif type(value) is str:
+        data = value.encode()
+        out += _TAGGED_SIZE.pack(TAG_STR, len(data))
+        out += data
+    elif type(value) is int and -(1 << 63) <= value < (1 << 63):
+        out += _TAGGED_INT.pack(TAG_INT, value)
+    elif type(value) is float:
+        out += _TAGGED_FLOAT.pack(TAG_FLOAT, value)
+    elif type(value) is bytes:
+        out += _TAGGED_SIZE.pack(TAG_BYTES, len(value))
+        out += value
+    elif nested is not None and type(value) is nested:
+        data = encode(value, allow_pickle=allow_pickle)
+        out += _TAGGED_SIZE.pack(TAG_RECORD, len(data))
+        out += data
+    elif allow_pickle:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        out += _TAGGED_SIZE.pack(TAG_PICKLE, len(data))
+        out += data
+    else:
+        raise TypeError(
+            f"Cannot encode a {type(value).__name__} value without allow_pickle=True"
+        )
+
+
+def _decode_value(
+    view: memoryview, offset: int, nested: _SchematicMeta | None, allow_pickle: bool
+) -> tuple[Any, int]:
+    tag = view[offset]
+    if tag == TAG_UNSET:
+        return (MISSING, offset + 1)
+    if tag == TAG_NONE:
+        return (None, offset + 1)
+    if tag == TAG_TRUE or tag == TAG_FALSE:
+        return (tag == TAG_TRUE, offset + 1)
+    if tag == TAG_INT:
+        return (_TAGGED_INT.unpack_from(view, offset)[1], offset + _TAGGED_INT.size)
+    if tag == TAG_FLOAT:
+        return (_TAGGED_FLOAT.unpack_from(view, offset)[1], offset + _TAGGED_FLOAT.size)
+    start = offset + _TAGGED_SIZE.size
+    end = start + _TAGGED_SIZE.unpack_from(view, offset)[1]
+    if tag == TAG_STR:
+        return (str(view[start:end], "utf-8"), end)
+    if tag == TAG_BYTES:
+        return (bytes(view[start:end]), end)
+    if tag == TAG_RECORD and nested is not None:
+        return (record_layout(nested).decode_from(view, start, allow_pickle)[0], end)
+    if tag == TAG_PICKLE:
+        if not allow_pickle:
+            raise ValueError(
+                f"Refusing to unpickle the value at offset {offset} without allow_pickle=True"
+            )
+        return (pickle.loads(view[start:end]), end)
+    raise ValueError(f"Unknown value tag {tag} at offset {offset}")
+
+
+def _compile_encoder(layout: RecordLayout) -> Callable[[bytearray, Any, bool], None]:
+    """Generate `encode_into(out, obj, allow_pickle)`, appending one record of layout to out.
+
+    str and bytes values of fields declared with those types are written
+    inline; every other variable value goes through `_encode_value`.
+    """
+    name = layout.schematic.__name__
+    namespace: dict[str, Any] = {
+        "__grimoire_pack__": layout.fixed.pack,
+        "__grimoire_pack_size__": _TAGGED_SIZE.pack,
+        "__grimoire_encode_value__": _encode_value,
+        "__grimoire_struct_error__": struct.error,
+        "__grimoire_cls_name__": name,
+    }
+    lines = ["def encode_into(out, obj, allow_pickle):", "    unset = 0"]
+    packed: list[str] = []
+    for bit, fname in enumerate(layout.fixed_names):
+        lines += [
+            "    try:",
+            f"        f{bit} = obj.{fname}",
+            "    except AttributeError:",
+            f"        f{bit} = 0",
+            f"        unset |= {1 << bit}",
+        ]
+        packed.append(f"f{bit}")
+    packed.append(f"unset.to_bytes({layout.bitmap_size}, 'little')")
+    lines += [
+        "    try:",
+        f"        out += __grimoire_pack__({', '.join(packed)})",
+        "    except __grimoire_struct_error__ as e:",
+        "        raise ValueError(f'Cannot pack {__grimoire_cls_name__} fixed fields: {e}') from None",
+    ]
+    for index, (fname, target) in enumerate(zip(layout.var_names, layout.var_types, strict=True)):
+        nested = f"__grimoire_nested_{index}__"
+        namespace[nested] = layout.nested.get(fname)
+        lines += [
+            "    try:",
+            f"        v = obj.{fname}",
+            "    except AttributeError:",
+            f"        out.append({TAG_UNSET})",
+        ]
+        if target is str:
+            lines += [
+                "    else:",
+                "        if type(v) is str:",
+                "            v = v.encode()",
+                f"            out += __grimoire_pack_size__({TAG_STR}, len(v))",
+                "            out += v",
+                "        else:",
+                f"            __grimoire_encode_value__(out, v, {nested}, allow_pickle)",
+            ]
+        elif target is bytes:
+            lines += [
+                "    else:",
+                "        if type(v) is bytes:",
+                f"            out += __grimoire_pack_size__({TAG_BYTES}, len(v))",
+                "            out += v",
+                "        else:",
+                f"            __grimoire_encode_value__(out, v, {nested}, allow_pickle)",
+            ]
+        else:
+            lines += [
+                "    else:",
+                f"        __grimoire_encode_value__(out, v, {nested}, allow_pickle)",
+            ]
+
+    exec("\n".join(lines), namespace)
+    return namespace["encode_into"]  # type: ignore[no-any-return]
+
+
+def _partial_hydrator(layout: RecordLayout) -> Callable[[bytes, tuple[Any, ...]], Any]:
+    """Return a function hydrating a record from only its present fields."""
+    names = (*layout.fixed_names, *layout.var_names)
+    fixed_count = len(layout.fixed_names)
+
+    def hydrate(bitmap: bytes, values: tuple[Any, ...]) -> Any:
+        unset = int.from_bytes(bitmap, "little")
+        columns: list[str] = []
+        present: list[Any] = []
+        for index, (name, value) in enumerate(zip(names, values, strict=True)):
+            if (unset >> index & 1) if index < fixed_count else value is MISSING:
+                continue
+            columns.append(name)
+            present.append(value)
+        return compile_hydrator(layout.schematic, columns)(present)
+
+    return hydrate
+
+
+def _compile_decoder(layout: RecordLayout) -> Callable[[memoryview, int, bool], tuple[Any, int]]:
+    """Generate `decode_from(view, offset, allow_pickle)` returning (instance, offset past it).
+
+    Values are read in place from view. Records with every field present are
+    built with one hydrator call; others go through `_partial_hydrator`.
+    Decoded instances of tracked schematics count as new, not clean.
+    """
+    namespace: dict[str, Any] = {
+        "__grimoire_unpack__": layout.fixed.unpack_from,
+        "__grimoire_unpack_size__": _TAGGED_SIZE.unpack_from,
+        "__grimoire_unpack_int__": _TAGGED_INT.unpack_from,
+        "__grimoire_unpack_float__": _TAGGED_FLOAT.unpack_from,
+        "__grimoire_decode_value__": _decode_value,
+        "__grimoire_hydrate__": compile_hydrator(
+            layout.schematic, (*layout.fixed_names, *layout.var_names)
+        ),
+        "__grimoire_hydrate_partial__": _partial_hydrator(layout),
+        "__grimoire_setattr__": object.__setattr__,
+        "__grimoire_missing__": MISSING,
+        "__grimoire_no_bits__": bytes(layout.bitmap_size),
+    }
+    fixed = [f"f{bit}" for bit in range(len(layout.fixed_names))]
+    var = [f"v{index}" for index in range(len(layout.var_names))]
+    lines = [
+        "def decode_from(view, offset, allow_pickle):",
+        f"    ({''.join(f'{f}, ' for f in fixed)}bitmap,) = __grimoire_unpack__(view, offset)",
+        f"    offset += {layout.fixed.size}",
+    ]
+    for index, (fname, target) in enumerate(zip(layout.var_names, layout.var_types, strict=True)):
+        nested = f"__grimoire_nested_{index}__"
+        namespace[nested] = layout.nested.get(fname)
+        lines += [
+            "    tag = view[offset]",
+            f"    if tag == {TAG_NONE}:",
+            f"        v{index} = None",
+            "        offset += 1",
+        ]
+        if target is str or target is bytes:
+            convert = (
+                "str(view[start:offset], 'utf-8')" if target is str else "bytes(view[start:offset])"
+            )
+            lines += [
+                f"    elif tag == {TAG_STR if target is str else TAG_BYTES}:",
+                f"        start = offset + {_TAGGED_SIZE.size}",
+                "        offset = start + __grimoire_unpack_size__(view, offset)[1]",
+                f"        v{index} = {convert}",
+            ]
+        elif target is int or target is float:
+            tagged = _TAGGED_INT if target is int else _TAGGED_FLOAT
+            lines += [
+                f"    elif tag == {TAG_INT if target is int else TAG_FLOAT}:",
+                f"        v{index} = __grimoire_unpack_{target.__name__}__(view, offset)[1]",
+                f"        offset += {tagged.size}",
+            ]
+        lines += [
+            "    else:",
+            f"        v{index}, offset = __grimoire_decode_value__("
+            f"view, offset, {nested}, allow_pickle)",
+        ]
+    values = f"({''.join(f'{v}, ' for v in (*fixed, *var))})"
+    complete = " and ".join(
+        ["bitmap == __grimoire_no_bits__", *(f"{v} is not __grimoire_missing__" for v in var)]
+    )
+    lines += [
+        f"    if {complete}:",
+        f"        obj = __grimoire_hydrate__({values})",
+        "    else:",
+        f"        obj = __grimoire_hydrate_partial__(bitmap, {values})",
+    ]
+    if getattr(layout.schematic, "__tracked__", False):
+        lines.append(f"    __grimoire_setattr__(obj, {DIRTY_ATTR!r}, None)")
+    lines.append("    return (obj, offset)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["decode_from"]  # type: ignore[no-any-return]
+
+
+def encode(instance: Any, *, allow_pickle: bool = False) -> bytes:
+    """Encode one schematic instance with its class's `RecordLayout`."""
+    out = bytearray()
+    record_layout(type(instance)).encode_into(out, instance, allow_pickle)
+    return bytes(out)
+
+
+def encode_many(
+    schematic: _SchematicMeta, records: Iterable[Any], *, allow_pickle: bool = False
+) -> bytes:
+    """Encode records of one schematic class as a count followed by length-prefixed records.
+
+    records may be instances or any objects exposing the fields as attributes,
+    such as the rows of a `SchematicBatch`.
+    """
+    encode_into = record_layout(schematic).encode_into
+    out = bytearray(_U32.size)
+    count = 0
+    for record in records:
+        start = len(out)
+        out += bytes(_U32.size)
+        encode_into(out, record, allow_pickle)
+        _U32.pack_into(out, start, len(out) - start - _U32.size)
+        count += 1
+    _U32.pack_into(out, 0, count)
+    return bytes(out)
+
+
+def decode(
+    schematic: _SchematicMeta,
+    buffer: bytes | bytearray | memoryview,
+    *,
+    allow_pickle: bool = False,
+) -> Any:
+    """Decode one record produced by `encode`, reading buffer in place through a memoryview."""
+    return record_layout(schematic).decode_from(memoryview(buffer), 0, allow_pickle)[0]
+
+
+def iter_decode_many(
+    schematic: _SchematicMeta,
+    buffer: bytes | bytearray | memoryview,
+    *,
+    allow_pickle: bool = False,
+) -> Iterator[Any]:
+    """Yield the records of a buffer produced by `encode_many`, one at a time."""
+    decode_from = record_layout(schematic).decode_from
+    view = memoryview(buffer)
+    (count,) = _U32.unpack_from(view, 0)
+    offset = _U32.size
+    for _ in range(count):
+        (size,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        instance, end = decode_from(view, offset, allow_pickle)
+        if end != offset + size:
+            raise ValueError(f"Corrupt {schematic.__name__} record at offset {offset}")
+        offset = end
+        yield instance
+
+
+def decode_many(
+    schematic: _SchematicMeta,
+    buffer: bytes | bytearray | memoryview,
+    *,
+    allow_pickle: bool = False,
+) -> list[Any]:
+    return list(iter_decode_many(schematic, buffer, allow_pickle=allow_pickle))
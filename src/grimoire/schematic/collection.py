@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from operator import (
+    itemgetter,
+)
+from typing import (
+    Any,
+)
+
+from .schematic import (
+    MISSING,
+    _SchematicMeta,
+    observe_fields,
+)
+
+
+class HashIndex:
+    """Equality index of one field: value -> {primary key: instance}."""
+
+    __slots__ = ("buckets", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.buckets: dict[Any, dict[Any, Any]] = {}
+
+    def add(self, value: Any, key: Any, instance: Any) -> None:
+        try:
+            bucket = self.buckets[value]
+        except KeyError:
+            bucket = self.buckets[value] = {}
+        except TypeError:
+            raise TypeError(
+                f"Unhashable value {value!r} for hash-indexed field {self.name!r}"
+            ) from None
+        bucket[key] = instance
+
+    def remove(self, value: Any, key: Any) -> None:
+        bucket = self.buckets[value]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[value]
+
+    def lookup(self, value: Any) -> dict[Any, Any]:
+        try:
+            return self.buckets.get(value, {})
+        except TypeError:
+            return {}
+
+
+class RangeIndex:
+    """Ordered index of one field: parallel sorted value and primary key arrays.
+
+    None values are not indexed, since they do not order against other values.
+    """
+
+    __slots__ = ("keys", "name", "values")
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.values: list[Any] = []
+        self.keys: list[Any] = []
+
+    def add(self, value: Any, key: Any) -> None:
+        index = bisect_right(self.values, value)
+        self.values.insert(index, value)
+        self.keys.insert(index, key)
+
+    def remove(self, value: Any, key: Any) -> None:
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value, lo)
+        index = self.keys.index(key, lo, hi)
+        del self.values[index]
+        del self.keys[index]
+
+    def rebuild(self, pairs: list[tuple[Any, Any]]) -> None:
+        pairs.sort(key=itemgetter(0))
+        self.values = [value for value, _ in pairs]
+        self.keys = [key for _, key in pairs]
+
+    def span(
+        self, *, ge: Any = None, gt: Any = None, le: Any = None, lt: Any = None
+    ) -> tuple[int, int]:
+        """Return the [lo, hi) positions of the values within the given bounds."""
+        values = self.values
+        lo, hi = 0, len(values)
+        if ge is not None:
+            lo = max(lo, bisect_left(values, ge))
+        if gt is not None:
+            lo = max(lo, bisect_right(values, gt))
+        if le is not None:
+            hi = min(hi, bisect_right(values, le))
+        if lt is not None:
+            hi = min(hi, bisect_left(values, lt))
+        return (lo, max(lo, hi))
+
+
+class SchematicCollection:
+    """In-memory set of schematic instances keyed on their primary key.
+
+    Fields declared with `fieldnode(index="hash")` get an equality index and
+    fields declared with `fieldnode(index="range")` a sorted one, so `where`
+    and `range` avoid scanning every instance. A schematic with indexed
+    fields must be declared with tracked=True: assigning to a field of a
+    member then updates its index entries through `field_changed`.
+    """
+
+    def __init__(self, schematic: _SchematicMeta, records: Iterable[Any] = ()) -> None:
+        self.schematic: _SchematicMeta = schematic
+        self.primary_key: str = schematic.__primary_key__[0]  # type: ignore[attr-defined]
+        self.hash_indexes: dict[str, HashIndex] = {}
+        self.range_indexes: dict[str, RangeIndex] = {}
+        for name, fnode in schematic.__field_nodes__.items():  # type: ignore[attr-defined]
+            if fnode.index == "hash":
+                self.hash_indexes[name] = HashIndex(name)
+            elif fnode.index == "range":
+                self.range_indexes[name] = RangeIndex(name)
+        self._indexed_fields: tuple[str, ...] = (*self.hash_indexes, *self.range_indexes)
+        self._records: dict[Any, Any] = {}
+        self._indexed: dict[Any, tuple[Any, ...]] = {}
+        if self._indexed_fields:
+            observe_fields(schematic, self)
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._records.values())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._records
+
+    def _coerce(self, record: Any) -> Any:
+        return self.schematic(**record) if isinstance(record, Mapping) else record
+
+    def _values(self, instance: Any) -> tuple[Any, ...]:
+        return tuple(getattr(instance, name, MISSING) for name in self._indexed_fields)
+
+    def _index(
+        self, key: Any, instance: Any, values: tuple[Any, ...], *, ranges: bool = True
+    ) -> None:
+        for name, value in zip(self._indexed_fields, values, strict=True):
+            if value is MISSING:
+                continue
+            if name in self.hash_indexes:
+                self.hash_indexes[name].add(value, key, instance)
+            elif ranges and value is not None:
+                self.range_indexes[name].add(value, key)
+
+    def _unindex(self, key: Any, values: tuple[Any, ...], *, ranges: bool = True) -> None:
+        for name, value in zip(self._indexed_fields, values, strict=True):
+            if value is MISSING:
+                continue
+            if name in self.hash_indexes:
+                self.hash_indexes[name].remove(value, key)
+            elif ranges and value is not None:
+                self.range_indexes[name].remove(value, key)
+
+    def _insert(self, instance: Any, *, ranges: bool = True) -> None:
+        # With ranges=False the sorted indexes are stale until `extend` rebuilds them.
+        key = getattr(instance, self.primary_key)
+        if key in self._records:
+            self._unindex(key, self._indexed.pop(key), ranges=ranges)
+        values = self._values(instance)
+        self._index(key, instance, values, ranges=ranges)
+        self._records[key] = instance
+        self._indexed[key] = values
+
+    def add(self, record: Any) -> Any:
+        """Add an instance (or a mapping of its fields), replacing one with the same primary key."""
+        instance = self._coerce(record)
+        self._insert(instance)
+        return instance
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """Add many records; sorted indexes are rebuilt once instead of per insert.
+
+        If a record fails, the ones before it stay added and indexed.
+        """
+        try:
+            for record in records:
+                self._insert(self._coerce(record), ranges=False)
+        finally:
+            self._rebuild_ranges()
+
+    def _rebuild_ranges(self) -> None:
+        for position, name in enumerate(self._indexed_fields):
+            if name not in self.range_indexes:
+                continue
+            self.range_indexes[name].rebuild(
+                [
+                    (values[position], key)
+                    for key, values in self._indexed.items()
+                    if values[position] is not MISSING and values[position] is not None
+                ]
+            )
+
+    def remove(self, key: Any) -> Any:
+        """Remove and return the instance with primary key key, raising KeyError if absent."""
+        instance = self._records.pop(key)
+        self._unindex(key, self._indexed.pop(key))
+        return instance
+
+    def discard(self, key: Any) -> None:
+        if key in self._records:
+            self.remove(key)
+
+    def update(self, key: Any, **values: Any) -> Any:
+        """Assign values to the instance with primary key key and update its index entries."""
+        instance = self._records[key]
+        for name, value in values.items():
+            setattr(instance, name, value)
+        self.reindex(key)
+        return instance
+
+    def field_changed(self, instance: Any, name: str) -> None:
+        """Reindex instance after its field name was assigned, if it is a member."""
+        if name not in self._indexed_fields:
+            return
+        key = getattr(instance, self.primary_key, MISSING)
+        if self._records.get(key, MISSING) is instance:
+            self.reindex(key)
+
+    def reindex(self, key: Any) -> None:
+        """Bring the index entries of one instance up to date after it was mutated in place.
+
+        The primary key itself must not change while the instance is in the collection.
+        """
+        instance = self._records[key]
+        old = self._indexed[key]
+        new = self._values(instance)
+        for position, name in enumerate(self._indexed_fields):
+            before, after = old[position], new[position]
+            if before is after or (before == after and type(before) is type(after)):
+                continue
+            if name in self.hash_indexes:
+                index = self.hash_indexes[name]
+                if before is not MISSING:
+                    index.remove(before, key)
+                if after is not MISSING:
+                    index.add(after, key, instance)
+            else:
+                ranged = self.range_indexes[name]
+                if before is not MISSING and before is not None:
+                    ranged.remove(before, key)
+                if after is not MISSING and after is not None:
+                    ranged.add(after, key)
+        self._indexed[key] = new
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._records.get(key, default)
+
+    def where(self, **equals: Any) -> list[Any]:
+        """Return the instances whose fields equal all of equals.
+
+        Candidates come from whichever hash or range index on the given fields
+        matches the fewest instances; only those are checked against the rest.
+        """
+        candidates: Iterable[Any] | None = None
+        remaining = dict(equals)
+        if self.primary_key in remaining:
+            found = self._records.get(remaining.pop(self.primary_key), MISSING)
+            candidates = () if found is MISSING else (found,)
+        else:
+            best = len(self._records) + 1
+            for name, value in equals.items():
+                if name in self.hash_indexes:
+                    bucket = self.hash_indexes[name].lookup(value)
+                    if len(bucket) < best:
+                        best, candidates = len(bucket), bucket.values()
+                elif name in self.range_indexes and value is not None:
+                    index = self.range_indexes[name]
+                    lo, hi = index.span(ge=value, le=value)
+                    if hi - lo < best:
+                        best = hi - lo
+                        candidates = map(self._records.__getitem__, index.keys[lo:hi])
+        if candidates is None:
+            candidates = self._records.values()
+        return [
+            instance
+            for instance in candidates
+            if all(getattr(instance, name, MISSING) == value for name, value in remaining.items())
+        ]
+
+    def range(
+        self, name: str, *, ge: Any = None, gt: Any = None, le: Any = None, lt: Any = None
+    ) -> Iterator[Any]:
+        """Yield instances whose range-indexed field name lies within the bounds, in order.
+
+        Bounds left as None are open; instances whose value is None or unset are skipped.
+        """
+        try:
+            index = self.range_indexes[name]
+        except KeyError:
+            raise KeyError(f"{self.schematic.__name__}.{name} has no range index") from None
+        lo, hi = index.span(ge=ge, gt=gt, le=le, lt=lt)
+        records = self._records
+        for key in index.keys[lo:hi]:
+            yield records[key]
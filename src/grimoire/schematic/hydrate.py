@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Final, Protocol
+from weakref import WeakKeyDictionary
+
+from .schematic import CLEAN, DIRTY_ATTR, _SchematicMeta
+
+DEFAULT_FETCH_SIZE: Final[int] = 1000
+
+type Hydrator = Callable[[Sequence[Any]], Any]
+
+_hydrators: WeakKeyDictionary[_SchematicMeta, dict[tuple[str, ...], Hydrator]] = (
+    WeakKeyDictionary()
+)
+
+
+class _Cursor(Protocol):
+    @property
+    def description(self) -> Any: ...
+
+    def fetchmany(self, size: int = ...) -> list[Any]: ...
+
+    def fetchall(self) -> list[Any]: ...
+
+
+def compile_hydrator(schematic: _SchematicMeta, columns: Sequence[str]) -> Hydrator:
+    """Return a function building a schematic instance from a row with the given column names.
+
+    The instance is created without running `__init__`: defaults, factories and
+    validation are skipped because rows come from a trusted store. Columns
+    that are not fields are ignored; fields without a column are left unset.
+    Hydrators are cached per schematic and column tuple.
+    """
+    columns = tuple(columns)
+    per_class = _hydrators.setdefault(schematic, {})
+    try:
+        return per_class[columns]
+    except KeyError:
+        pass
+
+    fields: dict[str, Any] = schematic.__field_nodes__  # type: ignore[attr-defined]
+    plain = schematic.__setattr__ is object.__setattr__  # type: ignore[comparison-overlap]
+    slotted = "__slots__" in vars(schematic)
+    namespace: dict[str, Any] = {
+        "__grimoire_cls__": schematic,
+        "__grimoire_new__": object.__new__,
+        "__grimoire_setattr__": object.__setattr__,
+        "__grimoire_clean__": CLEAN,
+    }
+    lines = ["def hydrate(row):", "    obj = __grimoire_new__(__grimoire_cls__)"]
+    for index, name in enumerate(columns):
+        if name not in fields:
+            continue
+        if plain:
+            lines.append(f"    obj.{name} = row[{index}]")
+        elif slotted:
+            namespace[f"__grimoire_set_{name}__"] = vars(schematic)[name].__set__
+            lines.append(f"    __grimoire_set_{name}__(obj, row[{index}])")
+        else:
+            lines.append(f"    __grimoire_setattr__(obj, {name!r}, row[{index}])")
+    if getattr(schematic, "__tracked__", False):
+        lines.append(f"    __grimoire_setattr__(obj, {DIRTY_ATTR!r}, __grimoire_clean__)")
+    lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    hydrator: Hydrator = namespace["hydrate"]
+    per_class[columns] = hydrator
+    return hydrator
+
+
+def cursor_columns(cursor: _Cursor) -> tuple[str, ...]:
+    return tuple(column[0] for column in cursor.description)
+
+
+def row_factory(schematic: _SchematicMeta) -> Callable[[Any, Sequence[Any]], Any]:
+    """Return a sqlite3 `row_factory` that yields schematic instances.
+
+    The hydrator is recompiled only when the cursor's description changes.
+    """
+    last_description: Any = None
+    hydrator: Hydrator | None = None
+
+    def factory(cursor: Any, row: Sequence[Any]) -> Any:
+        nonlocal last_description, hydrator
+        description = cursor.description
+        if description is not last_description or hydrator is None:
+            hydrator = compile_hydrator(schematic, cursor_columns(cursor))
+            last_description = description
+        return hydrator(row)
+
+    return factory
+
+
+def iter_hydrated(
+    schematic: _SchematicMeta, cursor: _Cursor, *, size: int = DEFAULT_FETCH_SIZE
+) -> Iterator[Any]:
+    """Lazily hydrate instances while streaming rows from cursor with fetchmany."""
+    hydrator = compile_hydrator(schematic, cursor_columns(cursor))
+    while rows := cursor.fetchmany(size):
+        yield from map(hydrator, rows)
+
+
+def fetch_hydrated(schematic: _SchematicMeta, cursor: _Cursor) -> list[Any]:
+    hydrator = compile_hydrator(schematic, cursor_columns(cursor))
+    return list(map(hydrator, cursor.fetchall()))
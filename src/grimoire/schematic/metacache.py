@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+from os import PathLike
+from pathlib import Path
+from typing import Any, Final, NamedTuple
+
+CACHE_VERSION: Final[int] = 1
+CACHE_ENV_VAR: Final[str] = "GRIMOIRE_METADATA_CACHE"
+
+
+class SchematicMetadata(NamedTuple):
+    """The derived, annotation-dependent parts of one schematic class.
+
+    flags holds each field's `TypeNode` flags in fields order.
+    """
+
+    fields: tuple[str, ...]
+    flags: tuple[int, ...]
+    total: bool
+    primary_key: str
+    defaults: frozenset[str]
+    default_factories: frozenset[str]
+    required: frozenset[str]
+    optional: frozenset[str]
+    readonly: frozenset[str]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            name: sorted(value) if isinstance(value, frozenset) else value
+            for name, value in self._asdict().items()
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> SchematicMetadata:
+        return cls(
+            fields=tuple(data["fields"]),
+            flags=tuple(data["flags"]),
+            total=bool(data["total"]),
+            primary_key=data["primary_key"],
+            defaults=frozenset(data["defaults"]),
+            default_factories=frozenset(data["default_factories"]),
+            required=frozenset(data["required"]),
+            optional=frozenset(data["optional"]),
+            readonly=frozenset(data["readonly"]),
+        )
+
+
+class MetadataCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    modules: int
+
+
+class _ModuleEntries:
+    __slots__ = ("classes", "dirty", "path")
+
+    def __init__(self, path: Path | None, classes: dict[str, dict[str, Any]]) -> None:
+        self.path: Path | None = path
+        self.classes: dict[str, dict[str, Any]] = classes
+        self.dirty: bool = False
+
+
+class MetadataCache:
+    """On-disk cache of `SchematicMetadata`, one JSON file per module source version.
+
+    Entries are keyed on the module name, the SHA-256 of its source file and
+    the class qualname, so editing a module invalidates its classes. Changes
+    to annotations imported from other modules are not detected; clear the
+    directory after changing such shared types. Classes defined outside a
+    source file (e.g. in `__main__` of a REPL) are never cached. New entries
+    are written by `flush`, which runs at interpreter exit.
+    """
+
+    def __init__(self, directory: str | PathLike[str]) -> None:
+        self.directory: Path = Path(directory)
+        self._modules: dict[str, _ModuleEntries] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def _entries(self, module: str) -> _ModuleEntries:
+        try:
+            return self._modules[module]
+        except KeyError:
+            pass
+        entries = _ModuleEntries(None, {})
+        source = getattr(sys.modules.get(module), "__file__", None)
+        if source is not None:
+            try:
+                digest = hashlib.sha256(Path(source).read_bytes()).hexdigest()
+            except OSError:
+                pass
+            else:
+                entries.path = self.directory / f"{module}-{digest[:32]}.json"
+                entries.classes = self._load(entries.path)
+        self._modules[module] = entries
+        return entries
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != [CACHE_VERSION, *sys.version_info[:2]]:
+            return {}
+        classes: dict[str, dict[str, Any]] = data.get("classes", {})
+        return classes
+
+    def get(self, cls: type) -> SchematicMetadata | None:
+        data = self._entries(cls.__module__).classes.get(cls.__qualname__)
+        if data is None:
+            self._misses += 1
+            return None
+        try:
+            metadata = SchematicMetadata.from_json(data)
+        except (KeyError, TypeError):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return metadata
+
+    def put(self, cls: type, metadata: SchematicMetadata) -> None:
+        entries = self._entries(cls.__module__)
+        if entries.path is None:
+            return
+        entries.classes[cls.__qualname__] = metadata.to_json()
+        entries.dirty = True
+
+    def flush(self) -> None:
+        """Write modules with new entries, atomically replacing their cache files."""
+        for entries in self._modules.values():
+            if not entries.dirty or entries.path is None:
+                continue
+            payload = {"version": [CACHE_VERSION, *sys.version_info[:2]], "classes": entries.classes}
+            temporary = entries.path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                temporary.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(temporary, entries.path)
+            except OSError:
+                temporary.unlink(missing_ok=True)
+                continue
+            entries.dirty = False
+
+    def cache_info(self) -> MetadataCacheInfo:
+        return MetadataCacheInfo(self._hits, self._misses, len(self._modules))
+
+
+_cache: MetadataCache | None = None
+
+
+def metadata_cache() -> MetadataCache | None:
+    return _cache
+
+
+def enable_metadata_cache(directory: str | PathLike[str]) -> MetadataCache:
+    """Cache derived schematic metadata under directory for classes created from now on.
+
+    Setting the GRIMOIRE_METADATA_CACHE environment variable to a directory
+    enables the cache before any schematic is defined.
+    """
+    global _cache
+    if _cache is not None:
+        _cache.flush()
+    _cache = MetadataCache(directory)
+    return _cache
+
+
+def disable_metadata_cache() -> None:
+    global _cache
+    if _cache is not None:
+        _cache.flush()
+    _cache = None
+
+
+def _flush_at_exit() -> None:
+    if _cache is not None:
+        _cache.flush()
+
+
+atexit.register(_flush_at_exit)
+
+if os.environ.get(CACHE_ENV_VAR):
+    enable_metadata_cache(os.environ[CACHE_ENV_VAR])
@@ -1,14 +1,22 @@
+from annotationlib import (
+    Format,
+    get_annotations,
+)
 from collections.abc import (
     Callable,
     Iterable,
     Iterator,
+    Mapping,
 )
 from dataclasses import (
     is_dataclass,
 )
-from enum import Enum
+from enum import (
+    Enum,
+    IntFlag,
+)
 from functools import (
-    cached_property,
+    lru_cache,
 )
 from inspect import (
     getattr_static,
@@ -20,6 +28,9 @@ from sys import (
 from sys import (
     _getframemodulename as get_frame_module_name,
 )
+from sys import (
+    modules as loaded_modules,
+)
 from types import (
     FunctionType,
     LambdaType,
@@ -31,6 +42,7 @@ from typing import (
     Annotated,
     Any,
     Final,
+    ForwardRef,
     Literal,
     NotRequired,
     Protocol,
@@ -46,6 +58,23 @@ from typing import (
     get_type_hints,
     runtime_checkable,
 )
+from weakref import (
+    WeakSet,
+)
+
+from ..data import (
+    introspect,
+)
+from ..data import (
+    iter_fields as iter_fields,
+)
+from ..data import (
+    validate_typeddict as validate_typeddict,
+)
+from .metacache import (
+    SchematicMetadata,
+    metadata_cache,
+)
 
 
 class MissingTypeAnnotationError(BaseException):
@@ -65,6 +94,11 @@ class MissingType(Enum):
 
 
 MISSING: Final[MissingType] = MissingType.MISSING
+INDEX_KINDS: Final[frozenset[str]] = frozenset({"hash", "range"})
+LAZY_ATTR: Final[str] = "__grimoire_lazy__"
+DIRTY_ATTR: Final[str] = "__grimoire_dirty__"
+CLEAN: Final[frozenset[str]] = frozenset()
+TYPENODE_CACHE_SIZE: Final[int] = 4096
 
 
 def get_module_name(obj: Any) -> str:
@@ -109,57 +143,15 @@ def caller_module_name(*, depth: int = 1, default: str = "__main__") -> str:
     return default
 
 
-def iter_fields[T](obj: T) -> Iterator[str]:
-    """Yield unique public field names discoverable from an object and its MRO.
-
-    Names are collected from the instance dict first, then each class in the
-    MRO via descriptors, annotations, slots, and remaining class dict keys,
-    with duplicates removed.
+def iter_type_annotations[T](obj: T | type[T]) -> Iterator[tuple[str, Any]]:
+    """Yield (name, type hint) for the public fields annotated on obj's class.
 
-    Respects encapsulation and avoids private namespaces.
+    Field order and hints come from the per-class `grimoire.data.introspect` cache.
     """
-    seen: set[str] = set()
-    objtype: type[T] = obj if isclass(obj) else type(obj)
-
-    def _is_public(name: str) -> bool:
-        return not name.startswith("_")
-
-    def _yield_new_public(*names: str) -> Iterator[str]:
-        for name in names:
-            if _is_public(name) and name not in seen:
-                seen.add(name)
-                yield name
-
-    def _is_valid_descriptor(value: Any) -> bool:
-        if isinstance(value, property):
-            return not getattr(value, "__isabstractmethod__", False)
-        has_get = callable(getattr(value, "__get__", None))
-        has_set_del = callable(getattr(value, "__set__", None)) or callable(
-            getattr(value, "__delete__", None)
-        )
-        return has_get and has_set_del
-
-    def _from_dict(o: Any) -> Iterator[str]:
-        yield from _yield_new_public(*getattr(o, "__dict__", {}).keys())
-
-    def _from_class(cls: type) -> Iterator[str]:
-        cls_vars = dict(vars(cls))
-        yield from _yield_new_public(*(n for n, v in cls_vars.items() if _is_valid_descriptor(v)))
-        yield from _yield_new_public(*getattr(cls, "__annotations__", {}))
-        slots = getattr(cls, "__slots__", ())
-        yield from _yield_new_public(*((slots,) if isinstance(slots, str) else slots))
-        yield from _yield_new_public(*cls_vars)
-
-    yield from _from_dict(obj)
-    for cls in objtype.__mro__:
-        yield from _from_class(cls)
-
-
-def iter_type_annotations[T](obj: T | type[T]) -> Iterator[tuple[str, Any]]:
     target: type[T] = obj if isinstance(obj, type) else type(obj)
-    hints: dict[str, Any] = {}
+    hints: Mapping[str, Any] = {}
     try:
-        hints = get_type_hints(target, include_extras=True)
+        hints = introspect(target).hints
     except TypeError as e:
         if "does not have annotations" in str(e):
             raise MissingTypeAnnotationError(get_type_name(obj), *iter_fields(obj)) from None
@@ -200,169 +192,320 @@ def construct_typeddict(
     optional_keys: Iterable[str] = (),
     readonly_keys: Iterable[str] = (),
 ) -> type[dict[str, Any]]:
-    return cast(
-        type[dict[str, Any]],
-        _TypedDictMeta(
-            name,
-            (),
-            {
-                "__annotations__": annotations,
-                "__module__": module,
-                "__orig_bases__": (TypedDict,),
-                "__total__": total,
-                "__required_keys__": frozenset(required_keys),
-                "__optional_keys__": frozenset(optional_keys),
-                "__readonly_keys__": frozenset(readonly_keys),
-            },
-        ),
+    # _TypedDictMeta derives the key sets from the annotations, so the
+    # explicitly requested ones are applied after construction.
+    spec = _TypedDictMeta(
+        name,
+        (),
+        {
+            "__annotations__": annotations,
+            "__module__": module,
+            "__orig_bases__": (TypedDict,),
+        },
+        total=total,
     )
+    spec.__required_keys__ = frozenset(required_keys)
+    spec.__optional_keys__ = frozenset(optional_keys)
+    spec.__readonly_keys__ = frozenset(readonly_keys)
+    return cast(type[dict[str, Any]], spec)
+
+
+class TypeFlag(IntFlag):
+    TYPE_ALIAS = 1 << 0
+    ANNOTATED = 1 << 1
+    UNION = 1 << 2
+    OPTIONAL = 1 << 3
+    LITERAL = 1 << 4
+    GENERIC = 1 << 5
+    CLASS = 1 << 6
+    DATACLASS = 1 << 7
+    READONLY = 1 << 8
+    REQUIRED = 1 << 9
+    NOT_REQUIRED = 1 << 10
+
+
+_TYPE_ALIAS: Final[int] = TypeFlag.TYPE_ALIAS.value
+_ANNOTATED: Final[int] = TypeFlag.ANNOTATED.value
+_UNION: Final[int] = TypeFlag.UNION.value
+_OPTIONAL: Final[int] = TypeFlag.OPTIONAL.value
+_LITERAL: Final[int] = TypeFlag.LITERAL.value
+_GENERIC: Final[int] = TypeFlag.GENERIC.value
+_CLASS: Final[int] = TypeFlag.CLASS.value
+_DATACLASS: Final[int] = TypeFlag.DATACLASS.value
+_READONLY: Final[int] = TypeFlag.READONLY.value
+_REQUIRED: Final[int] = TypeFlag.REQUIRED.value
+_NOT_REQUIRED: Final[int] = TypeFlag.NOT_REQUIRED.value
 
 
-def validate_typeddict(td: type[dict[str, Any]], data: dict[str, Any]) -> None:
-    hints = get_type_hints(td, include_extras=True)
-    required = td.__required_keys__
-
-    extra = data.keys() - hints.keys()
-    if extra:
-        raise TypeError(f"Unexpected keys: {extra}")
+class TypeNode:
+    """Decomposed view of one annotation.
 
-    missing = required - data.keys()
-    if missing:
-        raise TypeError(f"Missing required keys: {missing}")
+    Nodes are interned on the annotation object in an LRU cache of
+    `TYPENODE_CACHE_SIZE` entries, so structurally equal annotations share a
+    single node. Everything except `args` is computed
+    once at construction and stored in slots, with the boolean properties
+    packed into `flags`.
+    """
 
+    __slots__ = (
+        "_args",
+        "flags",
+        "inner_type",
+        "origin",
+        "target",
+        "values",
+    )
 
-class TypeNode:
-    def __init__(self, *, target: Any, parent: Any = MISSING) -> None:
-        self.target: Any = target
-        self.parent: Any = parent
+    target: Any
+    inner_type: Any
+    origin: Any | None
+    flags: int
+    values: tuple[Any, ...]
+    _args: tuple[TypeNode, ...] | None
+
+    def __new__(cls, target: Any) -> TypeNode:
+        if isinstance(target, (str, ForwardRef)):
+            # Unresolved annotations are transient; interning would only pin them.
+            return cls._build(target)
+        try:
+            return _intern_typenode(target)
+        except TypeError:
+            return cls._build(target)
+
+    @classmethod
+    def _build(cls, target: Any) -> TypeNode:
+        node = object.__new__(cls)
+        flags = 0
+        if isinstance(target, TypeAliasType):
+            flags |= _TYPE_ALIAS
+            inner = target.__value__
+        elif get_origin(target) is Annotated:
+            flags |= _ANNOTATED
+            inner = get_args(target)[0]
+        else:
+            inner = target
+        origin = get_origin(inner)
+
+        values: tuple[Any, ...] = ()
+        if origin is Union or origin is UnionType:
+            flags |= _UNION
+            values = get_args(inner)
+            if type(None) in values:
+                flags |= _OPTIONAL
+        elif origin is Literal:
+            flags |= _LITERAL
+            values = get_args(inner)
+        elif origin is not None:
+            flags |= _GENERIC
+        if isclass(origin):
+            flags |= _CLASS
+        if isinstance(target, type) and is_dataclass(target):
+            flags |= _DATACLASS
+        if origin is ReadOnly:
+            flags |= _READONLY
+        elif origin is Required:
+            flags |= _REQUIRED
+        elif origin is NotRequired:
+            flags |= _NOT_REQUIRED
+
+        node.target = target
+        node.inner_type = inner
+        node.origin = origin
+        node.flags = flags
+        node.values = values
+        node._args = None
+        return node
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.target!r})"
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        _intern_typenode.cache_clear()
 
-    @cached_property
+    @property
     def name(self) -> str | None:
-        if self.is_class or self.is_type_alias:
-            return self.target.__name__
+        if self.flags & (_CLASS | _TYPE_ALIAS):
+            return cast(str, self.target.__name__)
         return None
 
-    @cached_property
+    @property
     def is_generic(self) -> bool:
-        return self.origin is not None and not self.is_literal and not self.is_union
+        return bool(self.flags & _GENERIC)
 
-    @cached_property
+    @property
     def type_params(self) -> tuple[Any, ...]:
-        if self.is_type_alias:
-            return self.target.__type_params__
+        if self.flags & _TYPE_ALIAS:
+            return cast(tuple[Any, ...], self.target.__type_params__)
         return ()
 
-    @cached_property
+    @property
     def is_type_alias(self) -> bool:
-        return isinstance(self.target, TypeAliasType)
+        return bool(self.flags & _TYPE_ALIAS)
 
-    @cached_property
+    @property
     def is_class(self) -> bool:
-        return isclass(self.origin)
+        return bool(self.flags & _CLASS)
 
-    @cached_property
+    @property
     def is_dataclass(self) -> bool:
-        return isinstance(self.target, type) and is_dataclass(self.target)
+        return bool(self.flags & _DATACLASS)
 
-    @cached_property
+    @property
     def is_optional(self) -> bool:
-        return self.is_union and type(None) in self.union_values
+        return bool(self.flags & _OPTIONAL)
 
-    @cached_property
+    @property
     def option_values(self) -> tuple[Any, ...]:
-        if self.is_optional:
-            return tuple(arg for arg in self.union_values if arg is not type(None))
+        if self.flags & _OPTIONAL:
+            return tuple(arg for arg in self.values if arg is not type(None))
         return ()
 
-    @cached_property
+    @property
     def is_union(self) -> bool:
-        return self.origin is Union or self.origin is UnionType
+        return bool(self.flags & _UNION)
 
-    @cached_property
+    @property
     def union_values(self) -> tuple[Any, ...]:
-        if self.is_union:
-            return get_args(self.inner_type)
-        return ()
+        return self.values if self.flags & _UNION else ()
 
-    @cached_property
-    def inner_type(self) -> Any:
-        if self.is_annotated:
-            return get_args(self.target)[0]
-        elif self.is_type_alias:
-            return self.target.__value__
-        return self.target
-
-    @cached_property
+    @property
     def is_annotated(self) -> bool:
-        return get_origin(self.target) is Annotated
+        return bool(self.flags & _ANNOTATED)
 
-    @cached_property
+    @property
     def annotated_extras(self) -> tuple[Any, ...]:
-        if self.is_annotated:
-            return get_args(self._raw)[1:]
+        if self.flags & _ANNOTATED:
+            return get_args(self.target)[1:]
         return ()
 
-    @cached_property
+    @property
     def is_literal(self) -> bool:
-        return self.origin is Literal
+        return bool(self.flags & _LITERAL)
 
-    @cached_property
+    @property
     def literal_values(self) -> tuple[Any, ...]:
-        if self.is_literal:
-            return get_args(self.inner_type)
-        return ()
+        return self.values if self.flags & _LITERAL else ()
 
-    @cached_property
+    @property
     def is_readonly(self) -> bool:
-        return self.origin is ReadOnly
+        return bool(self.flags & _READONLY)
 
-    @cached_property
+    @property
     def is_required(self) -> bool:
-        return self.origin is Required
+        return bool(self.flags & _REQUIRED)
 
-    @cached_property
+    @property
     def is_not_required(self) -> bool:
-        return self.origin is NotRequired
+        return bool(self.flags & _NOT_REQUIRED)
 
-    @cached_property
-    def origin(self) -> Any | None:
-        return get_origin(self.inner_type)
-
-    @cached_property
+    @property
     def args(self) -> tuple[TypeNode, ...]:
-        if self.is_literal:
-            return ()
-        return tuple(TypeNode(self, a) for a in get_args(self.inner_type) if a is not type(None))
+        if self._args is None:
+            if self.flags & _LITERAL:
+                self._args = ()
+            else:
+                self._args = tuple(
+                    TypeNode(a) for a in get_args(self.inner_type) if a is not type(None)
+                )
+        return self._args
+
+
+@lru_cache(maxsize=TYPENODE_CACHE_SIZE, typed=True)
+def _intern_typenode(target: Any) -> TypeNode:
+    return TypeNode._build(target)
+
+
+typenode_cache_info = _intern_typenode.cache_info
 
 
 class FieldNode:
-    def __init__(self, default: Any, default_factory: Callable[[], Any] | MissingType) -> None:
+    def __init__(
+        self,
+        default: Any,
+        default_factory: Callable[[], Any] | MissingType,
+        primary_key: bool = False,
+        index: Literal["hash", "range"] | None = None,
+    ) -> None:
+        if index is not None and index not in INDEX_KINDS:
+            raise ValueError(f"index must be one of {sorted(INDEX_KINDS)} or None, got {index!r}")
         self.default: Any = default
         self.default_factory: Callable[[], Any] | MissingType = default_factory
+        self.primary_key: bool = primary_key
+        self.index: Literal["hash", "range"] | None = index
+        self._annotation: Any = MISSING
+        self._typenode: TypeNode | None = None
+        self._flags: int | None = None
 
     def __set_name__(self, owner: type[Any], name: str) -> None:
         self.name: str = name
-        self.annotation: Any = get_type_hints(owner, include_extras=True).get(self.name, Any)
-        self.typenode: TypeNode = TypeNode(target=self.annotation, parent=self)
+        self.owner: type[Any] = owner
         if not hasattr(owner, "__field_nodes__"):
             type.__setattr__(owner, "__field_nodes__", {})
         owner.__field_nodes__[self.name] = self
 
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        # Only reached when the field is missing from the instance __dict__.
+        if instance is None:
+            return self
+        lazy = instance.__dict__.get(LAZY_ATTR)
+        if lazy is not None:
+            lazy.load(self.name)
+            try:
+                return instance.__dict__[self.name]
+            except KeyError:
+                pass
+        raise AttributeError(
+            f"{type(instance).__name__!r} object has no attribute {self.name!r}"
+        )
+
+    @property
+    def annotation(self) -> Any:
+        """The resolved annotation, resolved for all fields of the owner on first access.
+
+        While a forward reference cannot be resolved yet, the `Format.FORWARDREF`
+        annotation is returned and resolution is retried on the next access.
+        """
+        if self._annotation is MISSING:
+            hints = _resolve_annotations(self.owner)
+            if self._annotation is MISSING:
+                return hints.get(self.name, Any)
+        return self._annotation
+
+    @property
+    def typenode(self) -> TypeNode:
+        if self._typenode is None:
+            node = TypeNode(self.annotation)
+            if self._annotation is MISSING:
+                return node
+            self._typenode = node
+        return self._typenode
+
+    @property
+    def flags(self) -> int:
+        """`TypeNode` flags of the annotation, possibly restored from the metadata cache."""
+        if self._flags is None:
+            flags = self.typenode.flags
+            if self._annotation is MISSING:
+                return flags
+            self._flags = flags
+        return self._flags
+
     @property
     def required(self) -> bool:
-        return self.typenode.is_required
+        return bool(self.flags & _REQUIRED)
 
     @property
     def not_required(self) -> bool:
-        return self.typenode.is_not_required
+        return bool(self.flags & _NOT_REQUIRED)
 
     @property
     def optional(self) -> bool:
-        return self.typenode.is_optional
+        return bool(self.flags & _OPTIONAL)
 
     @property
     def readonly(self) -> bool:
-        return self.typenode.is_readonly
+        return bool(self.flags & _READONLY)
 
     @property
     def has_default(self) -> bool:
@@ -373,16 +516,64 @@ class FieldNode:
         return self.default_factory is not MISSING
 
 
+def _has_forward_ref(annotation: Any) -> bool:
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    return any(_has_forward_ref(arg) for arg in get_args(annotation))
+
+
+def _resolve_each(owner: type[Any]) -> tuple[dict[str, Any], set[str]]:
+    globalns = getattr(loaded_modules.get(owner.__module__), "__dict__", {})
+    localns = dict(vars(owner))
+    hints: dict[str, Any] = {}
+    pending: set[str] = set()
+    for name, annotation in get_annotations(owner, format=Format.FORWARDREF).items():
+        if isinstance(annotation, str):
+            try:
+                annotation = eval(annotation, globalns, localns)
+            except NameError:
+                pass
+        if _has_forward_ref(annotation):
+            pending.add(name)
+        hints[name] = annotation
+    return hints, pending
+
+
+def _resolve_annotations(owner: type[Any]) -> dict[str, Any]:
+    """Resolve the owner's field annotations and store them on its field nodes.
+
+    If a forward reference is not defined yet, fields are resolved one by one
+    and the unresolved ones are returned in `Format.FORWARDREF` format without
+    being stored, so the next access retries them.
+    """
+    pending: set[str] = set()
+    try:
+        hints = get_type_hints(owner, include_extras=True)
+    except NameError:
+        hints, pending = _resolve_each(owner)
+    for name, fnode in owner.__field_nodes__.items():
+        if fnode._annotation is MISSING and name not in pending:
+            fnode._annotation = hints.get(name, Any)
+    return hints
+
+
 def fieldnode(
     *,
     default: Any = MISSING,
     default_factory: Callable[[], Any] | MissingType = MISSING,
     primary_key: bool = False,
+    index: Literal["hash", "range"] | None = None,
 ) -> FieldNode:
+    """Declare a schematic field.
+
+    index requests a secondary index on the field in a `SchematicCollection`:
+    "hash" for equality lookups, "range" for ordered range queries.
+    """
     return FieldNode(
         default=default,
         default_factory=default_factory,
         primary_key=primary_key,
+        index=index,
     )
 
 
@@ -397,6 +588,182 @@ class _SchematicProtocol(Protocol):
     __spec__: type[dict[str, Any]]
 
 
+def _spec_mismatch(cls_name: str) -> ValueError:
+    return ValueError(f"Provided keywords does not match specification as defined on {cls_name}")
+
+
+def _compile_init(
+    cls_name: str,
+    module: str,
+    field_names: Iterable[str],
+    defaults: dict[str, Any],
+    default_factories: dict[str, Callable[[], Any]],
+    required: Iterable[str],
+    closed: bool = True,
+    setters: dict[str, Callable[[Any, Any], None]] | None = None,
+    raw: bool = False,
+) -> Callable[..., None]:
+    """Generate a keyword-only `__init__` specialised to one schematic's fields.
+
+    Defaults are bound as parameter defaults, factories are called only for
+    omitted fields, and required/extra key checks are unrolled, so no spec
+    lookups happen per instantiation. Fields listed in setters are stored
+    through the given callable instead of attribute assignment; with raw=True
+    the others go through `object.__setattr__`, bypassing any class guard.
+    """
+    fields = tuple(field_names)
+    required_keys = frozenset(required)
+    self_name = "__grimoire_self__" if "self" in fields else "self"
+    namespace: dict[str, Any] = {
+        "__grimoire_missing__": MISSING,
+        "__grimoire_mismatch__": _spec_mismatch,
+        "__grimoire_cls_name__": cls_name,
+        "__grimoire_setattr__": object.__setattr__,
+    }
+
+    setters = setters or {}
+    for fname, setter in setters.items():
+        namespace[f"__grimoire_set_{fname}__"] = setter
+
+    def _assign(fname: str, value: str) -> str:
+        if fname in setters:
+            return f"__grimoire_set_{fname}__({self_name}, {value})"
+        if raw:
+            return f"__grimoire_setattr__({self_name}, {fname!r}, {value})"
+        return f"{self_name}.{fname} = {value}"
+
+    params: list[str] = []
+    checks: list[str] = []
+    body: list[str] = []
+    for fname in fields:
+        if fname in defaults:
+            namespace[f"__grimoire_default_{fname}__"] = defaults[fname]
+            params.append(f"{fname}=__grimoire_default_{fname}__")
+            body.append(f"    {_assign(fname, fname)}")
+            continue
+
+        params.append(f"{fname}=__grimoire_missing__")
+        if fname in default_factories:
+            namespace[f"__grimoire_factory_{fname}__"] = default_factories[fname]
+            body.append(
+                "    "
+                + _assign(
+                    fname,
+                    f"__grimoire_factory_{fname}__() if {fname} is __grimoire_missing__ else {fname}",
+                )
+            )
+        elif fname in required_keys:
+            checks.append(f"{fname} is __grimoire_missing__")
+            body.append(f"    {_assign(fname, fname)}")
+        else:
+            body.append(f"    if {fname} is not __grimoire_missing__:")
+            body.append(f"        {_assign(fname, fname)}")
+
+    params.append("**__grimoire_extra__")
+    if closed:
+        checks.insert(0, "__grimoire_extra__")
+    else:
+        body.append(f"    {self_name}.__dict__.update(__grimoire_extra__)")
+
+    signature = ", ".join((self_name, *(("*",) if fields else ()), *params))
+    lines = [f"def __init__({signature}) -> None:"]
+    if checks:
+        lines.append(f"    if {' or '.join(checks)}:")
+        lines.append("        raise __grimoire_mismatch__(__grimoire_cls_name__)")
+    lines.extend(body or ["    pass"])
+
+    exec("\n".join(lines), namespace)
+    init: Callable[..., None] = namespace["__init__"]
+    init.__qualname__ = f"{cls_name}.__init__"
+    init.__module__ = module
+    return init
+
+
+def _readonly_guards(
+    cls_name: str, readonly: frozenset[str]
+) -> tuple[Callable[[Any, str, Any], None], Callable[[Any, str], None]]:
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        if name in readonly:
+            raise AttributeError(f"{cls_name}.{name} is readonly")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self: Any, name: str) -> None:
+        if name in readonly:
+            raise AttributeError(f"{cls_name}.{name} is readonly")
+        object.__delattr__(self, name)
+
+    return __setattr__, __delattr__
+
+
+class FieldObserver(Protocol):
+    def field_changed(self, instance: Any, name: str) -> None: ...
+
+
+def _tracking_guards(
+    cls_name: str,
+    fields: frozenset[str],
+    readonly: frozenset[str],
+    observers: WeakSet[FieldObserver],
+) -> tuple[Callable[[Any, str, Any], None], Callable[[Any, str], None]]:
+    def _mark(self: Any, name: str) -> None:
+        dirty = getattr(self, DIRTY_ATTR, None)
+        if dirty is CLEAN:
+            object.__setattr__(self, DIRTY_ATTR, {name})
+        elif dirty is not None:
+            dirty.add(name)
+        if observers:
+            for observer in list(observers):
+                observer.field_changed(self, name)
+
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        if name in fields:
+            if name in readonly:
+                raise AttributeError(f"{cls_name}.{name} is readonly")
+            object.__setattr__(self, name, value)
+            _mark(self, name)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __delattr__(self: Any, name: str) -> None:
+        if name in readonly:
+            raise AttributeError(f"{cls_name}.{name} is readonly")
+        object.__delattr__(self, name)
+        if name in fields:
+            _mark(self, name)
+
+    return __setattr__, __delattr__
+
+
+def observe_fields(schematic: type[Any], observer: FieldObserver) -> None:
+    """Call observer.field_changed(instance, name) after each field assignment or deletion.
+
+    Only tracked schematics route assignments through a hook; observers are
+    held weakly.
+    """
+    if not getattr(schematic, "__tracked__", False):
+        raise TypeError(f"{schematic.__name__} is not tracked; declare it with tracked=True")
+    schematic.__field_observers__.add(observer)
+
+
+def is_tracked(instance: Any) -> bool:
+    return bool(getattr(type(instance), "__tracked__", False))
+
+
+def dirty_fields(instance: Any) -> frozenset[str] | None:
+    """Return the fields changed since instance was loaded or saved.
+
+    None means the instance was constructed rather than loaded, so it has no
+    stored counterpart to diff against.
+    """
+    dirty = getattr(instance, DIRTY_ATTR, None)
+    return None if dirty is None else frozenset(dirty)
+
+
+def mark_clean(instance: Any) -> None:
+    if is_tracked(instance):
+        object.__setattr__(instance, DIRTY_ATTR, CLEAN)
+
+
 class _SchematicMeta(type):
     def __new__(
         mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any
@@ -408,32 +775,17 @@ class _SchematicMeta(type):
     ) -> type:
         super().__init__(name, bases, namespace, **kwargs)
 
-    def __call__(cls, **kwargs: Any) -> ...:
-        data = cls.__defaults__.copy()
-        for field, factory in cls.__default_factories__.items():
-            data[field] = factory()
-        data.update(kwargs)
-        try:
-            validate_typeddict(cls.__spec__, data)
-        except TypeError:
-            raise ValueError(
-                f"Provided keywords does not match specification as defined on {cls.__name__}"
-            ) from None
-        new_instance = cls.__new__()  # type: ignore[call-arg]
-        new_instance.__dict__.update(data)
-        return new_instance
-
-    @cached_property
+    @property
     def required_keys(cls) -> frozenset[str]:
         assert hasattr(cls, "__spec__")
         return cast(frozenset[str], cls.__spec__.__required_keys__)
 
-    @cached_property
+    @property
     def optional_keys(cls) -> frozenset[str]:
         assert hasattr(cls, "__spec__")
         return cast(frozenset[str], cls.__spec__.__optional_keys__)
 
-    @cached_property
+    @property
     def readonly_keys(cls) -> frozenset[str]:
         assert hasattr(cls, "__spec__")
         return cast(frozenset[str], cls.__spec__.__readonly_keys__)
@@ -441,24 +793,40 @@ class _SchematicMeta(type):
 
 @dataclass_transform(field_specifiers=(FieldNode, fieldnode))
 def schematic(
-    cls: type[_SchematicProtocol], total: bool = False, closed: bool = True
+    cls: type[_SchematicProtocol] | None = None,
+    total: bool = False,
+    closed: bool = True,
+    *,
+    slots: bool = False,
+    tracked: bool = False,
+) -> _SchematicMeta | Callable[[type[_SchematicProtocol]], _SchematicMeta]:
+    """Turn an annotated class with `fieldnode` fields into a schematic.
+
+    With slots=True the fields are stored in `__slots__` instead of a
+    per-instance `__dict__`, and readonly keys are rejected on assignment.
+    With tracked=True, assignments to fields are recorded as dirty (see
+    `dirty_fields`) and readonly keys are rejected for either layout.
+    """
+
+    def wrap(cls: type[_SchematicProtocol]) -> _SchematicMeta:
+        return _process_schematic(cls, total, closed, slots, tracked)
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def _process_schematic(
+    cls: type[_SchematicProtocol], total: bool, closed: bool, slots: bool, tracked: bool
 ) -> _SchematicMeta:
     namespace: dict[str, Any] = dict(vars(cls))
+    field_nodes: dict[str, FieldNode] = namespace["__field_nodes__"]
 
     defaults: dict[str, Any] = {}
     default_factories: dict[str, Callable[[], Any]] = {}
-
-    required: set[str] = set()
-    optional: set[str] = set()
-    readonly: set[str] = set()
-
-    annotations: dict[str, Any] = {}
-
     primary_key: tuple[str, FieldNode] | None = None
 
-    for fname, fnode in namespace["__field_nodes__"].items():
-        annotations[fname] = fnode.type
-
+    for fname, fnode in field_nodes.items():
         if fnode.primary_key:
             if primary_key is not None:
                 raise RedundantParamaterError("primary_key", 2)
@@ -470,22 +838,72 @@ def schematic(
         elif fnode.has_default_factory:
             default_factories[fname] = fnode.default_factory
 
-        if fnode.required or (total is True and not fnode.not_required):
-            required.add(fname)
-        if fnode.optional:
-            optional.add(fname)
-        if fnode.readonly:
-            readonly.add(fname)
-
     if not primary_key:
         raise ValueError(f"{cls.__name__} missing primary_key")
 
+    cache = metadata_cache()
+    cached = cache.get(cls) if cache is not None else None
+    if cached is not None and (
+        cached.fields != tuple(field_nodes)
+        or cached.total != total
+        or cached.primary_key != primary_key[0]
+        or cached.defaults != defaults.keys()
+        or cached.default_factories != default_factories.keys()
+    ):
+        cached = None
+
+    # Annotations are only read in FORWARDREF format here and fully resolved
+    # on first use of FieldNode.annotation; stringified ones (PEP 563) still
+    # need resolving to derive their flags.
+    own = get_annotations(cls, format=Format.FORWARDREF)
+    annotations: dict[str, Any] = {
+        fname: own[fname] if fname in own else fnode.annotation
+        for fname, fnode in field_nodes.items()
+    }
+    if cached is not None:
+        for fnode, flags in zip(field_nodes.values(), cached.flags, strict=True):
+            fnode._flags = flags
+        required, optional, readonly = (
+            set(cached.required),
+            set(cached.optional),
+            set(cached.readonly),
+        )
+    else:
+        required, optional, readonly = set(), set(), set()
+        for fname, fnode in field_nodes.items():
+            annotation = annotations[fname]
+            if fnode._flags is None and not isinstance(annotation, str):
+                fnode._flags = TypeNode(annotation).flags
+            if fnode.required or (total is True and not fnode.not_required):
+                required.add(fname)
+            if fnode.optional:
+                optional.add(fname)
+            if fnode.readonly:
+                readonly.add(fname)
+            if fnode._annotation is not MISSING:
+                annotations[fname] = fnode._annotation
+        if cache is not None and all(fnode._flags is not None for fnode in field_nodes.values()):
+            cache.put(
+                cls,
+                SchematicMetadata(
+                    fields=tuple(field_nodes),
+                    flags=tuple(fnode.flags for fnode in field_nodes.values()),
+                    total=total,
+                    primary_key=primary_key[0],
+                    defaults=frozenset(defaults),
+                    default_factories=frozenset(default_factories),
+                    required=frozenset(required),
+                    optional=frozenset(optional),
+                    readonly=frozenset(readonly),
+                ),
+            )
+
     namespace["__field_nodes__"] = cls.__field_nodes__
     namespace["__total__"] = total
     namespace["__defaults__"] = defaults
     namespace["__default_factories__"] = default_factories
     namespace["__annotations__"] = annotations
-    namespace["__primary_key__"] = ()
+    namespace["__primary_key__"] = primary_key
     namespace["__spec__"] = construct_typeddict(
         name=f"{cls.__name__}Spec",
         module=cls.__module__,
@@ -495,10 +913,64 @@ def schematic(
         readonly_keys=readonly,
     )
 
-    schematic: _SchematicMeta = _SchematicMeta(
-        name=cls.__name__,
-        bases=cls.__bases__,
-        namespace=namespace,
-    )
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__tracked__"] = tracked
+
+    fields = frozenset(cls.__field_nodes__)
+    frozen = frozenset(readonly)
+    if tracked:
+        observers: WeakSet[FieldObserver] = WeakSet()
+        namespace["__field_observers__"] = observers
+        namespace["__setattr__"], namespace["__delattr__"] = _tracking_guards(
+            cls.__name__, fields, frozen, observers
+        )
 
+    if not slots:
+        if tracked:
+            namespace[DIRTY_ATTR] = None
+        namespace["__init__"] = _compile_init(
+            cls.__name__,
+            cls.__module__,
+            cls.__field_nodes__,
+            defaults,
+            default_factories,
+            required,
+            closed,
+            raw=tracked,
+        )
+        schematic: _SchematicMeta = _SchematicMeta(cls.__name__, cls.__bases__, namespace)
+        return schematic
+
+    if not closed:
+        raise ValueError(f"{cls.__name__} cannot use slots=True with closed=False")
+
+    for fname in cls.__field_nodes__:
+        namespace.pop(fname, None)
+    namespace["__slots__"] = (*cls.__field_nodes__, *((DIRTY_ATTR,) if tracked else ()))
+
+    if frozen and not tracked:
+        namespace["__setattr__"], namespace["__delattr__"] = _readonly_guards(
+            cls.__name__, frozen
+        )
+
+    schematic = _SchematicMeta(cls.__name__, cls.__bases__, namespace)
+    type.__setattr__(
+        schematic,
+        "__init__",
+        _compile_init(
+            cls.__name__,
+            cls.__module__,
+            cls.__field_nodes__,
+            defaults,
+            default_factories,
+            required,
+            closed,
+            setters=(
+                {fname: vars(schematic)[fname].__set__ for fname in cls.__field_nodes__}
+                if frozen or tracked
+                else None
+            ),
+        ),
+    )
     return schematic
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import struct
+from array import (
+    array,
+)
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from multiprocessing.shared_memory import (
+    SharedMemory,
+)
+from typing import (
+    Any,
+    Final,
+    NamedTuple,
+    overload,
+)
+
+from .codec import (
+    _TAGGED_FLOAT,
+    _TAGGED_INT,
+    _TAGGED_SIZE,
+    TAG_FLOAT,
+    TAG_INT,
+    _decode_value,
+    record_layout,
+)
+from .schematic import (
+    MISSING,
+    _SchematicMeta,
+)
+
+_COUNT: Final[struct.Struct] = struct.Struct("=Q")
+OFFSET_TYPECODE: Final[str] = "Q"
+ENCODE_CHUNK_SIZE: Final[int] = 1 << 20
+FIXED_TAGS_SIZE: Final[dict[int, int]] = {TAG_INT: _TAGGED_INT.size, TAG_FLOAT: _TAGGED_FLOAT.size}
+
+
+class SharedBatchHandle(NamedTuple):
+    """Picklable reference to (a slice of) a `SharedBatch`; pass it to workers instead of records."""
+
+    name: str
+    schematic: _SchematicMeta
+    count: int
+    start: int = 0
+    stop: int = -1
+    allow_pickle: bool = False
+
+    @property
+    def bounds(self) -> tuple[int, int]:
+        return (self.start, self.count if self.stop < 0 else self.stop)
+
+    def partition(self, parts: int) -> list[SharedBatchHandle]:
+        """Split this handle's records into up to parts contiguous, non-empty slices."""
+        start, stop = self.bounds
+        total = stop - start
+        parts = max(1, min(parts, total))
+        size, extra = divmod(total, parts)
+        handles: list[SharedBatchHandle] = []
+        for part in range(parts):
+            end = start + size + (part < extra)
+            handles.append(self._replace(start=start, stop=end))
+            start = end
+        return handles
+
+
+class SharedBatch:
+    """Records of one schematic class published into a `SharedMemory` segment.
+
+    The segment holds a record count, a table of record offsets and the
+    records in the `RecordLayout` binary format, so workers attaching through
+    `handle` read them in place. The publishing side owns the segment:
+    `close` (or leaving the with block) releases and unlinks it. With
+    allow_pickle=True, field values the codec cannot pack natively are
+    pickled, and workers attaching through `handle` unpickle them.
+
+    Records are encoded twice, once to size the segment and once into it;
+    an iterable that is not a sequence is collected into a list first.
+    """
+
+    def __init__(
+        self,
+        schematic: _SchematicMeta,
+        records: Iterable[Any],
+        *,
+        name: str | None = None,
+        allow_pickle: bool = False,
+    ) -> None:
+        encode_into = record_layout(schematic).encode_into
+        if not isinstance(records, Sequence):
+            records = list(records)
+        # Size the segment in a first pass, then encode again straight into it,
+        # so peak memory is the segment plus one chunk, not twice the payload.
+        offsets = array(OFFSET_TYPECODE, [0])
+        scratch = bytearray()
+        for record in records:
+            encode_into(scratch, record, allow_pickle)
+            offsets.append(offsets[-1] + len(scratch))
+            scratch.clear()
+        count = len(offsets) - 1
+        table = _COUNT.size + offsets.itemsize * len(offsets)
+
+        self.shm: SharedMemory = SharedMemory(name=name, create=True, size=table + offsets[-1])
+        try:
+            buf = self.shm.buf
+            _COUNT.pack_into(buf, 0, count)
+            buf[_COUNT.size : table] = offsets.tobytes()
+            position = table
+            for index, record in enumerate(records, 1):
+                encode_into(scratch, record, allow_pickle)
+                if position - table + len(scratch) != offsets[index]:
+                    raise RuntimeError(f"record {index - 1} changed while it was being published")
+                if len(scratch) >= ENCODE_CHUNK_SIZE or index == count:
+                    buf[position : position + len(scratch)] = scratch
+                    position += len(scratch)
+                    scratch.clear()
+        except BaseException:
+            self.shm.close()
+            self.shm.unlink()
+            raise
+        self.handle: SharedBatchHandle = SharedBatchHandle(
+            self.shm.name, schematic, count, allow_pickle=allow_pickle
+        )
+
+    def __len__(self) -> int:
+        return self.handle.count
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> SharedBatch:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _skip_value(view: memoryview, offset: int) -> int:
+    tag = view[offset]
+    try:
+        return offset + FIXED_TAGS_SIZE[tag]
+    except KeyError:
+        pass
+    if tag < TAG_INT:
+        return offset + 1
+    return offset + _TAGGED_SIZE.size + _TAGGED_SIZE.unpack_from(view, offset)[1]
+
+
+class SharedRecords(Sequence[Any]):
+    """Read-only, attached view of the records behind a `SharedBatchHandle`.
+
+    Indexing decodes whole instances; `field` and `column` read single fields
+    straight from shared memory. Instances and field values are copies, so
+    nothing returned keeps the segment mapped once the view is closed.
+    """
+
+    def __init__(self, handle: SharedBatchHandle) -> None:
+        self.handle: SharedBatchHandle = handle
+        self._shm: SharedMemory = SharedMemory(name=handle.name, track=False)
+        self._view: memoryview = memoryview(self._shm.buf)
+        count: int = _COUNT.unpack_from(self._view, 0)[0]
+        table = _COUNT.size + array(OFFSET_TYPECODE).itemsize * (count + 1)
+        self._offsets: memoryview = self._view[_COUNT.size : table].cast(OFFSET_TYPECODE)
+        self._base: int = table
+        self._start, self._stop = handle.bounds
+        self._layout = layout = record_layout(handle.schematic)
+
+        codes = layout.fixed.format[1 : 1 + len(layout.fixed_names)]
+        self._fixed: dict[str, tuple[int, int, struct.Struct]] = {
+            name: (bit, struct.calcsize(f"<{codes[:bit]}"), struct.Struct(f"<{codes[bit]}"))
+            for bit, name in enumerate(layout.fixed_names)
+        }
+        self._var: dict[str, int] = {name: index for index, name in enumerate(layout.var_names)}
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def _offset(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("shared record index out of range")
+        return self._base + self._offsets[self._start + index]
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offset = self._offset(index)
+        return self._layout.decode_from(self._view, offset, self.handle.allow_pickle)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        decode_from, view = self._layout.decode_from, self._view
+        base, offsets = self._base, self._offsets
+        allow_pickle = self.handle.allow_pickle
+        for position in range(self._start, self._stop):
+            yield decode_from(view, base + offsets[position], allow_pickle)[0]
+
+    def _read(self, offset: int, name: str) -> Any:
+        layout = self._layout
+        try:
+            bit, field_offset, reader = self._fixed[name]
+        except KeyError:
+            pass
+        else:
+            bitmap = offset + layout.fixed.size - layout.bitmap_size
+            if self._view[bitmap + (bit >> 3)] >> (bit & 7) & 1:
+                return MISSING
+            return reader.unpack_from(self._view, offset + field_offset)[0]
+        try:
+            position = self._var[name]
+        except KeyError:
+            raise AttributeError(f"{layout.schematic.__name__} has no field {name!r}") from None
+        offset += layout.fixed.size
+        for _ in range(position):
+            offset = _skip_value(self._view, offset)
+        return _decode_value(
+            self._view, offset, layout.nested.get(name), self.handle.allow_pickle
+        )[0]
+
+    def field(self, index: int, name: str) -> Any:
+        """Read one field of one record in place, raising AttributeError if it is unset."""
+        value = self._read(self._offset(index), name)
+        if value is MISSING:
+            raise AttributeError(f"{self._layout.schematic.__name__}.{name} is not set")
+        return value
+
+    def column(self, name: str, default: Any = None) -> Iterator[Any]:
+        """Yield one field of every record, read in place; unset fields yield default."""
+        base, offsets = self._base, self._offsets
+        for position in range(self._start, self._stop):
+            value = self._read(base + offsets[position], name)
+            yield default if value is MISSING else value
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._view.release()
+        self._shm.close()
+
+    def __enter__(self) -> SharedRecords:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def attach(handle: SharedBatchHandle) -> SharedRecords:
+    return SharedRecords(handle)
+
+
+def run_attached[T](
+    job: Callable[..., T], handle: SharedBatchHandle, *args: Any, **kwargs: Any
+) -> T:
+    """Attach to handle, call job(records, *args, **kwargs) and detach again.
+
+    This is the worker-side entry point used by `JobExecutor.map_shared`; job
+    must be picklable and must not return the records view itself.
+    """
+    with SharedRecords(handle) as records:
+        return job(records, *args, **kwargs)
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import csv
+import json
+import mmap
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import (
+    contextmanager,
+)
+from itertools import (
+    batched,
+)
+from os import (
+    PathLike,
+)
+from typing import (
+    IO,
+    Any,
+    Final,
+)
+
+from ..data import (
+    validate_typeddict_batch,
+)
+from .batch import (
+    TYPECODES,
+    unwrap_nullable,
+)
+from .schematic import (
+    MISSING,
+    FieldNode,
+    _SchematicMeta,
+)
+
+DEFAULT_CHUNK_SIZE: Final[int] = 1000
+TRUE_CELLS: Final[frozenset[str]] = frozenset({"1", "true", "True", "TRUE"})
+# Quote every cell but None, so a quoted "" reads back as an empty string and
+# an unquoted empty cell as a missing value.
+CSV_FORMAT: Final[dict[str, Any]] = {"quoting": csv.QUOTE_NOTNULL}
+
+type Source = str | PathLike[str] | IO[Any]
+type Row = tuple[int, dict[str, Any]]
+
+
+@contextmanager
+def _opened(source: Source, mode: str, **open_kwargs: Any) -> Iterator[IO[Any]]:
+    if isinstance(source, (str, PathLike)):
+        with open(source, mode, **open_kwargs) as file:
+            yield file
+    else:
+        yield source
+
+
+def _instances(schematic: _SchematicMeta, rows: Iterable[Row], chunk_size: int) -> Iterator[Any]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    spec = schematic.__spec__  # type: ignore[attr-defined]
+    for chunk in batched(rows, chunk_size):
+        report = validate_typeddict_batch(spec, (row for _, row in chunk))
+        if not report.ok:
+            index, missing, unexpected = report.errors[0]
+            raise ValueError(
+                f"Row on line {chunk[index][0]} does not match {spec.__name__}: "
+                f"missing keys {sorted(missing)}, unexpected keys {sorted(unexpected)}"
+            )
+        for _, row in chunk:
+            yield schematic(**row)
+
+
+def _field_values(schematic: _SchematicMeta, record: Any) -> Iterator[tuple[str, Any]]:
+    """Yield (name, value) for each field of record in `__field_nodes__` order, MISSING if unset."""
+    field_nodes: dict[str, FieldNode] = schematic.__field_nodes__  # type: ignore[attr-defined]
+    if isinstance(record, Mapping):
+        for name in field_nodes:
+            yield (name, record.get(name, MISSING))
+        return
+    for name, fnode in field_nodes.items():
+        value = getattr(record, name, MISSING)
+        yield (name, MISSING if value is fnode else value)
+
+
+def _json_default(value: Any) -> Any:
+    schematic = type(value)
+    if hasattr(schematic, "__field_nodes__"):
+        return {
+            name: item
+            for name, item in _field_values(schematic, value)  # type: ignore[arg-type]
+            if item is not MISSING
+        }
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {schematic.__name__} is not JSON serializable")
+
+
+def _mmap_lines(file: IO[bytes]) -> Iterator[bytes]:
+    """Yield the lines of a file by scanning a read-only memory map for newlines."""
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return  # empty file
+    with mapped:
+        start, end = 0, len(mapped)
+        while start < end:
+            stop = mapped.find(b"\n", start)
+            if stop == -1:
+                stop = end
+            yield mapped[start:stop]
+            start = stop + 1
+
+
+def iter_ndjson_rows(source: Source, *, use_mmap: bool = True) -> Iterator[Row]:
+    """Yield (line number, object) for every non-blank line of an NDJSON source.
+
+    Paths are memory-mapped and split on newlines when use_mmap is set;
+    open file objects are read line by line.
+    """
+    mapped = use_mmap and isinstance(source, (str, PathLike))
+    with _opened(source, "rb") as file:
+        lines: Iterable[bytes | str] = _mmap_lines(file) if mapped else file
+        for line_number, line in enumerate(lines, 1):
+            if line.strip():
+                yield (line_number, json.loads(line))
+
+
+def iter_ndjson(
+    schematic: _SchematicMeta,
+    source: Source,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = True,
+) -> Iterator[Any]:
+    """Stream schematic instances from an NDJSON file, one JSON object per line.
+
+    Rows are read and key-checked chunk_size at a time, so memory use does
+    not grow with the file. A row whose keys do not match the schematic's
+    `__spec__` raises ValueError naming its line.
+    """
+    yield from _instances(schematic, iter_ndjson_rows(source, use_mmap=use_mmap), chunk_size)
+
+
+def write_ndjson(schematic: _SchematicMeta, records: Iterable[Any], destination: Source) -> int:
+    """Write records (instances or mappings) as NDJSON and return the number written.
+
+    Keys follow `__field_nodes__` order; unset fields are omitted and None is written as null.
+    """
+    written = 0
+    with _opened(destination, "w", encoding="utf-8") as file:
+        for record in records:
+            row = {
+                name: value
+                for name, value in _field_values(schematic, record)
+                if value is not MISSING
+            }
+            file.write(json.dumps(row, separators=(",", ":"), default=_json_default))
+            file.write("\n")
+            written += 1
+    return written
+
+
+def _parse_bool(cell: str) -> bool:
+    return cell in TRUE_CELLS
+
+
+def _cell_codec(fnode: FieldNode | None) -> tuple[Callable[[str], Any], Callable[[Any], str], Any]:
+    """Return (decode, encode, empty) for one CSV column.
+
+    empty is the value an unquoted empty cell decodes to: None for optional
+    fields, "" for plain string fields, and MISSING (leave the field unset)
+    otherwise. A quoted empty cell decodes to "" for string fields and to
+    empty for the rest. Values that are not str, int, float or bool are
+    stored as JSON text.
+    """
+    if fnode is None:
+        return (str, str, MISSING)
+    node, nullable = unwrap_nullable(fnode.typenode)
+    target = node.inner_type
+    empty: Any = None if nullable else MISSING
+    if target is str:
+        return (str, str, None if nullable else "")
+    if target is bool:
+        return (_parse_bool, str, empty)
+    if target in TYPECODES:
+        return (target, str, empty)
+    return (json.loads, lambda value: json.dumps(value, default=_json_default), empty)
+
+
+def iter_csv_rows(schematic: _SchematicMeta, source: Source, **fmtparams: Any) -> Iterator[Row]:
+    """Yield (line number, row dict) for every record of a CSV file with a header row.
+
+    Cells are decoded from each column's field annotation; see `_cell_codec`
+    for how empty cells are read. Blank lines are skipped and a record whose
+    cell count differs from the header raises ValueError naming its line.
+    Quoting defaults to `csv.QUOTE_NOTNULL`, as written by `write_csv`.
+    """
+    field_nodes: dict[str, FieldNode] = schematic.__field_nodes__  # type: ignore[attr-defined]
+    with _opened(source, "r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file, **(CSV_FORMAT | fmtparams))
+        header = next(reader, None)
+        if header is None:
+            return
+        codecs = [(name, *_cell_codec(field_nodes.get(name))) for name in header]
+        for cells in reader:
+            if not cells:
+                continue
+            if len(cells) != len(codecs):
+                raise ValueError(
+                    f"Row on line {reader.line_num} has {len(cells)} cells, "
+                    f"expected {len(codecs)}"
+                )
+            row: dict[str, Any] = {}
+            for (name, decode, _, empty), cell in zip(codecs, cells, strict=True):
+                # Under QUOTE_NOTNULL an unquoted empty cell arrives as None.
+                if cell or (cell == "" and decode is str):
+                    row[name] = decode(cell)
+                elif empty is not MISSING:
+                    row[name] = empty
+            yield (reader.line_num, row)
+
+
+def iter_csv(
+    schematic: _SchematicMeta,
+    source: Source,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **fmtparams: Any,
+) -> Iterator[Any]:
+    """Stream schematic instances from a CSV file whose header names the fields.
+
+    CSV records may span lines, so rows are parsed by the `csv` module rather
+    than the memory-mapped line splitter used by `iter_ndjson`.
+    """
+    yield from _instances(schematic, iter_csv_rows(schematic, source, **fmtparams), chunk_size)
+
+
+def write_csv(
+    schematic: _SchematicMeta, records: Iterable[Any], destination: Source, **fmtparams: Any
+) -> int:
+    """Write records as CSV with a header of `__field_nodes__` names; return the number written.
+
+    None and unset fields are written as unquoted empty cells and every other
+    cell is quoted (`csv.QUOTE_NOTNULL`), so an empty string survives the
+    round trip through `iter_csv`.
+    """
+    field_nodes: dict[str, FieldNode] = schematic.__field_nodes__  # type: ignore[attr-defined]
+    encoders = [_cell_codec(fnode)[1] for fnode in field_nodes.values()]
+    written = 0
+    with _opened(destination, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, **(CSV_FORMAT | fmtparams))
+        writer.writerow(field_nodes)
+        for record in records:
+            writer.writerow(
+                [
+                    None if value is None or value is MISSING else encode(value)
+                    for encode, (_, value) in zip(
+                        encoders, _field_values(schematic, record), strict=True
+                    )
+                ]
+            )
+            written += 1
+    return written
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from functools import (
+    lru_cache,
+)
+from inspect import (
+    isclass,
+)
+from threading import (
+    local,
+)
+from types import (
+    TypeAliasType,
+)
+from typing import (
+    Any,
+    ClassVar,
+    Final,
+    ForwardRef,
+    NotRequired,
+    ReadOnly,
+    Required,
+    TypeVar,
+    get_args,
+)
+from weakref import (
+    WeakKeyDictionary,
+)
+
+from .schematic import (
+    MISSING,
+    FieldNode,
+    TypeNode,
+    _SchematicMeta,
+)
+
+type Checker = Callable[[Any], bool]
+
+QUALIFIERS: Final[frozenset[Any]] = frozenset({ClassVar, Final, NotRequired, ReadOnly, Required})
+NUMERIC_TOWER: Final[dict[type, tuple[type, ...]]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+UNCHECKED_ITERABLES: Final[tuple[str, ...]] = ("Iterable", "Iterator", "Generator", "AsyncIterable")
+
+CHECKER_CACHE_SIZE: Final[int] = 4096
+
+_schematic_checkers: WeakKeyDictionary[_SchematicMeta, dict[str, Checker]] = WeakKeyDictionary()
+
+# Type aliases whose checker is being compiled on this thread, each with a
+# cell that receives the finished checker. A recursive alias refers back to
+# itself through the cell instead of compiling forever.
+_compiling: local = local()
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+def _isinstance_checker(types: tuple[type, ...]) -> Checker:
+    def check(value: Any) -> bool:
+        return isinstance(value, types)
+
+    return check
+
+
+def _classinfo(tp: Any) -> tuple[type, ...] | None:
+    """Return the isinstance() classinfo for a plain class annotation, or None."""
+    if tp is None or tp is type(None):
+        return (type(None),)
+    if not isclass(tp):
+        return None
+    try:
+        isinstance(None, tp)
+    except TypeError:
+        return None
+    return NUMERIC_TOWER.get(tp, (tp,))
+
+
+def _compile_literal(values: tuple[Any, ...]) -> Checker:
+    try:
+        allowed = frozenset((type(v), v) for v in values)
+    except TypeError:
+        pairs = tuple((type(v), v) for v in values)
+        return lambda value: (type(value), value) in pairs
+
+    def check(value: Any) -> bool:
+        try:
+            return (type(value), value) in allowed
+        except TypeError:
+            return False
+
+    return check
+
+
+def _compile_union(members: tuple[Any, ...]) -> Checker:
+    classinfos = [_classinfo(member) for member in members]
+    if all(info is not None for info in classinfos):
+        return _isinstance_checker(tuple(t for info in classinfos for t in info))  # type: ignore[union-attr]
+    checkers = tuple(compile_checker(member) for member in members)
+    return lambda value: any(check(value) for check in checkers)
+
+
+def _compile_generic(node: TypeNode) -> Checker:
+    origin = node.origin
+    args = get_args(node.inner_type)
+
+    if origin is type:
+        bound = _classinfo(args[0]) if args else None
+        if bound is None:
+            return lambda value: isinstance(value, type)
+        return lambda value: isinstance(value, type) and issubclass(value, bound)
+
+    if not isclass(origin):
+        return _accept_any
+    if origin.__name__ == "Callable" or not args:
+        return _isinstance_checker((origin,))
+    if origin.__name__ in UNCHECKED_ITERABLES:
+        return _isinstance_checker((origin,))
+
+    if issubclass(origin, tuple):
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = compile_checker(args[0])
+            return lambda value: isinstance(value, origin) and all(item(v) for v in value)
+        items = tuple(compile_checker(arg) for arg in args)
+        return lambda value: (
+            isinstance(value, origin)
+            and len(value) == len(items)
+            and all(check(v) for check, v in zip(items, value, strict=True))
+        )
+
+    if issubclass(origin, Mapping) and len(args) == 2:
+        key, val = compile_checker(args[0]), compile_checker(args[1])
+        return lambda value: isinstance(value, origin) and all(
+            key(k) and val(v) for k, v in value.items()
+        )
+
+    if issubclass(origin, Iterable) and len(args) == 1:
+        item = compile_checker(args[0])
+        return lambda value: isinstance(value, origin) and all(item(v) for v in value)
+
+    return _isinstance_checker((origin,))
+
+
+def _alias_cells() -> dict[TypeAliasType, list[Checker]]:
+    try:
+        cells: dict[TypeAliasType, list[Checker]] = _compiling.aliases
+    except AttributeError:
+        cells = _compiling.aliases = {}
+    return cells
+
+
+def _compile_alias(node: TypeNode) -> Checker:
+    cells = _alias_cells()
+    cell: list[Checker] = []
+    cells[node.target] = cell
+    try:
+        checker = _compile(TypeNode(node.inner_type))
+    finally:
+        del cells[node.target]
+    cell.append(checker)
+    return checker
+
+
+def _compile(node: TypeNode) -> Checker:
+    while node.origin in QUALIFIERS:
+        args = get_args(node.inner_type)
+        if not args:
+            return _accept_any
+        node = TypeNode(args[0])
+    if node.is_type_alias:
+        return _compile_alias(node)
+
+    target = node.inner_type
+    if target is Any or target is object:
+        return _accept_any
+    if isinstance(target, (str, ForwardRef, TypeVar)):
+        return _accept_any
+    if node.is_literal:
+        return _compile_literal(node.literal_values)
+    if node.is_union:
+        return _compile_union(node.union_values)
+    if node.origin is not None:
+        return _compile_generic(node)
+
+    classinfo = _classinfo(target)
+    if classinfo is None:
+        return _accept_any
+    return _isinstance_checker(classinfo)
+
+
+def compile_checker(annotation: Any) -> Checker:
+    """Return a predicate that tests whether a value conforms to annotation.
+
+    The annotation's TypeNode tree is walked once and the resulting checker is
+    kept in an LRU cache of `CHECKER_CACHE_SIZE` annotations. Parts that cannot
+    be checked at runtime (TypeVars, forward references, non-runtime
+    protocols) accept any value. Recursive type aliases are supported.
+    """
+    if isinstance(annotation, (str, ForwardRef)):
+        return _accept_any
+    if isinstance(annotation, TypeAliasType):
+        cell = _alias_cells().get(annotation)
+        if cell is not None:
+            return lambda value: cell[0](value)
+    try:
+        return _cached_checker(annotation)
+    except TypeError:
+        return _compile(TypeNode(annotation))
+
+
+@lru_cache(maxsize=CHECKER_CACHE_SIZE, typed=True)
+def _cached_checker(annotation: Any) -> Checker:
+    return _compile(TypeNode(annotation))
+
+
+checker_cache_info = _cached_checker.cache_info
+checker_cache_clear = _cached_checker.cache_clear
+
+
+def schematic_checkers(schematic: _SchematicMeta) -> dict[str, Checker]:
+    try:
+        return _schematic_checkers[schematic]
+    except KeyError:
+        pass
+    field_nodes: dict[str, FieldNode] = schematic.__field_nodes__  # type: ignore[attr-defined]
+    checkers = {name: compile_checker(fnode.annotation) for name, fnode in field_nodes.items()}
+    # Fields with still-unresolved forward references are recompiled next time.
+    if all(fnode._annotation is not MISSING for fnode in field_nodes.values()):
+        _schematic_checkers[schematic] = checkers
+    return checkers
+
+
+def iter_value_errors(
+    schematic: _SchematicMeta, values: Mapping[str, Any] | Any
+) -> Iterator[tuple[str, Any]]:
+    """Yield (field name, value) for every present field whose value fails its annotation.
+
+    values may be a mapping or a schematic instance; absent fields are skipped.
+    """
+    checkers = schematic_checkers(schematic)
+    if isinstance(values, Mapping):
+        getter: Callable[[str], Any] = lambda name: values.get(name, MISSING)  # noqa: E731
+    else:
+        getter = lambda name: getattr(values, name, MISSING)  # noqa: E731
+    for name, check in checkers.items():
+        value = getter(name)
+        if value is MISSING or isinstance(value, FieldNode):
+            continue
+        if not check(value):
+            yield (name, value)
+
+
+def validate_values(schematic: _SchematicMeta, values: Mapping[str, Any] | Any) -> None:
+    errors = dict(iter_value_errors(schematic, values))
+    if errors:
+        raise TypeError(f"Values do not match annotations on {schematic.__name__}: {errors}")
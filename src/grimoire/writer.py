@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from os import PathLike
+from queue import Empty, SimpleQueue
+from typing import Any, Final, NamedTuple
+
+from .base import SQL
+from .concurrency import ensure_async
+from .db import (
+    DEFAULT_PRAGMAS,
+    connect,
+    record_items,
+)
+
+DEFAULT_MAX_GROUP: Final[int] = 1000
+
+
+class _Write(NamedTuple):
+    sql: str
+    params: tuple[Any, ...]
+    future: asyncio.Future[int]
+    loop: asyncio.AbstractEventLoop
+
+
+def _resolve(future: asyncio.Future[int], result: int | BaseException) -> None:
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+class AsyncWriter:
+    """Funnel writes from coroutines through one dedicated SQLite writer thread.
+
+    Each `write` composes its statement with `SQL.compose`, queues it and
+    awaits a future that resolves to the affected row count once the
+    transaction containing it commits. The writer thread drains up to
+    max_group queued writes per transaction (group commit). If a group fails,
+    its writes are retried one per transaction so only the failing ones error.
+    If the thread itself fails (say the database cannot be opened), every
+    pending write fails with that error and the writer closes.
+    """
+
+    def __init__(
+        self,
+        database: str | PathLike[str],
+        *,
+        max_group: int = DEFAULT_MAX_GROUP,
+        pragmas: Mapping[str, str | int] = DEFAULT_PRAGMAS,
+        **connect_kwargs: Any,
+    ) -> None:
+        self.database: str | PathLike[str] = database
+        self.max_group: int = max_group
+        self.pragmas: dict[str, str | int] = dict(pragmas)
+        self._connect_kwargs: dict[str, Any] = connect_kwargs
+        self._queue: SimpleQueue[_Write | None] = SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._closed: bool = False
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="grimoire-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _drain(self, first: _Write) -> tuple[list[_Write], bool]:
+        group = [first]
+        while len(group) < self.max_group:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is None:
+                return group, True
+            group.append(item)
+        return group, False
+
+    def _commit(self, conn: sqlite3.Connection, group: list[_Write]) -> list[int]:
+        conn.execute("BEGIN")
+        try:
+            counts = [max(conn.execute(w.sql, w.params).rowcount, 0) for w in group]
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT (e.g. a deferred constraint) leaves the transaction open.
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return counts
+
+    @staticmethod
+    def _notify(write: _Write, result: int | BaseException) -> None:
+        try:
+            write.loop.call_soon_threadsafe(_resolve, write.future, result)
+        except RuntimeError:
+            pass  # The caller's loop is closed; nobody is waiting for this write.
+
+    def _fail(self, error: BaseException, group: Iterable[_Write] = ()) -> None:
+        """Close the writer and fail group and every write still queued with error."""
+        with self._lock:
+            self._closed = True
+            self._error = error
+            pending = list(group)
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is not None:
+                    pending.append(item)
+        for write in pending:
+            self._notify(write, error)
+
+    def _run(self) -> None:
+        try:
+            conn = connect(
+                self.database, pragmas=self.pragmas, autocommit=True, **self._connect_kwargs
+            )
+        except BaseException as e:
+            self._fail(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        group: list[_Write] = []
+        try:
+            stopping = False
+            while not stopping:
+                first = self._queue.get()
+                if first is None:
+                    break
+                group, stopping = self._drain(first)
+                try:
+                    counts = self._commit(conn, group)
+                except Exception:
+                    for write in group:
+                        try:
+                            result: int | BaseException = self._commit(conn, [write])[0]
+                        except Exception as e:
+                            result = e
+                        self._notify(write, result)
+                    continue
+                for write, count in zip(group, counts, strict=True):
+                    self._notify(write, count)
+        except BaseException as e:
+            # Writes of group that were already resolved ignore the second result.
+            self._fail(e, group)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            conn.close()
+
+    async def execute(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[int] = loop.create_future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("writer is closed") from self._error
+            self.start()
+            self._queue.put(_Write(sql, params, future, loop))
+        return await future
+
+    async def write(self, verb: SQL, table: str, record: Any) -> int:
+        """Queue verb for record (a mapping or schematic instance) and wait for its commit."""
+        return await self.execute(*verb.compose(table, record_items(record)))
+
+    async def insert(self, table: str, record: Any) -> int:
+        return await self.write(SQL.INSERT_INTO, table, record)
+
+    async def replace(self, table: str, record: Any) -> int:
+        return await self.write(SQL.REPLACE_INTO, table, record)
+
+    async def delete(self, table: str, key_values: Mapping[str, Any]) -> int:
+        return await self.write(SQL.DELETE_FROM_WHERE, table, key_values)
+
+    async def aclose(self) -> None:
+        """Commit everything already queued, then stop the writer thread."""
+        with self._lock:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(None)
+        if self._thread is not None:
+            await ensure_async(self._thread.join)
+
+    async def __aenter__(self) -> AsyncWriter:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
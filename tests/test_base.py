@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+
+from grimoire.base import SQL, Statement, statement_cache_clear, statement_cache_info
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Iterator[None]:
+    statement_cache_clear()
+    yield
+    statement_cache_clear()
+
+
+def test_prepare_reuses_statements() -> None:
+    first = SQL.INSERT_INTO.prepare("items", ["id", "name"])
+    assert SQL.INSERT_INTO.prepare("items", ("id", "name")) is first
+    assert SQL.INSERT_INTO.prepare("items", ("name", "id")) is not first
+    info = statement_cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    ("verb", "sql"),
+    [
+        (SQL.INSERT_INTO, 'INSERT INTO "items" ("id") VALUES (?)'),
+        (SQL.REPLACE_INTO, 'REPLACE INTO "items" ("id") VALUES (?)'),
+        (SQL.IGNORE_INTO, 'INSERT OR IGNORE INTO "items" ("id") VALUES (?)'),
+        (SQL.DELETE_FROM_WHERE, 'DELETE FROM "items" WHERE "id" = ?'),
+        (SQL.SELECT_FROM_WHERE, 'SELECT * FROM "items" WHERE "id" = ?'),
+    ],
+)
+def test_compose_single_key(verb: SQL, sql: str) -> None:
+    assert verb.compose("items", {"id": 1}) == (sql, (1,))
+
+
+def test_compose_composite_key() -> None:
+    assert SQL.SELECT_FROM_WHERE.compose("items", {"a": 1, "b": 2}) == (
+        'SELECT * FROM "items" WHERE ("a", "b") = (?, ?)',
+        (1, 2),
+    )
+
+
+def test_identifiers_are_escaped() -> None:
+    sql, _ = SQL.INSERT_INTO.compose('odd"table', {'we"ird\x00': 1})
+    assert sql == 'INSERT INTO "odd""table" ("we""ird") VALUES (?)'
+
+
+def test_compose_update() -> None:
+    assert SQL.UPDATE_SET_WHERE.compose_update("items", {"name": "x", "n": 2}, {"id": 1}) == (
+        'UPDATE "items" SET "name" = ?, "n" = ? WHERE "id" = ?',
+        ("x", 2, 1),
+    )
+    with pytest.raises(ValueError, match="at least one"):
+        SQL.UPDATE_SET_WHERE.compose_update("items", {}, {"id": 1})
+    with pytest.raises(ValueError, match="not an update verb"):
+        SQL.INSERT_INTO.compose_update("items", {"name": "x"}, {"id": 1})
+
+
+def test_statement_binds_in_key_order() -> None:
+    statement = SQL.INSERT_INTO.prepare("items", ("id", "name"))
+    assert statement.bind({"name": "x", "id": 1}) == (1, "x")
+    assert statement.bind_object(SimpleNamespace(id=2, name="y")) == (2, "y")
+    assert SQL.DELETE_FROM_WHERE.prepare("items", ("id",)).bind({"id": 3}) == (3,)
+
+
+def test_statement_requires_keys() -> None:
+    with pytest.raises(ValueError, match="at least one key"):
+        Statement(SQL.INSERT_INTO, "items", ())
+
+
+def test_compose_in_chunks_under_the_limit() -> None:
+    pairs = list(SQL.DELETE_FROM_WHERE_IN.compose_in("items", ("id",), range(7), max_params=3))
+    assert [params for _, params in pairs] == [(0, 1, 2), (3, 4, 5), (6,)]
+    assert pairs[0][0] == 'DELETE FROM "items" WHERE "id" IN (?, ?, ?)'
+
+
+def test_compose_in_pads_short_chunks_to_a_power_of_two() -> None:
+    ((sql, params),) = SQL.SELECT_FROM_WHERE_IN.compose_in("items", ("id",), [1, 2, 3])
+    assert sql == 'SELECT * FROM "items" WHERE "id" IN (?, ?, ?, ?)'
+    assert params == (1, 2, 3, 3)
+    for count in range(1, 200):
+        list(SQL.SELECT_FROM_WHERE_IN.compose_in("items", ("id",), range(count)))
+    assert statement_cache_info().currsize == 9
+
+
+def test_compose_in_composite_keys() -> None:
+    ((sql, params),) = SQL.SELECT_COLUMNS_FROM_WHERE_IN.compose_in(
+        "items", ("a", "b"), [(1, 2), {"a": 3, "b": 4}, (5, 6)], columns=("a",)
+    )
+    assert sql == (
+        'SELECT "a" FROM "items" WHERE ("a", "b") IN (VALUES (?, ?), (?, ?), (?, ?), (?, ?))'
+    )
+    assert params == (1, 2, 3, 4, 5, 6, 5, 6)
+    with pytest.raises(ValueError, match="2 key values"):
+        list(SQL.SELECT_FROM_WHERE_IN.compose_in("items", ("a", "b"), [(1,)]))
+    with pytest.raises(ValueError, match="not a set verb"):
+        list(SQL.INSERT_INTO.compose_in("items", ("a",), [1]))
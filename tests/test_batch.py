@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from grimoire.schematic.batch import SchematicBatch
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class Reading:
+    id: int = fieldnode(primary_key=True)
+    score: int = fieldnode()
+    ratio: float | None = fieldnode(default=None)
+    active: bool = fieldnode(default=True)
+    label: str = fieldnode()
+
+
+def test_numeric_columns_use_arrays() -> None:
+    batch = SchematicBatch(Reading, [Reading(id=1, score=3, ratio=0.5, label="a")])
+    assert batch.column("id").typecode == "q"  # type: ignore[attr-defined]
+    assert batch.column("ratio").typecode == "d"  # type: ignore[attr-defined]
+    assert isinstance(batch.column("label"), list)
+    row = batch[0]
+    assert (row.id, row.score, row.ratio, row.active, row.label) == (1, 3, 0.5, True, "a")
+
+
+def test_unset_numeric_field_is_not_null() -> None:
+    batch = SchematicBatch(Reading)
+    batch.append(Reading(id=1))
+    batch.append({"id": 2, "score": 7, "ratio": None})
+
+    first, second = batch
+    with pytest.raises(AttributeError, match="score"):
+        _ = first.score
+    assert first.as_dict() == {"id": 1, "ratio": None, "active": True}
+    assert second.ratio is None and second.score == 7
+    assert list(batch.iter_column("score", default=-1)) == [-1, 7]
+    assert list(batch.iter_column("label")) == [None, None]
+
+
+def test_materialize_leaves_unset_fields_unset() -> None:
+    batch = SchematicBatch(Reading, [Reading(id=1, label="x")])
+    (record,) = batch.materialize()
+    assert record.label == "x"
+    assert "score" not in vars(record)
+
+
+def test_failed_append_rolls_back_every_column() -> None:
+    batch = SchematicBatch(Reading, [Reading(id=index) for index in range(8)])
+    with pytest.raises(TypeError):
+        batch.append({"id": 8, "score": "not a number"})
+    for index in range(8, 20):
+        batch.append({"id": index, "score": index})
+    assert len(batch) == 20
+    assert batch[19].score == 19
+    assert list(batch.iter_column("score"))[7:9] == [None, 8]
+
+
+def test_missing_required_field_is_rejected() -> None:
+    @schematic(total=True)
+    class Strict:
+        id: int = fieldnode(primary_key=True)
+        score: int = fieldnode()
+
+    batch = SchematicBatch(Strict)
+    with pytest.raises(ValueError):
+        batch.append({"id": 1})
+    assert len(batch) == 0
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from grimoire.schematic.codec import (
+    decode,
+    decode_many,
+    encode,
+    encode_many,
+    record_layout,
+)
+from grimoire.schematic.schematic import dirty_fields, fieldnode, schematic
+
+
+@schematic
+class Point:
+    id: int = fieldnode(primary_key=True)
+    x: float = fieldnode(default=0.0)
+    visible: bool = fieldnode(default=True)
+
+
+@schematic
+class Label:
+    id: str = fieldnode(primary_key=True)
+    text: str = fieldnode()
+    data: bytes | None = fieldnode(default=None)
+
+
+@schematic(tracked=True)
+class Shape:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+    origin: Point = fieldnode()
+    weight: int | None = fieldnode(default=None)
+    extra: object = fieldnode(default=None)
+
+
+def test_fixed_and_variable_parts() -> None:
+    layout = record_layout(Shape)
+    assert layout.fixed_names == ("id",)
+    assert layout.var_names == ("name", "origin", "weight", "extra")
+    assert record_layout(Label).fixed_names == ()
+
+
+def test_round_trip() -> None:
+    shape = Shape(id=1, name="tri", origin=Point(id=9, x=1.5), weight=-(1 << 40))
+    decoded = decode(Shape, encode(shape))
+    assert (decoded.id, decoded.name, decoded.weight, decoded.extra) == (1, "tri", -(1 << 40), None)
+    assert (decoded.origin.id, decoded.origin.x, decoded.origin.visible) == (9, 1.5, True)
+    assert dirty_fields(decoded) is None
+
+
+def test_layout_without_fixed_fields() -> None:
+    label = decode(Label, encode(Label(id="a", text="ü", data=b"\x00\x01")))
+    assert (label.id, label.text, label.data) == ("a", "ü", b"\x00\x01")
+    assert decode(Label, encode(Label(id="b"))).data is None
+
+
+def test_unset_fields_stay_unset() -> None:
+    point = decode(Point, encode(Point(id=1)))
+    assert point.x == 0.0
+    partial = decode(Label, encode(Label(id="c")))
+    assert "text" not in vars(partial)
+    bare = object.__new__(Point)
+    bare.id = 2
+    assert vars(decode(Point, encode(bare))) == {"id": 2}
+
+
+def test_many_records() -> None:
+    points = [Point(id=i, x=i / 2, visible=i % 2 == 0) for i in range(5)]
+    decoded = decode_many(Point, encode_many(Point, points))
+    assert [(p.id, p.x, p.visible) for p in decoded] == [(p.id, p.x, p.visible) for p in points]
+    assert decode_many(Point, encode_many(Point, [])) == []
+
+
+def test_pickle_is_opt_in_on_both_sides() -> None:
+    shape = Shape(id=1, name="s", origin=Point(id=2), extra=Decimal("1.5"))
+    with pytest.raises(TypeError, match="allow_pickle"):
+        encode(shape)
+    with pytest.raises(TypeError, match="allow_pickle"):
+        encode(Shape(id=1, name="s", origin=Point(id=2), weight=1 << 64))
+    data = encode(shape, allow_pickle=True)
+    with pytest.raises(ValueError, match="allow_pickle"):
+        decode(Shape, data)
+    assert decode(Shape, data, allow_pickle=True).extra == Decimal("1.5")
+    many = encode_many(Shape, [shape], allow_pickle=True)
+    with pytest.raises(ValueError, match="allow_pickle"):
+        decode_many(Shape, many)
+    assert decode_many(Shape, many, allow_pickle=True)[0].extra == Decimal("1.5")
+
+
+def test_fixed_fields_must_fit() -> None:
+    with pytest.raises(ValueError, match="Point"):
+        encode(Point(id=1 << 64))
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+
+from grimoire.schematic.collection import SchematicCollection
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic(tracked=True)
+class Person:
+    id: int = fieldnode(primary_key=True)
+    city: str = fieldnode(index="hash")
+    age: int | None = fieldnode(index="range", default=None)
+    name: str = fieldnode(default="")
+
+
+@schematic(tracked=True, slots=True)
+class Badge:
+    id: int = fieldnode(primary_key=True)
+    level: int = fieldnode(index="range")
+
+
+def people() -> SchematicCollection:
+    return SchematicCollection(
+        Person,
+        [
+            Person(id=1, city="Oslo", age=30),
+            {"id": 2, "city": "Rome", "age": 25},
+            Person(id=3, city="Oslo"),
+            Person(id=4, city="Lima", age=41),
+        ],
+    )
+
+
+def test_where_and_range() -> None:
+    collection = people()
+    assert sorted(p.id for p in collection.where(city="Oslo")) == [1, 3]
+    assert [p.id for p in collection.where(city="Oslo", age=30)] == [1]
+    assert [p.id for p in collection.where(id=2, city="Oslo")] == []
+    assert [p.id for p in collection.range("age", ge=25, lt=41)] == [2, 1]
+    assert [p.id for p in collection.range("age")] == [2, 1, 4]
+    with pytest.raises(KeyError, match="name"):
+        next(collection.range("name"))
+
+
+def test_duplicate_keys_in_one_extend() -> None:
+    collection = SchematicCollection(
+        Person, [Person(id=1, city="Oslo", age=30), Person(id=1, city="Rome", age=20)]
+    )
+    collection.extend([Person(id=2, city="Lima", age=50), Person(id=2, city="Lima", age=10)])
+    assert len(collection) == 2
+    assert [p.id for p in collection.where(city="Oslo")] == []
+    assert [(p.id, p.age) for p in collection.range("age")] == [(2, 10), (1, 20)]
+
+
+def test_failed_extend_keeps_range_indexes_current() -> None:
+    collection = people()
+    with pytest.raises(ValueError, match="keywords"):
+        collection.extend([Person(id=5, city="Oslo", age=20), {"id": 6, "shoe": 44}])
+    assert [p.id for p in collection.range("age", lt=30)] == [5, 2]
+    collection.remove(5)
+    collection.remove(1)
+    assert [p.id for p in collection.range("age")] == [2, 4]
+
+
+def test_assignment_keeps_indexes_current() -> None:
+    collection = people()
+    member = collection.get(1)
+    member.city = "Rome"
+    member.age = 99
+    assert sorted(p.id for p in collection.where(city="Rome")) == [1, 2]
+    assert [p.id for p in collection.range("age", gt=40)] == [4, 1]
+    del member.age
+    assert [p.id for p in collection.range("age")] == [2, 4]
+
+    outsider = Person(id=1, city="Kyiv")
+    outsider.city = "Oslo"
+    assert [p.id for p in collection.where(city="Oslo")] == [3]
+
+
+def test_slotted_members_are_tracked_too() -> None:
+    collection = SchematicCollection(Badge, [Badge(id=i, level=i) for i in range(3)])
+    collection.get(0).level = 10
+    assert [b.id for b in collection.range("level")] == [1, 2, 0]
+
+
+def test_remove_update_and_discard() -> None:
+    collection = people()
+    collection.update(2, city="Oslo")
+    assert sorted(p.id for p in collection.where(city="Oslo")) == [1, 2, 3]
+    assert collection.remove(1).id == 1
+    collection.discard(1)
+    assert 1 not in collection
+    assert [p.id for p in collection.range("age")] == [2, 4]
+
+
+def test_indexed_schematics_must_be_tracked() -> None:
+    @schematic
+    class Untracked:
+        id: int = fieldnode(primary_key=True)
+        city: str = fieldnode(index="hash")
+
+    @schematic
+    class Plain:
+        id: int = fieldnode(primary_key=True)
+
+    with pytest.raises(TypeError, match="tracked=True"):
+        SchematicCollection(Untracked)
+    assert SchematicCollection(Plain, [Plain(id=1)]).get(1).id == 1
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine, Iterator
+from functools import partial
+from typing import Any
+
+import pytest
+
+from grimoire.concurrency import Coalescer, JobExecutor, ensure_async
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+async def adouble(value: int) -> int:
+    await asyncio.sleep(0)
+    return value * 2
+
+
+async def test_ensure_async_accepts_every_job_kind() -> None:
+    assert await ensure_async(double, 1) == 2
+    assert await ensure_async(adouble, 2) == 4
+    assert await ensure_async(adouble(3)) == 6
+    with pytest.raises(TypeError):
+        ensure_async(42)  # type: ignore[arg-type]
+
+
+async def test_sync_jobs_run_on_private_threads() -> None:
+    async with JobExecutor(max_workers=2, thread_name_prefix="private") as executor:
+        name = await executor.run(lambda: threading.current_thread().name)
+    assert name.startswith("private")
+
+
+async def test_concurrency_is_bounded() -> None:
+    active = peak = 0
+
+    async def job() -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+
+    async with JobExecutor(max_concurrency=2) as executor:
+        await executor.gather(*(job for _ in range(8)))
+    assert peak == 2
+
+
+async def test_gather_keeps_order_and_cancels_on_failure() -> None:
+    started: list[int] = []
+
+    async def slow() -> None:
+        started.append(1)
+        await asyncio.sleep(10)
+
+    async def fail() -> None:
+        raise LookupError
+
+    async with JobExecutor() as executor:
+        assert await executor.gather(adouble(1), adouble(2), adouble(3)) == [2, 4, 6]
+        with pytest.raises(LookupError):
+            await executor.gather(slow, fail)
+        await asyncio.sleep(0)
+        assert started == [1]
+        assert all(task.cancelled() for task in executor._tasks)
+
+
+async def test_streams_pull_jobs_lazily() -> None:
+    pulled: list[int] = []
+
+    def jobs() -> Iterator[partial[Coroutine[Any, Any, int]]]:
+        for value in range(100):
+            pulled.append(value)
+            yield partial(adouble, value)
+
+    async with JobExecutor(max_concurrency=2) as executor:
+        stream = executor.as_completed(jobs())
+        assert await anext(stream) % 2 == 0
+        assert len(pulled) < 10
+        await stream.aclose()  # type: ignore[attr-defined]
+        mapped = [value async for value in executor.map(double, range(5))]
+        assert sorted(mapped) == [0, 2, 4, 6, 8]
+
+
+async def test_shutdown_rejects_new_jobs() -> None:
+    executor = JobExecutor()
+    await executor.shutdown()
+    with pytest.raises(RuntimeError, match="shut down"):
+        await executor.run(double, 1)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        JobExecutor(max_concurrency=0)
+
+
+async def test_coalescer_batches_concurrent_loads() -> None:
+    calls: list[list[int]] = []
+
+    async def load(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    coalescer: Coalescer[int, int] = Coalescer(load, max_batch_size=3, window=0.01)
+    assert await coalescer.load_many([1, 2, 2, 3, 4]) == [10, 20, 20, 30, 40]
+    assert calls == [[1, 2, 3], [4]]
+
+
+async def test_coalescer_accepts_mappings_and_sync_jobs() -> None:
+    coalescer: Coalescer[str, int] = Coalescer(lambda keys: {k: len(k) for k in keys if k})
+    assert await coalescer.load("abc") == 3
+    with pytest.raises(KeyError):
+        await coalescer.load("")
+
+
+async def test_coalescer_fails_every_waiter_of_a_failed_batch() -> None:
+    def broken(keys: list[int]) -> list[int]:
+        raise LookupError(keys)
+
+    coalescer: Coalescer[int, int] = Coalescer(broken)
+    results = await asyncio.gather(coalescer.load(1), coalescer.load(2), return_exceptions=True)
+    assert [type(result) for result in results] == [LookupError, LookupError]
+
+    short: Coalescer[int, int] = Coalescer(lambda keys: keys[:1])
+    with pytest.raises(ValueError, match="1 values for 2 keys"):
+        await short.load_many([1, 2])
+    with pytest.raises(ValueError, match="max_batch_size"):
+        Coalescer(broken, max_batch_size=0)
+
+
+async def test_coalescer_runs_on_an_executor() -> None:
+    async with JobExecutor(thread_name_prefix="coalesce") as executor:
+        coalescer: Coalescer[int, str] = Coalescer(
+            lambda keys: [threading.current_thread().name for _ in keys], executor=executor
+        )
+        assert (await coalescer.load(1)).startswith("coalesce")
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import gc
+from collections.abc import Iterator
+from typing import Required, TypedDict
+
+import pytest
+
+from grimoire.data import (
+    RowKeyError,
+    introspect,
+    introspection_cache_info,
+    invalidate_introspection,
+    iter_attributes,
+    iter_fields,
+    iter_type_annotations,
+    reset_introspection_cache_info,
+    validate_typeddict_batch,
+)
+from grimoire.schematic import schematic as schematic_module
+
+
+class Base:
+    base_value: int = 1
+
+    @property
+    def computed(self) -> int:
+        return self.base_value * 2
+
+
+class Child(Base):
+    child_value: str = "c"
+    __slots__ = ("slotted",)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Iterator[None]:
+    invalidate_introspection()
+    reset_introspection_cache_info()
+    yield
+    invalidate_introspection()
+
+
+def test_iter_fields_order() -> None:
+    assert list(iter_fields(Child)) == ["child_value", "slotted", "computed", "base_value"]
+    instance = Base()
+    instance.extra = 3  # type: ignore[attr-defined]
+    assert list(iter_fields(instance))[:2] == ["extra", "computed"]
+
+
+def test_iter_attributes_reads_values() -> None:
+    assert dict(iter_attributes(Base())) == {"computed": 2, "base_value": 1}
+
+
+def test_iter_type_annotations_uses_hints() -> None:
+    assert dict(iter_type_annotations(Child, strict=False))["child_value"] is str
+
+
+def test_schematic_helpers_use_the_cache() -> None:
+    assert schematic_module.iter_fields is iter_fields
+    assert dict(schematic_module.iter_type_annotations(Child)) == {"child_value": str}
+    assert dict(schematic_module.iter_attributes(Base())) == {"computed": 2, "base_value": 1}
+    assert introspection_cache_info().misses == 2
+
+
+def test_cache_hits_and_misses() -> None:
+    first = introspect(Child)
+    assert introspect(Child) is first
+    info = introspection_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    list(iter_fields(Child))
+    assert introspection_cache_info().hits == 2
+
+
+def test_entries_are_evicted_with_their_class() -> None:
+    def make() -> type:
+        class Temporary:
+            value: int = 0
+
+        return Temporary
+
+    cls = make()
+    introspect(cls)
+    assert introspection_cache_info().currsize == 1
+    del cls
+    gc.collect()
+    assert introspection_cache_info().currsize == 0
+
+
+def test_invalidate_drops_subclasses() -> None:
+    introspect(Base)
+    introspect(Child)
+    introspect(int)
+    invalidate_introspection(Base)
+    assert introspection_cache_info().currsize == 1
+
+    Base.added = 5  # type: ignore[attr-defined]
+    try:
+        assert "added" in iter_fields(Child)
+    finally:
+        del Base.added  # type: ignore[attr-defined]
+        invalidate_introspection(Base)
+
+
+def test_hints_are_resolved_once() -> None:
+    record = introspect(Child)
+    assert record.hints is record.hints
+    assert record.hints["base_value"] is int
+
+
+# Functional syntax: with postponed evaluation the class syntax would not see Required.
+Shape = TypedDict("Shape", {"id": Required[int], "name": str}, total=False)
+
+
+def test_validate_typeddict_batch_reports_every_failing_row() -> None:
+    rows = [{"id": 1}, {"name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "extra": 0}, {"name": "c"}]
+    report = validate_typeddict_batch(Shape, rows)  # type: ignore[arg-type]
+    assert report.total == 5 and not report.ok
+    assert report.invalid_indices == {1, 3, 4}
+    assert report.errors[1] == RowKeyError(3, frozenset(), frozenset({"extra"}))
+    assert validate_typeddict_batch(Shape, rows[:1]).ok  # type: ignore[arg-type]
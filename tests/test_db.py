@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from grimoire.base import SQL
+from grimoire.db import (
+    ConnectionPool,
+    PoolClosedError,
+    delete_by_keys,
+    fetch_by_keys,
+    group_by_shape,
+    ignore_many,
+    insert_many,
+    iter_write_chunks,
+    record_items,
+    replace_many,
+    transaction,
+    variable_limit,
+)
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class Item:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+
+
+@pytest.fixture
+def conn() -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield conn
+    conn.close()
+
+
+def rows(conn: sqlite3.Connection) -> list[tuple[int, str | None]]:
+    return conn.execute("SELECT id, name FROM items ORDER BY id").fetchall()
+
+
+def test_record_items_skips_unset_fields() -> None:
+    assert record_items(Item(id=1)) == {"id": 1}
+    assert record_items({"id": 2, "name": "b"}) == {"id": 2, "name": "b"}
+
+
+def test_group_by_shape() -> None:
+    groups = group_by_shape([Item(id=1, name="a"), Item(id=2), {"id": 3, "name": "c"}])
+    assert groups == {("id", "name"): [(1, "a"), (3, "c")], ("id",): [(2,)]}
+
+
+def test_insert_many_accepts_generators(conn: sqlite3.Connection) -> None:
+    records = (Item(id=i, name=str(i)) if i % 2 else Item(id=i) for i in range(5))
+    assert insert_many(conn, "items", records, chunk_size=2) == 5
+    assert rows(conn) == [(0, None), (1, "1"), (2, None), (3, "3"), (4, None)]
+
+
+def test_replace_and_ignore(conn: sqlite3.Connection) -> None:
+    insert_many(conn, "items", [Item(id=1, name="a")])
+    assert ignore_many(conn, "items", [Item(id=1, name="b"), Item(id=2, name="c")]) == 1
+    assert replace_many(conn, "items", [Item(id=1, name="d")]) == 1
+    assert rows(conn) == [(1, "d"), (2, "c")]
+
+
+def test_failing_chunk_rolls_back_alone(conn: sqlite3.Connection) -> None:
+    records = [Item(id=1), Item(id=2), Item(id=3), Item(id=1)]
+    chunks = iter_write_chunks(conn, SQL.INSERT_INTO, "items", records, chunk_size=2)
+    assert next(chunks) == 2
+    with pytest.raises(sqlite3.IntegrityError):
+        next(chunks)
+    assert not conn.in_transaction
+    assert [row[0] for row in rows(conn)] == [1, 2]
+
+
+def test_transaction_joins_an_open_one(conn: sqlite3.Connection) -> None:
+    conn.execute("BEGIN")
+    with transaction(conn):
+        conn.execute("INSERT INTO items (id) VALUES (1)")
+    assert conn.in_transaction
+    conn.execute("ROLLBACK")
+    assert rows(conn) == []
+
+
+def test_transaction_rolls_back_a_failed_commit(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(
+        "CREATE TABLE children (id INTEGER PRIMARY KEY, item INTEGER "
+        "REFERENCES items (id) DEFERRABLE INITIALLY DEFERRED)"
+    )
+    with pytest.raises(sqlite3.IntegrityError), transaction(conn):
+        conn.execute("INSERT INTO items (id) VALUES (1)")
+        conn.execute("INSERT INTO children (id, item) VALUES (1, 2)")
+    assert not conn.in_transaction
+    assert rows(conn) == []
+
+
+def test_writers_reject_bad_arguments(conn: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError, match="not an insert verb"):
+        next(iter_write_chunks(conn, SQL.DELETE_FROM_WHERE, "items", []))
+    with pytest.raises(ValueError, match="chunk_size"):
+        insert_many(conn, "items", [], chunk_size=0)
+
+
+def test_key_set_reads_follow_the_connection_limit(conn: sqlite3.Connection) -> None:
+    insert_many(conn, "items", [Item(id=i, name=str(i)) for i in range(10)])
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 4)
+    assert variable_limit(conn) == 4
+    fetched = fetch_by_keys(conn, "items", ("id",), range(2, 9))
+    assert sorted(row[0] for row in fetched) == list(range(2, 9))
+    assert delete_by_keys(conn, "items", ("id",), [0, 1, 2, 3, 4, 42]) == 5
+    assert [row[0] for row in rows(conn)] == [5, 6, 7, 8, 9]
+
+
+def test_pool_prefers_the_threads_last_connection(tmp_path: Path) -> None:
+    with ConnectionPool(tmp_path / "pool.db", size=2) as pool:
+        mine = pool.acquire()
+        acquired, released = threading.Event(), threading.Event()
+        theirs: list[sqlite3.Connection] = []
+
+        def worker() -> None:
+            theirs.append(pool.acquire())
+            acquired.set()
+            released.wait()
+            pool.release(theirs[0])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        acquired.wait()
+        pool.release(mine)
+        released.set()
+        thread.join()
+        # The worker's connection was released last, yet this thread gets its own back.
+        assert pool.acquire() is mine
+        assert theirs[0] is not mine
+        assert mine.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_pool_nested_blocks_share_a_connection(tmp_path: Path) -> None:
+    with ConnectionPool(tmp_path / "pool.db", size=1, timeout=0.01) as pool:
+        with pool.connection() as outer, pool.connection() as inner:
+            assert inner is outer
+        with pool.connection():
+            pass
+
+
+def test_pool_times_out_when_exhausted(tmp_path: Path) -> None:
+    with ConnectionPool(tmp_path / "pool.db", size=1, timeout=0.01) as pool:
+        held = pool.acquire()
+        errors: list[BaseException] = []
+
+        def acquire() -> None:
+            try:
+                pool.acquire()
+            except TimeoutError as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        assert len(errors) == 1
+        pool.release(held)
+
+
+def test_pool_rolls_back_on_release_and_refuses_after_close(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "pool.db", size=1)
+    conn = pool.acquire()
+    conn.execute("CREATE TABLE t (x)")
+    conn.execute("BEGIN")
+    conn.execute("INSERT INTO t VALUES (1)")
+    pool.release(conn)
+    assert not conn.in_transaction
+    pool.close()
+    with pytest.raises(PoolClosedError):
+        pool.acquire()
+    with pytest.raises(ValueError, match="size"):
+        ConnectionPool(tmp_path / "pool.db", size=0)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from typing import ReadOnly
+
+import pytest
+
+from grimoire.schematic.hydrate import (
+    compile_hydrator,
+    fetch_hydrated,
+    iter_hydrated,
+    row_factory,
+)
+from grimoire.schematic.schematic import dirty_fields, fieldnode, schematic
+
+
+@schematic
+class Plain:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="unnamed")
+
+
+@schematic(slots=True)
+class Slotted:
+    id: int = fieldnode(primary_key=True)
+    name: ReadOnly[str] = fieldnode()
+
+
+@schematic(tracked=True)
+class Tracked:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+
+
+@pytest.fixture
+def conn() -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, extra TEXT)")
+    conn.executemany("INSERT INTO items VALUES (?, ?, 'x')", [(i, str(i)) for i in range(5)])
+    yield conn
+    conn.close()
+
+
+def test_hydrators_skip_init_and_unknown_columns() -> None:
+    hydrate = compile_hydrator(Plain, ("extra", "id"))
+    assert compile_hydrator(Plain, ["extra", "id"]) is hydrate
+    record = hydrate(("ignored", 7))
+    assert vars(record) == {"id": 7}
+
+
+@pytest.mark.parametrize("cls", [Plain, Slotted, Tracked])
+def test_every_layout_hydrates(cls: type, conn: sqlite3.Connection) -> None:
+    cursor = conn.execute("SELECT * FROM items ORDER BY id")
+    records = fetch_hydrated(cls, cursor)  # type: ignore[arg-type]
+    assert [(r.id, r.name) for r in records] == [(i, str(i)) for i in range(5)]
+    assert all(type(r) is cls for r in records)
+
+
+def test_tracked_instances_start_clean(conn: sqlite3.Connection) -> None:
+    cursor = conn.execute("SELECT id, name FROM items LIMIT 1")
+    (record,) = fetch_hydrated(Tracked, cursor)  # type: ignore[arg-type]
+    assert dirty_fields(record) == frozenset()
+    record.name = "changed"
+    assert dirty_fields(record) == {"name"}
+
+
+def test_iter_hydrated_streams(conn: sqlite3.Connection) -> None:
+    cursor = conn.execute("SELECT id FROM items ORDER BY id")
+    stream = iter_hydrated(Plain, cursor, size=2)  # type: ignore[arg-type]
+    assert next(stream).id == 0
+    assert [record.id for record in stream] == [1, 2, 3, 4]
+
+
+def test_row_factory(conn: sqlite3.Connection) -> None:
+    conn.row_factory = row_factory(Plain)  # type: ignore[arg-type]
+    assert conn.execute("SELECT id FROM items WHERE id = 1").fetchone().id == 1
+    record = conn.execute("SELECT name, id FROM items WHERE id = 2").fetchone()
+    assert (record.id, record.name) == (2, "2")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import gc
+from pathlib import Path
+
+import pytest
+
+from grimoire.db import ConnectionPool
+from grimoire.identity import IdentityMap, IdentityMapInfo, identity_key
+from grimoire.repository import Repository
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class Item:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+
+
+@schematic(slots=True)
+class Slotted:
+    id: int = fieldnode(primary_key=True)
+
+
+def test_lru_eviction_and_counters() -> None:
+    identity = IdentityMap(2)
+    first, second, third = Item(id=1), Item(id=2), Item(id=3)
+    identity.add(first)
+    identity.add(second)
+    assert identity.get(Item, 1) is first
+    identity.add(third)
+    assert (Item, 2) not in identity
+    assert identity.get(Item, 2) is None
+    assert identity_key(first) in identity and len(identity) == 2
+    assert identity.cache_info() == IdentityMapInfo(1, 1, 1, 2, 2)
+    identity.reset_cache_info()
+    assert identity.cache_info().hits == 0
+
+
+def test_setdefault_keeps_the_live_instance() -> None:
+    identity = IdentityMap()
+    live = Item(id=1, name="live")
+    assert identity.setdefault(live) is live
+    assert identity.setdefault(Item(id=1, name="stale")) is live
+    identity.add(replacement := Item(id=1))
+    assert identity.get(Item, 1) is replacement
+    identity.discard(Item, 1)
+    assert identity.get(Item, 1) is None
+
+
+def test_weak_map_keeps_evicted_instances_while_alive() -> None:
+    identity = IdentityMap(1, weak=True)
+    held = Item(id=1)
+    identity.add(held)
+    identity.add(Item(id=2))
+    identity.add(Item(id=3))
+    gc.collect()
+    assert identity.get(Item, 1) is held
+    assert identity.get(Item, 2) is None
+
+    identity.add(Slotted(id=1))
+    identity.add(Item(id=4))
+    assert identity.get(Slotted, 1) is None
+    with pytest.raises(ValueError, match="maxsize"):
+        IdentityMap(-1)
+
+
+def test_repository_loads_share_instances(tmp_path: Path) -> None:
+    with ConnectionPool(tmp_path / "items.db") as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE Item (id INTEGER PRIMARY KEY, name TEXT)")
+        repository = Repository(Item, pool, identity_map=IdentityMap())
+        item = Item(id=1, name="a")
+        repository.put(item)
+        repository.put_many([Item(id=2, name="b")])
+        assert repository.get(1) is item
+        assert repository.get_many([1, 2])[0] is item
+        assert next(repository.iter_all()) is item
+        repository.delete(1)
+        assert repository.get(1) is None
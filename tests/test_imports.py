@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import grimoire
+
+PROBE = "import sys, {module}; print(' '.join(m for m in sys.modules if m.startswith('grimoire')))"
+
+
+def modules_loaded_by(module: str) -> set[str]:
+    """Import module in a fresh interpreter and return the grimoire modules it loaded.
+
+    Import time is measured by benchmarks/bench_import_time.py instead.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    ("module", "loaded"),
+    [
+        ("grimoire", {"grimoire"}),
+        ("grimoire.text", {"grimoire", "grimoire.text"}),
+        ("grimoire.data", {"grimoire", "grimoire.data"}),
+        ("grimoire.base", {"grimoire", "grimoire.base"}),
+    ],
+)
+def test_imports_load_only_what_they_need(module: str, loaded: set[str]) -> None:
+    assert modules_loaded_by(module) == loaded
+
+
+def test_lazy_exports_resolve() -> None:
+    from grimoire.schematic.schematic import FieldNode, TypeNode
+
+    assert grimoire.FieldNode is FieldNode
+    assert grimoire.TypeNode is TypeNode
+    assert all(hasattr(grimoire, name) for name in grimoire.__all__)
+    assert {"FieldNode", "text", "writer"} <= set(dir(grimoire))
+    with pytest.raises(AttributeError, match="nothing"):
+        _ = grimoire.nothing  # type: ignore[attr-defined]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from grimoire.schematic.metacache import (
+    MetadataCache,
+    MetadataCacheInfo,
+    SchematicMetadata,
+    disable_metadata_cache,
+    enable_metadata_cache,
+)
+from grimoire.schematic.schematic import fieldnode, schematic
+
+SOURCE = """
+from typing import NotRequired, ReadOnly, Required
+
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class Cached:
+    id: Required[int] = fieldnode(primary_key=True)
+    code: ReadOnly[str] = fieldnode(default="x")
+    note: NotRequired[str | None] = fieldnode(default_factory=lambda: None)
+"""
+
+MODULE = "grimoire_metacache_sample"
+
+
+@pytest.fixture(autouse=True)
+def no_cache() -> Iterator[None]:
+    yield
+    disable_metadata_cache()
+    sys.modules.pop(MODULE, None)
+
+
+def load(path: Path) -> ModuleType:
+    sys.modules.pop(MODULE, None)
+    spec = importlib.util.spec_from_file_location(MODULE, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[MODULE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def bare_metadata() -> SchematicMetadata:
+    return SchematicMetadata(
+        fields=("id",),
+        flags=(0,),
+        total=False,
+        primary_key="id",
+        defaults=frozenset(),
+        default_factories=frozenset(),
+        required=frozenset(),
+        optional=frozenset(),
+        readonly=frozenset(),
+    )
+
+
+def keys(module: ModuleType) -> tuple[frozenset[str], ...]:
+    cls = module.Cached
+    return (cls.required_keys, cls.optional_keys, cls.readonly_keys)
+
+
+def test_miss_then_hit(tmp_path: Path) -> None:
+    path = tmp_path / f"{MODULE}.py"
+    path.write_text(SOURCE)
+    directory = tmp_path / "cache"
+
+    cache = enable_metadata_cache(directory)
+    expected = keys(load(path))
+    assert cache.cache_info() == MetadataCacheInfo(0, 1, 1)
+    cache.flush()
+    (written,) = directory.iterdir()
+    assert "Cached" in json.loads(written.read_text())["classes"]
+
+    cache = enable_metadata_cache(directory)
+    assert keys(load(path)) == expected
+    assert cache.cache_info().hits == 1
+    assert (expected[0], expected[2]) == ({"id"}, {"code"})
+
+
+def test_editing_the_source_invalidates(tmp_path: Path) -> None:
+    path = tmp_path / f"{MODULE}.py"
+    path.write_text(SOURCE)
+    directory = tmp_path / "cache"
+    enable_metadata_cache(directory)
+    load(path)
+    disable_metadata_cache()
+
+    path.write_text(SOURCE + "\nVERSION = 2\n")
+    cache = enable_metadata_cache(directory)
+    load(path)
+    assert cache.cache_info() == MetadataCacheInfo(0, 1, 1)
+    cache.flush()
+    assert len(list(directory.iterdir())) == 2
+
+
+def test_stale_entries_are_ignored(tmp_path: Path) -> None:
+    path = tmp_path / f"{MODULE}.py"
+    path.write_text(SOURCE)
+    cache = enable_metadata_cache(tmp_path / "cache")
+    module = load(path)
+    # Recorded for a different field list, so it must not be applied.
+    cache.put(module.Cached, bare_metadata())
+    assert keys(load(path))[0] == frozenset({"id"})
+
+
+def test_classes_without_a_source_file_are_not_cached(tmp_path: Path) -> None:
+    cache = MetadataCache(tmp_path)
+
+    @schematic
+    class Local:
+        id: int = fieldnode(primary_key=True)
+
+    Local.__module__ = "__no_such_module__"
+    assert cache.get(Local) is None
+    cache.put(Local, bare_metadata())
+    cache.flush()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from grimoire.db import ConnectionPool, transaction
+from grimoire.identity import IdentityMap
+from grimoire.repository import Repository
+from grimoire.schematic.schematic import fieldnode, schematic
+
+
+@schematic
+class Item:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+    score: float = fieldnode(default=0.0)
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> Iterator[ConnectionPool]:
+    with ConnectionPool(tmp_path / "items.db", size=2) as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE Item (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+        yield pool
+
+
+@pytest.fixture
+def repository(pool: ConnectionPool) -> Repository[Item]:
+    return Repository(Item, pool)
+
+
+def test_put_and_get(repository: Repository[Item]) -> None:
+    repository.put(Item(id=1, name="a", score=1.5))
+    item = repository.get(1)
+    assert item is not None
+    assert (item.id, item.name, item.score) == (1, "a", 1.5)
+    assert repository.get(2) is None
+
+
+def test_put_many_and_key_set_reads(repository: Repository[Item]) -> None:
+    assert repository.put_many((Item(id=i, name=str(i)) for i in range(5)), chunk_size=2) == 5
+    assert sorted(item.id for item in repository.get_many([0, 2, 4, 9])) == [0, 2, 4]
+    assert [item.id for item in repository.iter_all(size=2)] == [0, 1, 2, 3, 4]
+
+
+def test_iter_all_releases_its_connection_between_pages(tmp_path: Path) -> None:
+    with ConnectionPool(tmp_path / "items.db", size=1, timeout=0.05) as pool:
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE Item (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+        repository = Repository(Item, pool)
+        repository.put_many([Item(id=i, name=str(i)) for i in (4, 0, 2)])
+        items = repository.iter_all(size=2)
+        assert next(items).id == 0
+        conn = pool.acquire()  # would time out while the iterator held the only connection
+        with transaction(conn):
+            conn.execute("INSERT INTO Item (id, name) VALUES (3, '3'), (1, '1')")
+        pool.release(conn)
+        assert [item.id for item in items] == [2, 3, 4]
+
+
+def test_delete(repository: Repository[Item]) -> None:
+    repository.put_many([Item(id=i, name=str(i)) for i in range(4)])
+    assert repository.delete(0)
+    assert not repository.delete(0)
+    assert repository.delete_many([1, 2, 7]) == 2
+    assert [item.id for item in repository.iter_all()] == [3]
+
+
+def test_failed_write_leaves_no_open_transaction(
+    repository: Repository[Item], pool: ConnectionPool
+) -> None:
+    with pool.connection() as conn:
+        conn.execute(
+            "CREATE TRIGGER no_b BEFORE INSERT ON Item WHEN NEW.name = 'b' "
+            "BEGIN SELECT RAISE(ABORT, 'no b'); END"
+        )
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.put(Item(id=1, name="b"))
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+    assert repository.get(1) is None
+
+
+def record_column_loads(
+    repository: Repository[Any], monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    loads: list[str] = []
+    load_column = repository.load_column
+
+    def counting(keys: Iterable[Any], name: str) -> dict[Any, Any]:
+        loads.append(name)
+        return load_column(keys, name)
+
+    monkeypatch.setattr(repository, "load_column", counting)
+    return loads
+
+
+def test_proxies_load_one_column_for_the_whole_group(
+    repository: Repository[Item], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository.put_many([Item(id=i, name=str(i), score=float(i)) for i in range(3)])
+    loads = record_column_loads(repository, monkeypatch)
+    proxies = repository.proxies([0, 1, 2, 9])
+    assert [vars(proxy).get("name") for proxy in proxies] == [None] * 4
+    assert proxies[1].name == "1"
+    assert [proxy.name for proxy in proxies[:3]] == ["0", "1", "2"]
+    assert proxies[2].score == 2.0
+    assert loads == ["name", "score"]
+
+    with pytest.raises(AttributeError, match="name"):
+        _ = proxies[3].name
+
+
+def test_slotted_schematics_cannot_be_proxied(pool: ConnectionPool) -> None:
+    @schematic(slots=True)
+    class Compact:
+        id: int = fieldnode(primary_key=True)
+
+    with pytest.raises(TypeError, match="slots"):
+        Repository(Compact, pool, table="Item").proxies([1])
+
+
+@schematic(tracked=True)
+class TrackedItem:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode()
+    score: float = fieldnode(default=0.0)
+
+
+def test_save_writes_only_dirty_fields(
+    pool: ConnectionPool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository = Repository(TrackedItem, pool, table="Item")
+    repository.put(TrackedItem(id=1, name="a", score=1.0))
+    item = repository.get(1)
+    assert item is not None
+    assert not repository.save(item)
+    item.score = 2.0
+    with pool.connection() as conn, transaction(conn):
+        conn.execute("UPDATE Item SET name = 'elsewhere'")
+    assert repository.save(item)
+    assert not repository.save(item)
+    stored = Repository(Item, pool).get(1)
+    assert stored is not None and (stored.name, stored.score) == ("elsewhere", 2.0)
+
+    loads = record_column_loads(repository, monkeypatch)
+    proxy = repository.proxy(1)
+    proxy.name = "b"
+    assert repository.save(proxy)
+    assert loads == []
+    assert proxy.score == 2.0 and loads == ["score"]
+
+
+def test_save_rejects_a_reassigned_primary_key(pool: ConnectionPool) -> None:
+    identity_map = IdentityMap()
+    repository = Repository(TrackedItem, pool, table="Item", identity_map=identity_map)
+    repository.put(TrackedItem(id=1, name="a"))
+    item = repository.get(1)
+    assert item is not None
+    item.id = 2
+    with pytest.raises(ValueError, match="primary key 'id'"):
+        repository.save(item)
+    with pool.connection() as conn:
+        assert list(conn.execute("SELECT id, name FROM Item")) == [(1, "a")]
+    assert (TrackedItem, 2) not in identity_map
+
+
+def test_get_many_follows_the_requested_order(repository: Repository[Item]) -> None:
+    repository.identity_map = IdentityMap()
+    repository.put_many([Item(id=i, name=str(i)) for i in range(5)])
+    repository.identity_map.clear()
+    assert repository.get(3) is not None and repository.get(1) is not None
+    assert [item.id for item in repository.get_many([4, 1, 9, 0, 3])] == [4, 1, 0, 3]
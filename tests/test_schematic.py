@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import ForwardRef, ReadOnly, Required
+
+import pytest
+
+from grimoire.schematic.schematic import (
+    TYPENODE_CACHE_SIZE,
+    TypeNode,
+    fieldnode,
+    schematic,
+    typenode_cache_info,
+)
+
+
+@schematic
+class Item:
+    id: int = fieldnode(primary_key=True)
+    name: str = fieldnode(default="unnamed")
+    tags: list[str] = fieldnode(default_factory=list)
+    note: str = fieldnode()
+
+
+@schematic(total=True)
+class Strict:
+    id: int = fieldnode(primary_key=True)
+    label: str = fieldnode()
+
+
+@schematic(closed=False)
+class Open:
+    id: int = fieldnode(primary_key=True)
+
+
+@schematic
+class SelfNamed:
+    id: int = fieldnode(primary_key=True)
+    self: str = fieldnode(default="me")
+
+
+@schematic
+class Flagged:
+    id: Required[int] = fieldnode(primary_key=True)
+    code: str = fieldnode()
+
+
+def test_generated_init_is_specialised() -> None:
+    assert Item.__init__.__qualname__ == "Item.__init__"
+    assert Item.__init__.__module__ == __name__
+
+
+def test_defaults_and_factories() -> None:
+    first, second = Item(id=1), Item(id=2)
+    assert first.name == "unnamed"
+    assert first.tags == [] and first.tags is not second.tags
+    assert Item(id=3, tags=["a"]).tags == ["a"]
+
+
+def test_unset_optional_field_raises_attribute_error() -> None:
+    item = Item(id=1)
+    assert "note" not in vars(item)
+    with pytest.raises(AttributeError, match="note"):
+        _ = item.note
+
+
+def test_keyword_only() -> None:
+    with pytest.raises(TypeError):
+        Item(1)  # type: ignore[misc]
+
+
+def test_total_requires_every_field() -> None:
+    assert Strict(id=1, label="x").label == "x"
+    with pytest.raises(ValueError, match="Strict"):
+        Strict(id=1)  # type: ignore[call-arg]
+
+
+def test_required_qualifier() -> None:
+    assert Flagged.required_keys == {"id"}
+    with pytest.raises(ValueError):
+        Flagged(code="x")  # type: ignore[call-arg]
+
+
+def test_closed_rejects_extra_keywords() -> None:
+    with pytest.raises(ValueError):
+        Item(id=1, unknown=2)  # type: ignore[call-arg]
+
+
+def test_open_keeps_extra_keywords() -> None:
+    record = Open(id=1, extra=2)  # type: ignore[call-arg]
+    assert vars(record) == {"id": 1, "extra": 2}
+
+
+def test_field_named_self() -> None:
+    assert SelfNamed(id=1).self == "me"
+    assert SelfNamed(id=1, self="you").self == "you"
+
+
+@schematic(slots=True)
+class Slotted:
+    id: int = fieldnode(primary_key=True)
+    code: ReadOnly[str] = fieldnode(default="x")
+    score: float = fieldnode(default=0.0)
+    note: str = fieldnode()
+
+
+def test_slots_layout() -> None:
+    record = Slotted(id=1, code="a")
+    assert Slotted.__slots__ == ("id", "code", "score", "note")
+    assert not hasattr(record, "__dict__")
+    assert (record.id, record.code, record.score) == (1, "a", 0.0)
+    with pytest.raises(AttributeError):
+        _ = record.note
+
+
+def test_slots_readonly_guards() -> None:
+    record = Slotted(id=1)
+    assert Slotted.readonly_keys == {"code"}
+    record.score = 2.5
+    with pytest.raises(AttributeError, match="readonly"):
+        record.code = "b"  # type: ignore[misc]
+    with pytest.raises(AttributeError, match="readonly"):
+        del record.code
+    assert record.code == "x"
+
+
+def test_slots_require_closed() -> None:
+    with pytest.raises(ValueError, match="closed"):
+
+        @schematic(slots=True, closed=False)
+        class Broken:
+            id: int = fieldnode(primary_key=True)
+
+
+def test_typenodes_are_interned_in_a_bounded_cache() -> None:
+    assert TypeNode(list[int]) is TypeNode(list[int])
+    assert typenode_cache_info().maxsize == TYPENODE_CACHE_SIZE
+    assert TypeNode(ForwardRef("Later")) is not TypeNode(ForwardRef("Later"))
+    assert TypeNode(int | None).is_optional
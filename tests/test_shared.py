@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+
+from grimoire.concurrency import JobExecutor
+from grimoire.schematic.schematic import fieldnode, schematic
+from grimoire.schematic.shared import SharedBatch, SharedRecords, attach
+
+
+@schematic
+class Sample:
+    id: int = fieldnode(primary_key=True)
+    value: float = fieldnode()
+    label: str | None = fieldnode(default=None)
+    extra: object = fieldnode(default=None)
+
+
+def samples(count: int) -> list[Sample]:
+    return [Sample(id=i, value=i * 0.5, label=f"s{i}") for i in range(count)]
+
+
+def total_value(records: SharedRecords, offset: float = 0.0) -> float:
+    return sum(records.column("value")) + offset
+
+
+def test_attach_and_read_in_place() -> None:
+    records = [*samples(3), Sample(id=3)]
+    with SharedBatch(Sample, records) as batch, attach(batch.handle) as shared:
+        assert len(shared) == len(batch) == 4
+        assert [s.id for s in shared] == [0, 1, 2, 3]
+        assert (shared[-2].label, shared[1:3][0].value) == ("s2", 0.5)
+        assert shared.field(2, "label") == "s2"
+        assert list(shared.column("value", default=-1.0)) == [0.0, 0.5, 1.0, -1.0]
+        assert list(shared.column("label")) == ["s0", "s1", "s2", None]
+        with pytest.raises(AttributeError, match="value"):
+            shared.field(3, "value")
+        with pytest.raises(IndexError):
+            shared[4]
+
+
+def test_partitions_cover_every_record() -> None:
+    with SharedBatch(Sample, samples(10)) as batch:
+        parts = batch.handle.partition(3)
+        assert [part.bounds for part in parts] == [(0, 4), (4, 7), (7, 10)]
+        with attach(parts[1]) as shared:
+            assert [s.id for s in shared] == [4, 5, 6]
+            assert shared.field(0, "id") == 4
+        assert len(batch.handle.partition(50)) == 10
+
+
+def test_pickled_values_need_the_handle_flag() -> None:
+    odd = [Sample(id=1, value=1.0, extra=Decimal("2"))]
+    with pytest.raises(TypeError, match="allow_pickle"):
+        SharedBatch(Sample, odd)
+    with SharedBatch(Sample, odd, allow_pickle=True) as batch, attach(batch.handle) as shared:
+        assert shared[0].extra == Decimal("2")
+        assert shared.field(0, "extra") == Decimal("2")
+
+
+async def test_map_shared_runs_on_worker_processes() -> None:
+    async with JobExecutor(process_workers=2) as executor:
+        totals = await executor.map_shared(total_value, Sample, samples(8), partitions=2)
+        assert totals == [3.0, 11.0]
+        assert await executor.map_shared(total_value, Sample, [], 1.0) == []
+
+
+def test_records_are_encoded_straight_into_the_segment() -> None:
+    records = [Sample(id=i, value=0.0, label="x" * 65536) for i in range(64)]
+    tracemalloc.start()
+    try:
+        with SharedBatch(Sample, iter(records)) as batch, attach(batch.handle) as shared:
+            peak = tracemalloc.get_traced_memory()[1]
+            assert shared.field(63, "label") == "x" * 65536
+    finally:
+        tracemalloc.stop()
+    assert peak < len(records) * 65536 // 2
+
+
+class Republished(list[Sample]):
+    """Replaces its last record once it has been iterated over."""
+
+    def __iter__(self) -> Iterator[Sample]:
+        yield from super().__iter__()
+        self[-1] = Sample(id=len(self), value=0.0, label="longer")
+
+
+def test_records_must_not_change_while_published() -> None:
+    with pytest.raises(RuntimeError, match="record 1 changed"):
+        SharedBatch(Sample, Republished(samples(2)))
+
+
+def test_concurrency_does_not_import_shared_memory() -> None:
+    code = "import sys, grimoire.concurrency; print('grimoire.schematic.shared' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "False"
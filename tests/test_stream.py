@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from grimoire.schematic.schematic import fieldnode, schematic
+from grimoire.schematic.stream import iter_csv, iter_ndjson, write_csv, write_ndjson
+
+
+@schematic
+class Entry:
+    id: int = fieldnode(primary_key=True)
+    title: str = fieldnode(default="")
+    score: float | None = fieldnode(default=None)
+    active: bool = fieldnode(default=False)
+    tags: list[str] = fieldnode(default_factory=list)
+    note: str | None = fieldnode()
+
+
+ENTRIES = [
+    Entry(id=1, title='a, "quoted"\nline', score=1.5, active=True, tags=["x", "y"], note="n"),
+    Entry(id=2),
+    Entry(id=3, score=None, note=None),
+]
+
+
+def fields(entry: Entry) -> dict[str, object]:
+    return {name: getattr(entry, name, "<unset>") for name in Entry.__field_nodes__}
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_ndjson_round_trip(tmp_path: Path, use_mmap: bool) -> None:
+    path = tmp_path / "entries.ndjson"
+    assert write_ndjson(Entry, ENTRIES, path) == 3
+    loaded = list(iter_ndjson(Entry, path, chunk_size=2, use_mmap=use_mmap))
+    assert [fields(entry) for entry in loaded] == [fields(entry) for entry in ENTRIES]
+    assert "note" not in vars(loaded[1])
+
+
+def test_ndjson_file_objects_and_blank_lines() -> None:
+    buffer = io.StringIO()
+    write_ndjson(Entry, [{"id": 7, "tags": ("t",)}], buffer)
+    assert buffer.getvalue() == '{"id":7,"tags":["t"]}\n'
+    source = io.BytesIO(b'\n{"id": 8}\n\n')
+    assert [entry.id for entry in iter_ndjson(Entry, source)] == [8]
+    assert list(iter_ndjson(Entry, io.BytesIO(b""))) == []
+
+
+def test_csv_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "entries.csv"
+    assert write_csv(Entry, ENTRIES, path) == 3
+    loaded = list(iter_csv(Entry, path))
+    assert [fields(entry) for entry in loaded] == [
+        fields(ENTRIES[0]),
+        {**fields(ENTRIES[1]), "note": None},
+        fields(ENTRIES[2]),
+    ]
+
+
+def test_csv_keeps_empty_strings_apart_from_none() -> None:
+    buffer = io.StringIO()
+    write_csv(Entry, [Entry(id=1, note=""), Entry(id=2, note=None)], buffer)
+    assert buffer.getvalue().splitlines()[1:] == [
+        '"1","",,"False","[]",""',
+        '"2","",,"False","[]",',
+    ]
+    buffer.seek(0)
+    assert [entry.note for entry in iter_csv(Entry, buffer)] == ["", None]
+    legacy = io.StringIO('id,title,note\n1,,\n\n2,"",""\n')
+    assert [(e.title, e.note) for e in iter_csv(Entry, legacy)] == [("", None), ("", "")]
+
+
+def test_mismatched_rows_name_their_line(tmp_path: Path) -> None:
+    path = tmp_path / "bad.ndjson"
+    path.write_text('{"id": 1}\n\n{"id": 2, "extra": 0}\n')
+    with pytest.raises(ValueError, match=r"line 3 .*unexpected keys \['extra'\]"):
+        list(iter_ndjson(Entry, path))
+
+    csv_source = io.StringIO('id,extra\n1,\n2,"two\nlines"\n')
+    with pytest.raises(ValueError, match=r"line 4 .*unexpected keys \['extra'\]"):
+        list(iter_csv(Entry, csv_source))
+    with pytest.raises(ValueError, match="line 3 has 3 cells, expected 2"):
+        list(iter_csv(Entry, io.StringIO("id,note\n1,a\n2,b,c\n")))
+    with pytest.raises(ValueError, match="line 2 has 1 cells, expected 2"):
+        list(iter_csv(Entry, io.StringIO("id,note\n1\n")))
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(iter_ndjson(Entry, path, chunk_size=0))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, ForwardRef, Literal, ReadOnly
+
+import pytest
+
+from grimoire.schematic.schematic import fieldnode, schematic
+from grimoire.schematic.validation import (
+    CHECKER_CACHE_SIZE,
+    checker_cache_info,
+    compile_checker,
+    iter_value_errors,
+    schematic_checkers,
+    validate_values,
+)
+
+
+@pytest.mark.parametrize(
+    ("annotation", "good", "bad"),
+    [
+        (int, 1, "1"),
+        (float, 1, "1.0"),
+        (int | None, None, 1.5),
+        (Literal["a", 1], 1, True),
+        (list[int], [1, 2], [1, "2"]),
+        (dict[str, int], {"a": 1}, {1: 1}),
+        (tuple[int, str], (1, "a"), (1, 2)),
+        (tuple[int, ...], (1, 2, 3), (1, None)),
+        (type[Exception], ValueError, int),
+        (ReadOnly[str], "x", 1),
+        (int | str, "x", 1.0),
+    ],
+)
+def test_compiled_checkers(annotation: Any, good: Any, bad: Any) -> None:
+    check = compile_checker(annotation)
+    assert check(good)
+    assert not check(bad)
+
+
+type JSON = dict[str, JSON] | list[JSON] | str | int | float | bool | None
+type Tree = tuple[int, Forest]
+type Forest = list[Tree]
+
+
+def test_recursive_type_aliases() -> None:
+    check = compile_checker(JSON)
+    assert check({"a": [1, "x", {"b": None}]})
+    assert not check({"a": [1, {2: "x"}]})
+    assert not check([object()])
+    assert compile_checker(JSON) is check
+
+    tree = compile_checker(Tree)
+    assert tree((1, [(2, []), (3, [(4, [])])]))
+    assert not tree((1, [(2, [("3", [])])]))
+
+
+def test_unverifiable_annotations_accept_anything() -> None:
+    assert compile_checker(Any)(object())
+    assert compile_checker(ForwardRef("Later"))(object())
+
+
+def test_checkers_are_cached() -> None:
+    assert compile_checker(list[int]) is compile_checker(list[int])
+
+
+@schematic
+class Order:
+    id: int = fieldnode(primary_key=True)
+    quantity: int = fieldnode(default=1)
+    note: str | None = fieldnode(default=None)
+
+
+def test_schematic_value_errors() -> None:
+    assert schematic_checkers(Order) is schematic_checkers(Order)
+    assert list(iter_value_errors(Order, {"id": 1, "quantity": "2"})) == [("quantity", "2")]
+    assert list(iter_value_errors(Order, Order(id=1, note=None))) == []
+    with pytest.raises(TypeError, match="quantity"):
+        validate_values(Order, {"id": 1, "quantity": 1.5})
+    validate_values(Order, {"id": 1})
+
+
+def test_checker_cache_is_bounded() -> None:
+    assert checker_cache_info().maxsize == CHECKER_CACHE_SIZE
+    compile_checker(list[int])
+    assert checker_cache_info().currsize <= CHECKER_CACHE_SIZE
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from grimoire.schematic.schematic import fieldnode, schematic
+from grimoire.writer import AsyncWriter
+
+
+@schematic
+class Item:
+    id: int = fieldnode(primary_key=True)
+    parent: int = fieldnode()
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    path = tmp_path / "items.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE Parent (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            "CREATE TABLE Item (id INTEGER PRIMARY KEY, parent INTEGER "
+            "REFERENCES Parent (id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+        conn.execute("INSERT INTO Parent VALUES (1)")
+    conn.close()
+    return path
+
+
+def stored(database: Path) -> list[int]:
+    with sqlite3.connect(database) as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM Item ORDER BY id")]
+    conn.close()
+    return ids
+
+
+async def test_group_commit(database: Path) -> None:
+    async with AsyncWriter(database, max_group=4) as writer:
+        counts = await asyncio.gather(*(writer.insert("Item", Item(id=i)) for i in range(10)))
+        assert counts == [1] * 10
+        assert await writer.delete("Item", {"id": 0}) == 1
+    assert stored(database) == list(range(1, 10))
+    with pytest.raises(RuntimeError, match="closed"):
+        await writer.insert("Item", Item(id=11))
+
+
+async def test_only_failing_writes_error(database: Path) -> None:
+    async with AsyncWriter(database) as writer:
+        results = await asyncio.gather(
+            writer.insert("Item", Item(id=1, parent=1)),
+            writer.insert("Item", Item(id=1)),
+            writer.insert("Item", Item(id=2)),
+            return_exceptions=True,
+        )
+    assert results[0] == 1 and results[2] == 1
+    assert isinstance(results[1], sqlite3.IntegrityError)
+    assert stored(database) == [1, 2]
+
+
+async def test_failed_commit_is_rolled_back(database: Path) -> None:
+    async with AsyncWriter(database) as writer:
+        results = await asyncio.gather(
+            writer.insert("Item", Item(id=1, parent=1)),
+            writer.insert("Item", Item(id=2, parent=99)),
+            return_exceptions=True,
+        )
+        assert results[0] == 1
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert await writer.insert("Item", Item(id=3, parent=1)) == 1
+    assert stored(database) == [1, 3]
+
+
+async def test_thread_failure_fails_pending_writes(tmp_path: Path) -> None:
+    writer = AsyncWriter(tmp_path / "missing" / "items.db")
+    with pytest.raises(sqlite3.OperationalError):
+        await asyncio.wait_for(writer.insert("Item", Item(id=1)), timeout=5)
+    with pytest.raises(RuntimeError, match="closed"):
+        await writer.insert("Item", Item(id=2))
+    await writer.aclose()